@@ -0,0 +1,79 @@
+"""
+finger_search_benchmark module.
+
+Compares the insertions and the membership tests of a TreeSet with and
+without finger search (see :meth:`RedBlackTree.enable_finger_search`) on
+sorted, nearly sorted and random inputs, the membership tests following the
+insertion order. Run it with ``python -m benchmarks.finger_search_benchmark``.
+"""
+import json
+import random
+import sys
+import time
+from typing import *
+from benchmarks.tree_set_benchmark import generate
+from model.tree_set import TreeSet
+
+
+def run(sizes: Sequence[int] = (10000, 100000),
+        distributions: Sequence[str] = ("sorted", "nearly_sorted", "random"),
+        repeat: int = 3, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Inserts the same values into a TreeSet with and without finger search,
+    then looks them up in the same order, and measures the throughput of the
+    fastest of several runs.
+
+    :param sizes: the numbers of elements
+    :type sizes: Sequence[int]
+    :param distributions: the input distributions (see
+        :func:`benchmarks.tree_set_benchmark.generate`)
+    :type distributions: Sequence[str]
+    :param repeat: the number of runs of every case
+    :type repeat: int
+    :param seed: the seed of the generated values
+    :type seed: int
+    :return: a result per size, distribution, mode and operation
+    :rtype: List[Dict[str, Any]]
+    """
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            values = generate(distribution, size, random.Random(seed))
+
+            for finger in (False, True):
+                timings = {"add": float("inf"), "contains": float("inf")}
+                for _ in range(repeat):
+                    tree = TreeSet(int)
+                    if finger:
+                        tree.enable_finger_search()
+
+                    start = time.perf_counter()
+                    for value in values:
+                        tree.add(value)
+                    timings["add"] = min(timings["add"],
+                                         time.perf_counter() - start)
+
+                    start = time.perf_counter()
+                    for value in values:
+                        value in tree
+                    timings["contains"] = min(timings["contains"],
+                                              time.perf_counter() - start)
+
+                for operation, seconds in timings.items():
+                    results.append({
+                        "distribution": distribution,
+                        "size": size,
+                        "finger_search": finger,
+                        "operation": operation,
+                        "operations": size,
+                        "seconds": seconds,
+                        "ops_per_second": size / seconds if seconds
+                        else None,
+                    })
+
+    return results
+
+
+if __name__ == "__main__":
+    json.dump(run(), sys.stdout, indent=2)
+    print()
@@ -0,0 +1,69 @@
+"""
+lsm_benchmark module.
+
+Compares the insertion throughput of an LSMTreeSet, whose writes are blind
+memtable updates, with the one of an in-memory TreeSet on shuffled numbers.
+The LSMTreeSet time includes its flushes and closing it, which waits for the
+background compaction. Run it with ``python -m benchmarks.lsm_benchmark``.
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from typing import *
+from model.storage.lsm_tree_set import LSMTreeSet
+from model.tree_set import TreeSet
+
+
+def run(sizes: Sequence[int] = (200000,), repeat: int = 3,
+        seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Inserts the same shuffled numbers into a new TreeSet and a new
+    LSMTreeSet, and measures the throughput of the fastest of several runs.
+
+    :param sizes: the numbers of insertions
+    :type sizes: Sequence[int]
+    :param repeat: the number of runs of every case
+    :type repeat: int
+    :param seed: the seed of the shuffled numbers
+    :type seed: int
+    :return: a result per size and structure
+    :rtype: List[Dict[str, Any]]
+    """
+    results = []
+    for size in sizes:
+        values = list(range(size))
+        random.Random(seed).shuffle(values)
+
+        timings = {"tree_set": float("inf"), "lsm_tree_set": float("inf")}
+        for _ in range(repeat):
+            tree = TreeSet(int)
+            start = time.perf_counter()
+            for value in values:
+                tree.add(value)
+            timings["tree_set"] = min(timings["tree_set"],
+                                      time.perf_counter() - start)
+
+            with tempfile.TemporaryDirectory() as directory:
+                start = time.perf_counter()
+                with LSMTreeSet(directory, int) as lsm:
+                    for value in values:
+                        lsm.add(value)
+                timings["lsm_tree_set"] = min(timings["lsm_tree_set"],
+                                              time.perf_counter() - start)
+
+        for structure, seconds in timings.items():
+            results.append({
+                "structure": structure,
+                "operations": size,
+                "seconds": seconds,
+                "ops_per_second": size / seconds if seconds else None,
+            })
+
+    return results
+
+
+if __name__ == "__main__":
+    json.dump(run(), sys.stdout, indent=2)
+    print()
@@ -0,0 +1,252 @@
+"""
+regression module.
+
+Performance regression gate of the TreeSet. A fixed, seeded workload is run
+against every backend, recording for each operation its throughput and the
+number of comparisons it performs per call, and the results are compared with
+the committed baseline (``benchmarks/baseline.json``). Run it with
+``python main.py perf`` (``python main.py perf --help`` lists the options).
+
+Throughput depends on the machine, so it is only indicative on noisy hosts,
+while comparison counts only change when the algorithms do, which makes them
+a deterministic regression signal.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import *
+from model.tree_set import TreeSet
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "baseline.json")
+SIZE = 20000
+SEED = 20240229
+OPERATIONS = ("add", "contains", "higher", "floor", "iteration", "remove")
+THRESHOLD = 0.10
+THROUGHPUT_THRESHOLD = 0.50
+
+
+class CountingInt(int):
+    """
+    Integer counting every rich comparison it takes part in, so the
+    comparisons made by a TreeSet can be measured.
+    """
+
+    comparisons = 0
+
+    def __eq__(self, other: Any) -> bool:
+        CountingInt.comparisons += 1
+        return int.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        CountingInt.comparisons += 1
+        return int.__ne__(self, other)
+
+    def __lt__(self, other: Any) -> bool:
+        CountingInt.comparisons += 1
+        return int.__lt__(self, other)
+
+    def __le__(self, other: Any) -> bool:
+        CountingInt.comparisons += 1
+        return int.__le__(self, other)
+
+    def __gt__(self, other: Any) -> bool:
+        CountingInt.comparisons += 1
+        return int.__gt__(self, other)
+
+    def __ge__(self, other: Any) -> bool:
+        CountingInt.comparisons += 1
+        return int.__ge__(self, other)
+
+    __hash__ = int.__hash__
+
+
+def workload(size: int = SIZE, seed: int = SEED) \
+        -> Tuple[List[CountingInt], List[CountingInt]]:
+    """
+    Generates the values inserted by the workload and the values it queries.
+
+    :param size: the number of values
+    :type size: int
+    :param seed: the seed of the random generator
+    :type seed: int
+    :return: the values, in insertion order, and the queries
+    :rtype: Tuple[List[CountingInt], List[CountingInt]]
+    """
+    rng = random.Random(seed)
+    values = [CountingInt(value) for value in rng.sample(range(size * 4), size)]
+    queries = [CountingInt(rng.randrange(size * 4)) for _ in range(size)]
+    return values, queries
+
+
+def measure(backend: str, size: int = SIZE, seed: int = SEED) \
+        -> Dict[str, Dict[str, float]]:
+    """
+    Runs the workload against a TreeSet of the given backend.
+
+    :param backend: the TreeSet backend
+    :type backend: str
+    :param size: the number of values
+    :type size: int
+    :param seed: the seed of the random generator
+    :type seed: int
+    :return: the ``ops_per_second`` and ``comparisons_per_op`` of every
+        operation
+    :rtype: Dict[str, Dict[str, float]]
+    """
+    values, queries = workload(size, seed)
+    tree = TreeSet(CountingInt, backend=backend)
+    steps = {
+        "add": (values, tree.add),
+        "contains": (queries, tree.contains),
+        "higher": (queries, tree.higher),
+        "floor": (queries, tree.floor),
+        "iteration": (None, None),
+        "remove": (values, tree.remove),
+    }
+
+    metrics = {}
+    for operation in OPERATIONS:
+        arguments, method = steps[operation]
+        CountingInt.comparisons = 0
+        start = time.perf_counter()
+        if method is None:
+            for _ in tree:
+                pass
+            calls = size
+        else:
+            for argument in arguments:
+                method(argument)
+            calls = len(arguments)
+        seconds = time.perf_counter() - start
+        metrics[operation] = {
+            "ops_per_second": calls / seconds if seconds else float("inf"),
+            "comparisons_per_op": CountingInt.comparisons / calls,
+        }
+
+    return metrics
+
+
+def run(backends: Sequence[str] = TreeSet.BACKENDS, size: int = SIZE,
+        seed: int = SEED) -> Dict[str, Any]:
+    """
+    Runs the workload against every given backend.
+
+    :param backends: the TreeSet backends
+    :type backends: Sequence[str]
+    :param size: the number of values
+    :type size: int
+    :param seed: the seed of the random generator
+    :type seed: int
+    :return: the workload parameters and the metrics of every backend
+    :rtype: Dict[str, Any]
+    """
+    return {
+        "size": size,
+        "seed": seed,
+        "backends": {backend: measure(backend, size, seed)
+                     for backend in backends},
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = THRESHOLD,
+            throughput_threshold: float = THROUGHPUT_THRESHOLD) -> List[str]:
+    """
+    Compares the current metrics with the baseline ones. A comparison count
+    regresses when it grows more than ``threshold`` and a throughput when it
+    drops more than ``throughput_threshold`` (both relative to the baseline).
+
+    :param baseline: the baseline results
+    :type baseline: Dict[str, Any]
+    :param current: the current results
+    :type current: Dict[str, Any]
+    :param threshold: tolerated relative growth of the comparison counts
+    :type threshold: float
+    :param throughput_threshold: tolerated relative drop of the throughputs,
+        or None to ignore them
+    :type throughput_threshold: float
+    :return: a description of every regression, empty if there is none
+    :rtype: List[str]
+    :raises ValueError: if the workloads of both results are different
+    """
+    if (baseline["size"], baseline["seed"]) != (current["size"],
+                                                current["seed"]):
+        raise ValueError("The baseline was recorded with another workload")
+
+    regressions = []
+    for backend, operations in current["backends"].items():
+        for operation, metrics in operations.items():
+            expected = baseline["backends"].get(backend, {}).get(operation)
+            if expected is None:
+                continue
+
+            comparisons = metrics["comparisons_per_op"]
+            limit = expected["comparisons_per_op"] * (1 + threshold)
+            if comparisons > limit:
+                regressions.append(
+                    f"{backend}.{operation}: {comparisons:.2f} comparisons/op"
+                    f" (baseline {expected['comparisons_per_op']:.2f})")
+
+            if throughput_threshold is not None:
+                throughput = metrics["ops_per_second"]
+                limit = expected["ops_per_second"] * (1 - throughput_threshold)
+                if throughput < limit:
+                    regressions.append(
+                        f"{backend}.{operation}: {throughput:.0f} ops/s"
+                        f" (baseline {expected['ops_per_second']:.0f})")
+
+    return regressions
+
+
+def main(arguments: Sequence[str] = None) -> int:
+    """
+    Parses the command line arguments, runs the workload and compares it with
+    the baseline, or records a new baseline.
+
+    :param arguments: the command line arguments
+    :type arguments: Sequence[str]
+    :return: the exit status, 1 if any metric regressed else 0
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog="python main.py perf",
+                                     description="TreeSet regression gate")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="tolerated growth of the comparison counts")
+    parser.add_argument("--throughput-threshold", type=float,
+                        default=THROUGHPUT_THRESHOLD,
+                        help="tolerated drop of the ops/sec")
+    parser.add_argument("--counts-only", action="store_true",
+                        help="ignore the throughputs")
+    parser.add_argument("--update", action="store_true",
+                        help="record the current metrics as the baseline")
+    options = parser.parse_args(arguments)
+
+    current = run()
+    if options.update:
+        with open(options.baseline, "w") as file:
+            json.dump(current, file, indent=2)
+            file.write("\n")
+        print(f"Baseline written to {options.baseline}")
+        return 0
+
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(baseline, current, options.threshold,
+                          None if options.counts_only
+                          else options.throughput_threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if not regressions:
+        print("No performance regressions")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
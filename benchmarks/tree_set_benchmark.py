@@ -0,0 +1,287 @@
+"""
+tree_set_benchmark module.
+
+Times the TreeSet operations for several sizes, input distributions, element
+types and backends, and emits the results as JSON. Run it with
+``python main.py bench`` (``python main.py bench --help`` lists the options).
+
+Element types:
+    * ``int`` and ``str`` (zero-padded numbers, so their order is the numeric
+      one)
+    * ``Person`` and ``Martian`` from :mod:`tests.tests_classes`, whose
+      comparisons are Python methods reading properties
+
+Distributions:
+    * ``random``: distinct values drawn uniformly
+    * ``sorted`` and ``reverse``: ascending and descending values
+    * ``nearly_sorted``: ascending values where every value is moved by at
+      most ``SWAP_DISTANCE`` positions, like timestamps arriving slightly out
+      of order
+    * ``clustered``: runs of consecutive values starting at random points
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import *
+from model.tree_set import TreeSet
+from tests.tests_classes import Martian, Person
+
+SIZES = (1000, 10000, 100000, 1000000)
+DISTRIBUTIONS = ("random", "sorted", "reverse", "clustered", "nearly_sorted")
+TYPES = {
+    "int": (int, lambda number: number),
+    "str": (str, lambda number: f"{number:012d}"),
+    "Person": (Person, lambda number: Person(f"Person{number}", number)),
+    "Martian": (Martian, lambda number: Martian(f"Martian{number}",
+                                                f"planet{number:012d}", "red")),
+}
+OPERATIONS = ("add", "add_all", "contains", "higher", "lower", "ceiling",
+              "floor", "iteration", "clone", "poll_first", "remove")
+CLUSTER_SIZE = 100
+SWAP_DISTANCE = 20
+
+
+def generate(distribution: str, size: int, rng: random.Random) -> List[int]:
+    """
+    Generates distinct numbers following the given distribution.
+
+    :param distribution: the name of the distribution
+    :type distribution: str
+    :param size: the number of values
+    :type size: int
+    :param rng: the random generator
+    :type rng: random.Random
+    :return: the generated numbers, in insertion order
+    :rtype: List[int]
+    :raises ValueError: if the distribution does not exist
+    """
+    if distribution == "random":
+        return rng.sample(range(size * 10), size)
+    if distribution == "sorted":
+        return list(range(0, size * 10, 10))
+    if distribution == "reverse":
+        return list(range((size - 1) * 10, -1, -10))
+    if distribution == "clustered":
+        starts = rng.sample(range(0, size * 10, CLUSTER_SIZE),
+                            -(-size // CLUSTER_SIZE))
+        numbers = [start + offset for start in starts
+                   for offset in range(CLUSTER_SIZE)]
+        return numbers[:size]
+
+    if distribution == "nearly_sorted":
+        keys = {number: number + rng.uniform(0, SWAP_DISTANCE * 10)
+                for number in range(0, size * 10, 10)}
+        return sorted(keys, key=keys.get)
+
+    raise ValueError(f"Unknown distribution '{distribution}'")
+
+
+def _measure(function: Callable[[], Any]) -> float:
+    """
+    Returns the seconds spent running the given function.
+
+    :param function: the function to time
+    :type function: Callable[[], Any]
+    :return: the elapsed seconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _queries(queries: List[Any], method: Callable[[Any], Any]) \
+        -> Callable[[], None]:
+    """
+    Returns a function calling the given method with every query.
+
+    :param queries: the query values
+    :type queries: List[Any]
+    :param method: the method to call
+    :type method: Callable[[Any], Any]
+    :return: the function running the queries
+    :rtype: Callable[[], None]
+    """
+    def run() -> None:
+        for query in queries:
+            method(query)
+
+    return run
+
+
+def benchmark_case(generic_type: Type, values: List[Any], queries: List[Any],
+                   backend: str, operations: Sequence[str]) \
+        -> Dict[str, Tuple[int, float]]:
+    """
+    Times the given operations over a TreeSet of the given values.
+
+    :param generic_type: the type of the values
+    :type generic_type: Type
+    :param values: the values, in insertion order
+    :type values: List[Any]
+    :param queries: the values used by the lookup operations
+    :type queries: List[Any]
+    :param backend: the TreeSet backend
+    :type backend: str
+    :param operations: the operations to time
+    :type operations: Sequence[str]
+    :return: the number of operations and the elapsed seconds of each one
+    :rtype: Dict[str, Tuple[int, float]]
+    """
+    timings = {}
+    tree = TreeSet(generic_type, backend=backend)
+
+    def add_one_by_one() -> None:
+        for value in values:
+            tree.add(value)
+
+    seconds = _measure(add_one_by_one)
+    if "add" in operations:
+        timings["add"] = (len(values), seconds)
+
+    if "add_all" in operations:
+        timings["add_all"] = (len(values), _measure(
+            lambda: TreeSet(generic_type, backend=backend).add_all(values)))
+
+    for name in ("contains", "higher", "lower", "ceiling", "floor"):
+        if name in operations:
+            timings[name] = (len(queries), _measure(
+                _queries(queries, getattr(tree, name))))
+
+    if "iteration" in operations:
+        timings["iteration"] = (len(values), _measure(
+            lambda: [None for _ in tree]))
+
+    if "clone" in operations:
+        timings["clone"] = (len(values), _measure(tree.clone))
+
+    if "poll_first" in operations:
+        copy = tree.clone()
+        timings["poll_first"] = (len(values), _measure(
+            lambda: [copy.poll_first() for _ in range(len(values))]))
+
+    if "remove" in operations:
+        copy = tree.clone()
+        timings["remove"] = (len(values), _measure(_queries(values,
+                                                            copy.remove)))
+
+    return timings
+
+
+def run(sizes: Sequence[int] = SIZES,
+        distributions: Sequence[str] = DISTRIBUTIONS,
+        types: Sequence[str] = tuple(TYPES),
+        backends: Sequence[str] = TreeSet.BACKENDS,
+        operations: Sequence[str] = OPERATIONS,
+        max_queries: int = 100000, seed: int = 0,
+        progress: TextIO = None) -> Dict[str, Any]:
+    """
+    Runs the benchmark for every combination of the given parameters.
+
+    :param sizes: the numbers of elements
+    :type sizes: Sequence[int]
+    :param distributions: the input distributions
+    :type distributions: Sequence[str]
+    :param types: the names of the element types
+    :type types: Sequence[str]
+    :param backends: the TreeSet backends
+    :type backends: Sequence[str]
+    :param operations: the operations to time
+    :type operations: Sequence[str]
+    :param max_queries: maximum number of calls of the lookup operations
+    :type max_queries: int
+    :param seed: the seed of the generated values
+    :type seed: int
+    :param progress: stream where a line is written after every case
+    :type progress: TextIO
+    :return: the metadata of the run and a result per measured operation
+    :rtype: Dict[str, Any]
+    """
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            rng = random.Random(seed)
+            numbers = generate(distribution, size, rng)
+            query_numbers = [rng.randrange(size * 10)
+                             for _ in range(min(size, max_queries))]
+
+            for type_name in types:
+                generic_type, convert = TYPES[type_name]
+                values = [convert(number) for number in numbers]
+                queries = [convert(number) for number in query_numbers]
+
+                for backend in backends:
+                    timings = benchmark_case(generic_type, values, queries,
+                                             backend, operations)
+                    for operation, (count, seconds) in timings.items():
+                        results.append({
+                            "backend": backend,
+                            "type": type_name,
+                            "distribution": distribution,
+                            "size": size,
+                            "operation": operation,
+                            "operations": count,
+                            "seconds": seconds,
+                            "ops_per_second": count / seconds if seconds
+                            else None,
+                        })
+
+                    if progress is not None:
+                        print(f"{backend} {type_name} {distribution} {size}",
+                              file=progress, flush=True)
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "max_queries": max_queries,
+        },
+        "results": results,
+    }
+
+
+def main(arguments: Sequence[str] = None) -> None:
+    """
+    Parses the command line arguments, runs the benchmark and writes the JSON
+    results into the standard output or the given file.
+
+    :param arguments: the command line arguments
+    :type arguments: Sequence[str]
+    """
+    parser = argparse.ArgumentParser(prog="python main.py bench",
+                                     description="TreeSet benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--distributions", nargs="+", default=DISTRIBUTIONS,
+                        choices=DISTRIBUTIONS)
+    parser.add_argument("--types", nargs="+", default=tuple(TYPES),
+                        choices=tuple(TYPES))
+    parser.add_argument("--backends", nargs="+", default=TreeSet.BACKENDS,
+                        choices=TreeSet.BACKENDS)
+    parser.add_argument("--operations", nargs="+", default=OPERATIONS,
+                        choices=OPERATIONS)
+    parser.add_argument("--max-queries", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument("--quiet", action="store_true",
+                        help="do not report the progress on stderr")
+    options = parser.parse_args(arguments)
+
+    results = run(options.sizes, options.distributions, options.types,
+                  options.backends, options.operations, options.max_queries,
+                  options.seed, None if options.quiet else sys.stderr)
+
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+write_ahead_log_benchmark module.
+
+Measures the throughput of DurableTreeSet insertions for different fsync batch
+sizes. Run it with ``python -m benchmarks.write_ahead_log_benchmark``.
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from typing import *
+from model.storage.write_ahead_log import DurableTreeSet
+
+
+def run(batch_sizes: Sequence[int] = (1, 10, 100, 1000),
+        operations: int = 10000, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Inserts the same random values into a new DurableTreeSet for every batch
+    size and measures the throughput.
+
+    :param batch_sizes: the fsync batch sizes to measure
+    :type batch_sizes: Sequence[int]
+    :param operations: the number of insertions of every run
+    :type operations: int
+    :param seed: the seed of the random values
+    :type seed: int
+    :return: a result per batch size
+    :rtype: List[Dict[str, Any]]
+    """
+    values = random.Random(seed).sample(range(operations * 10), operations)
+    results = []
+
+    for batch_size in batch_sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            tree = DurableTreeSet(directory, int, sync_batch_size=batch_size,
+                                  checkpoint_interval=None)
+            start = time.perf_counter()
+            for value in values:
+                tree.add(value)
+            tree.close()
+            elapsed = time.perf_counter() - start
+
+        results.append({
+            "sync_batch_size": batch_size,
+            "operations": operations,
+            "seconds": elapsed,
+            "ops_per_second": operations / elapsed,
+        })
+
+    return results
+
+
+if __name__ == "__main__":
+    json.dump(run(), sys.stdout, indent=2)
+    print()
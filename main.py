@@ -1,7 +1,15 @@
-"""Main module to run the tests."""
+"""
+Main module to run the tests.
 
+Usage:
+    python main.py           runs the tests and opens the GUI
+    python main.py bench     runs the benchmark suite (see ``bench --help``)
+    python main.py perf      runs the performance regression gate (see
+                             ``perf --help``), exiting with 1 on regression
+"""
+
+import sys
 import unittest
-from model.tree_gui import GUI
 
 
 def suite():
@@ -14,13 +22,50 @@ def suite():
     suite.addTest(loader.loadTestsFromName("tests.test_other_items_tree_set"))
     suite.addTest(loader.loadTestsFromName("tests.test_simple_stack"))
     suite.addTest(loader.loadTestsFromName("tests.test_tree_set_rotations_recolors"))
+    suite.addTest(loader.loadTestsFromName("tests.test_mmap_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_durable_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_bplus_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_lsm_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_blocked_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_benchmark"))
+    suite.addTest(loader.loadTestsFromName("tests.test_regression_gate"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_stats"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_profiling"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_verification"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_comparison"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_fingerprint"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_count_range"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_remove_range"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_batch_removal"))
+    suite.addTest(loader.loadTestsFromName("tests.test_interval_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_augmentation"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_range_statistics"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_map"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_multiset"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_write_buffer"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_bloom_filter"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_hash_index"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_finger_search"))
+    suite.addTest(loader.loadTestsFromName("tests.test_sliding_window_tree_set"))
     return suite
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        from benchmarks.tree_set_benchmark import main
+
+        main(sys.argv[2:])
+        sys.exit()
+    if len(sys.argv) > 1 and sys.argv[1] == "perf":
+        from benchmarks.regression import main
+
+        sys.exit(main(sys.argv[2:]))
+
     runner = unittest.TextTestRunner()
     runner.run(suite())
 
     # Uncomment the next lines and execute the program to see the GUI
+    from model.tree_gui import GUI
+
     app = GUI()
     app.mainloop()
@@ -0,0 +1,285 @@
+"""
+augmentation module.
+
+This module provides the subtree aggregates of a RedBlackTree, enabled by
+:meth:`RedBlackTree.add_augmentation`. An augmentation is a monoid (an
+associative ``combine`` function and its ``identity``) applied to the values
+of the tree, optionally mapped first: every node keeps the aggregate of its
+subtree, recomputed wherever the subtree sizes are (rotations, insertion and
+deletion paths, splits, joins and rebuilds), so the aggregate of any range of
+values is combined from *O(log n)* subtrees.
+
+Like the statistics, the augmentations change the class of the tree to a
+subclass mixing :class:`RedBlackTreeAugmentation` in, so a tree without
+augmentations runs the original code.
+"""
+from typing import *
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import RedBlackTree
+from model.utils.data_utils import TreeNode
+
+
+class Augmentation(NamedTuple):
+    """
+    Monoid aggregated over the subtrees of a RedBlackTree: ``combine`` must be
+    associative and ``identity`` neutral for it, and ``mapper`` turns a value
+    of the tree into an aggregate (the value itself if it is None).
+    """
+
+    combine: Callable[[Any, Any], Any]
+    identity: Any
+    mapper: Union[Callable[[Any], Any], None] = None
+
+
+class RedBlackTreeAugmentation:
+    """
+    Mixin keeping the aggregates of the augmentations of a RedBlackTree in the
+    ``aggregates`` list of every node.
+    """
+
+    __attributes = {
+        "_RedBlackTreeAugmentation__names",
+        "_RedBlackTreeAugmentation__augmentations",
+    }
+
+    @classmethod
+    def enable(cls, tree: RedBlackTree) -> None:
+        """
+        Makes the given tree keep augmentations, none of them added yet.
+
+        :param tree: the tree to augment
+        :type tree: RedBlackTree
+        """
+        tree._set_feature(cls, True)
+        tree._RedBlackTreeAugmentation__names = []
+        tree._RedBlackTreeAugmentation__augmentations = []
+
+    def add_augmentation(self, name: str, combine: Callable[[Any, Any], Any],
+                         identity: Any,
+                         mapper: Callable[[Any], Any] = None) -> None:
+        """
+        Adds an augmentation, computing its aggregates in *O(n)* time.
+
+        :param name: the name of the augmentation
+        :type name: str
+        :param combine: the associative function combining two aggregates
+        :type combine: Callable[[Any, Any], Any]
+        :param identity: the neutral aggregate of ``combine``
+        :type identity: Any
+        :param mapper: the function turning a value into an aggregate, or None
+            to aggregate the values themselves
+        :type mapper: Callable[[Any], Any]
+        :raises ValueError: if the tree already has an augmentation of that
+            name
+        """
+        if name in self.__names:
+            raise ValueError(f"Augmentation '{name}' already exists")
+
+        self.__names.append(name)
+        self.__augmentations.append(Augmentation(combine, identity, mapper))
+        self.__recompute(self._RedBlackTree__root)
+
+    def remove_augmentation(self, name: str) -> None:
+        """
+        Removes an augmentation, and the mixin itself with the last one.
+
+        :param name: the name of the augmentation
+        :type name: str
+        :raises ValueError: if the tree has no augmentation of that name
+        """
+        index = self.__index(name)
+        del self.__names[index]
+        del self.__augmentations[index]
+        if self.__names:
+            self.__recompute(self._RedBlackTree__root)
+            return
+
+        for node in self._RedBlackTree__inorder(True):
+            del node.aggregates
+        for attribute in self.__attributes:
+            object.__delattr__(self, attribute)
+        self._set_feature(RedBlackTreeAugmentation, False)
+
+    def augmentations(self) -> List[str]:
+        """
+        Returns the names of the augmentations of the tree.
+
+        :return: the names of the augmentations, in the order they were added
+        :rtype: List[str]
+        """
+        return list(self.__names)
+
+    def aggregate(self, name: str, low: Any = None, high: Any = None,
+                  inclusive: Union[bool, Tuple[bool, bool]] = True) -> Any:
+        """
+        Returns the aggregate of the values between the given bounds, in
+        *O(log n)* time: the aggregates of the subtrees hanging from the
+        search paths of both bounds are combined in order, so ``combine`` does
+        not need to be commutative.
+
+        :param name: the name of the augmentation
+        :type name: str
+        :param low: the lowest value of the range, or None if unbounded
+        :type low: Any
+        :param high: the greatest value of the range, or None if unbounded
+        :type high: Any
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the aggregate of the range, the identity if it is empty
+        :rtype: Any
+        :raises ValueError: if the tree has no augmentation of that name
+        """
+        index = self.__index(name)
+        combine, identity, mapper = self.__augmentations[index]
+        low_inclusive, high_inclusive = (inclusive, inclusive) \
+            if isinstance(inclusive, bool) else inclusive
+        null = self._NULL
+
+        def above_low(value: Any) -> bool:
+            """Checks that a value is not below the low bound."""
+            return low is None or low < value or low_inclusive and low == value
+
+        def below_high(value: Any) -> bool:
+            """Checks that a value is not above the high bound."""
+            return high is None or value < high \
+                or high_inclusive and value == high
+
+        def single(node: TreeNode) -> Any:
+            """Returns the aggregate of the value of a node alone."""
+            return node.value if mapper is None else mapper(node.value)
+
+        def total(node: TreeNode) -> Any:
+            """Returns the aggregate of a subtree."""
+            return identity if node is null else node.aggregates[index]
+
+        node = self._RedBlackTree__root
+        while node is not null:
+            if not above_low(node.value):
+                node = node.right
+            elif not below_high(node.value):
+                node = node.left
+            else:
+                break
+        else:
+            return identity
+
+        suffix, current = identity, node.left
+        while current is not null:
+            if above_low(current.value):
+                suffix = combine(combine(single(current),
+                                         total(current.right)), suffix)
+                current = current.left
+            else:
+                current = current.right
+
+        prefix, current = identity, node.right
+        while current is not null:
+            if below_high(current.value):
+                prefix = combine(prefix, combine(total(current.left),
+                                                 single(current)))
+                current = current.right
+            else:
+                current = current.left
+
+        return combine(combine(suffix, single(node)), prefix)
+
+    def verify(self, paths: int = None) -> bool:
+        """
+        Verifies the invariants of the tree (see :meth:`RedBlackTree.verify`)
+        and, when the whole tree is checked, the aggregates of every node.
+
+        :param paths: the number of random paths to check, or None to check
+            the whole tree
+        :type paths: int
+        :return: True if the tree is valid
+        :rtype: bool
+        :raises IllegalStateException: if some invariant does not hold
+        :raises ValueError: if the number of paths is not positive
+        """
+        super().verify(paths)
+        if paths is not None:
+            return True
+
+        for node in self._RedBlackTree__inorder(True):
+            if node.aggregates != self.__compute(node):
+                raise IllegalStateException(
+                    f"Invalid RedBlackTree: aggregates {node.aggregates!r} "
+                    f"instead of {self.__compute(node)!r} at {node.value!r}")
+
+        return True
+
+    def __index(self, name: str) -> int:
+        """
+        Returns the position of the given augmentation.
+
+        :param name: the name of the augmentation
+        :type name: str
+        :return: its position in the aggregates of the nodes
+        :rtype: int
+        :raises ValueError: if the tree has no augmentation of that name
+        """
+        if name not in self.__names:
+            raise ValueError(f"Unknown augmentation '{name}'")
+        return self.__names.index(name)
+
+    def __compute(self, node: TreeNode) -> List[Any]:
+        """
+        Computes the aggregates of a node from the ones of its children.
+
+        :param node: the node
+        :type node: TreeNode
+        :return: the aggregate of its subtree for every augmentation
+        :rtype: List[Any]
+        """
+        left, right = node.left, node.right
+        aggregates = []
+        for index, (combine, _, mapper) in enumerate(self.__augmentations):
+            aggregate = node.value if mapper is None else mapper(node.value)
+            if left is not self._NULL:
+                aggregate = combine(left.aggregates[index], aggregate)
+            if right is not self._NULL:
+                aggregate = combine(aggregate, right.aggregates[index])
+            aggregates.append(aggregate)
+
+        return aggregates
+
+    def __recompute(self, node: TreeNode) -> None:
+        """
+        Computes the aggregates of every node of a subtree, bottom-up.
+
+        :param node: the root of the subtree
+        :type node: TreeNode
+        """
+        if node is self._NULL:
+            return
+
+        self.__recompute(node.left)
+        self.__recompute(node.right)
+        node.aggregates = self.__compute(node)
+
+    def _update_node(self, node: TreeNode) -> None:
+        """
+        Recomputes the subtree size and the aggregates of a node from the ones
+        of its children.
+
+        :param node: the node to update
+        :type node: TreeNode
+        """
+        super()._update_node(node)
+        node.aggregates = self.__compute(node)
+
+    def _update_path(self, node: Union[TreeNode, None], delta: int) -> None:
+        """
+        Updates the subtree sizes and recomputes the aggregates of the given
+        node and its ancestors after an insertion or a deletion below them.
+
+        :param node: the deepest node whose subtree changed, or None
+        :type node: Union[TreeNode, None]
+        :param delta: 1 after an insertion, -1 after a deletion
+        :type delta: int
+        """
+        super()._update_path(node, delta)
+        while node is not None:
+            node.aggregates = self.__compute(node)
+            node = node.parent
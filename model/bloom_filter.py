@@ -0,0 +1,344 @@
+"""
+bloom_filter module.
+
+This module provides the CountingBloomFilter class, a probabilistic set of
+hashable values which can tell that a value is definitely absent without
+comparing it to any element, and the Bloom filter front of a TreeSet, enabled
+by :meth:`TreeSet.enable_bloom_filter`, which answers most of the membership
+misses in *O(1)* time instead of descending the tree.
+
+Like the statistics, the Bloom filter front changes the class of the TreeSet
+to a subclass mixing :class:`TreeSetBloomFilter` in, so a TreeSet without
+filter runs the original code.
+"""
+import math
+from typing import *
+from model.tree_set import RedBlackTree, TreeSet, _mix_hash
+
+E = TypeVar('E')
+
+
+class CountingBloomFilter:
+    """
+    Class that represents a counting Bloom filter: every value increments the
+    counters of ``hashes`` positions derived from its hash, and decrements
+    them when it is removed, so a value whose positions are not all non zero
+    was never added, while a value whose positions are all non zero was added
+    with a probability depending on the number of values.
+
+    The counters are bytes saturating at 255, and saturated counters are
+    never decremented, so removals cannot create false negatives.
+    """
+
+    __SATURATED = 255
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        """
+        Initialize an empty CountingBloomFilter sized to keep the given false
+        positive rate up to the given number of values.
+
+        :param capacity: the number of values the filter is sized for
+        :type capacity: int
+        :param false_positive_rate: the probability that a value which was
+            not added is reported as present, at full capacity
+        :type false_positive_rate: float
+        :raises ValueError: if the capacity is not positive or the false
+            positive rate is not between 0 and 1
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+
+        self.__capacity = capacity
+        self.__false_positive_rate = false_positive_rate
+        self.__width = math.ceil(
+            -capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.__hashes = max(1, round(self.__width / capacity * math.log(2)))
+        self.__counters = bytearray(self.__width)
+        self.__size = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        Getter method to retrieve the number of values the filter is sized
+        for.
+
+        :return: the capacity of the filter
+        :rtype: int
+        """
+        return self.__capacity
+
+    @property
+    def false_positive_rate(self) -> float:
+        """
+        Getter method to retrieve the false positive rate of the filter at
+        full capacity.
+
+        :return: the false positive rate
+        :rtype: float
+        """
+        return self.__false_positive_rate
+
+    @property
+    def hashes(self) -> int:
+        """
+        Getter method to retrieve the number of counters of every value.
+
+        :return: the number of hash functions
+        :rtype: int
+        """
+        return self.__hashes
+
+    @property
+    def width(self) -> int:
+        """
+        Getter method to retrieve the number of counters of the filter.
+
+        :return: the number of counters
+        :rtype: int
+        """
+        return self.__width
+
+    def __positions(self, value: Any) -> Iterator[int]:
+        """
+        Returns the positions of the counters of a value, derived from the
+        two halves of its mixed hash (double hashing).
+
+        :param value: the value
+        :type value: Any
+        :return: an iterator over the positions
+        :rtype: Iterator[int]
+        :raises TypeError: if the value is not hashable
+        """
+        mixed = _mix_hash(value)
+        position, step = mixed & 0xFFFFFFFF, mixed >> 32 | 1
+        for _ in range(self.__hashes):
+            yield position % self.__width
+            position += step
+
+    def add(self, value: Any) -> None:
+        """
+        Adds a value to the filter.
+
+        :param value: the value to add
+        :type value: Any
+        :raises TypeError: if the value is not hashable
+        """
+        counters = self.__counters
+        for position in self.__positions(value):
+            if counters[position] < self.__SATURATED:
+                counters[position] += 1
+        self.__size += 1
+
+    def remove(self, value: Any) -> None:
+        """
+        Removes a value which was added to the filter.
+
+        :param value: the value to remove
+        :type value: Any
+        :raises TypeError: if the value is not hashable
+        """
+        counters = self.__counters
+        for position in self.__positions(value):
+            if counters[position] < self.__SATURATED:
+                counters[position] -= 1
+        self.__size -= 1
+
+    def clear(self) -> None:
+        """
+        Removes all the values of the filter.
+        """
+        self.__counters = bytearray(self.__width)
+        self.__size = 0
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks if the given value may have been added, stopping at the first
+        zero counter. This method is called when using built-in operator
+        'in'.
+
+        :param value: the value to check
+        :type value: Any
+        :return: False if the value was definitely not added, True if it
+            probably was
+        :rtype: bool
+        :raises TypeError: if the value is not hashable
+        """
+        counters = self.__counters
+        for position in self.__positions(value):
+            if not counters[position]:
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """
+        Provides the number of values added to the filter and not removed. It
+        is used with the built-in method len().
+
+        :return: the number of values
+        :rtype: int
+        """
+        return self.__size
+
+
+class TreeSetBloomFilter:
+    """
+    Mixin keeping a CountingBloomFilter of the elements of a TreeSet, updated
+    by the insertion, deletion and clearing hooks of the tree, in front of
+    its membership tests.
+    """
+
+    __attributes = {
+        "_TreeSetBloomFilter__filter",
+        "_TreeSetBloomFilter__rate",
+        "_TreeSetBloomFilter__counters",
+    }
+
+    MIN_CAPACITY = 1024
+    COUNTERS = ("lookups", "hits", "negatives", "false_positives")
+
+    @classmethod
+    def enable(cls, tree: TreeSet, false_positive_rate: float) -> None:
+        """
+        Puts a Bloom filter of the elements in front of the membership tests
+        of the given TreeSet.
+
+        :param tree: the TreeSet to filter
+        :type tree: TreeSet
+        :param false_positive_rate: the false positive rate of the filter
+        :type false_positive_rate: float
+        """
+        tree._set_feature(cls, True)
+        tree._TreeSetBloomFilter__filter = None
+        tree._TreeSetBloomFilter__rate = false_positive_rate
+        tree._TreeSetBloomFilter__counters = dict.fromkeys(cls.COUNTERS, 0)
+        tree._TreeSetBloomFilter__rebuild()
+
+    def enable_bloom_filter(self, false_positive_rate: float = 0.01) -> None:
+        """
+        Changes the false positive rate of the Bloom filter, which is already
+        enabled, rebuilding it.
+
+        :param false_positive_rate: the false positive rate of the filter
+        :type false_positive_rate: float
+        :raises ValueError: if the rate is not between 0 and 1
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+
+        self.__rate = false_positive_rate
+        self.__rebuild()
+
+    def disable_bloom_filter(self) -> None:
+        """
+        Removes the Bloom filter and discards its statistics.
+        """
+        for attribute in self.__attributes:
+            object.__delattr__(self, attribute)
+        self._set_feature(TreeSetBloomFilter, False)
+
+    def bloom_filter_stats(self, reset: bool = False) -> Dict[str, int]:
+        """
+        Returns a snapshot of the counters of the membership tests.
+
+        :param reset: if True the counters are reset after the snapshot
+        :type reset: bool
+        :return: the value of every counter
+        :rtype: Dict[str, int]
+        """
+        snapshot = dict(self.__counters)
+        if reset:
+            self.__counters = dict.fromkeys(self.COUNTERS, 0)
+        return snapshot
+
+    def __rebuild(self) -> None:
+        """
+        Replaces the filter with one sized for twice the number of elements,
+        holding all of them.
+        """
+        bloom_filter = CountingBloomFilter(
+            max(self.MIN_CAPACITY, 2 * self.size()), self.__rate)
+        try:
+            for value in self:
+                bloom_filter.add(value)
+        except TypeError:
+            bloom_filter = None
+        self.__filter = bloom_filter
+
+    def _on_clear(self) -> None:
+        """
+        Empties the Bloom filter after the TreeSet is emptied, enabling it
+        again if some unhashable value had disabled it.
+        """
+        super()._on_clear()
+        self.__filter = CountingBloomFilter(self.MIN_CAPACITY, self.__rate)
+
+    def _on_insert(self, value: E) -> None:
+        """
+        Adds an inserted value to the Bloom filter. The filter is disabled if
+        the value is not hashable.
+
+        :param value: the inserted value
+        :type value: E
+        """
+        super()._on_insert(value)
+        if self.__filter is None:
+            return
+
+        try:
+            self.__filter.add(value)
+        except TypeError:
+            self.__filter = None
+
+    def _on_delete(self, value: E) -> None:
+        """
+        Removes a deleted value from the Bloom filter. The filter is disabled
+        if the value is not hashable.
+
+        :param value: the deleted value
+        :type value: E
+        """
+        super()._on_delete(value)
+        if self.__filter is None:
+            return
+
+        try:
+            self.__filter.remove(value)
+        except TypeError:
+            self.__filter = None
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def __contains__(self, value: E) -> bool:
+        """
+        Check if the given value is contained in the TreeSet or not, without
+        searching the tree when the filter tells it is definitely absent (so
+        without comparisons, nor checking the value is comparable). The
+        filter is resized when it holds more elements than its capacity.
+
+        :param value: the value to check
+        :type value: E
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        counters = self.__counters
+        counters["lookups"] += 1
+        bloom_filter = self.__filter
+        if bloom_filter is not None:
+            if len(bloom_filter) > bloom_filter.capacity:
+                self.__rebuild()
+                bloom_filter = self.__filter
+            try:
+                if value not in bloom_filter:
+                    counters["negatives"] += 1
+                    return False
+            except TypeError:
+                bloom_filter = None
+
+        if super().__contains__(value):
+            counters["hits"] += 1
+            return True
+        if bloom_filter is not None:
+            counters["false_positives"] += 1
+        return False
@@ -29,3 +29,25 @@ class NullPointerException(Exception):
             super().__init__(msg)
         else:
             super().__init__()
+
+
+class UnsupportedOperationException(Exception):
+    """Custom exception class for handling unsupported operation errors."""
+
+    def __init__(self, msg: str = None) -> None:
+        """UnsupportedOperationException constructor."""
+        if msg:
+            super().__init__(msg)
+        else:
+            super().__init__()
+
+
+class IllegalStateException(Exception):
+    """Custom exception class for handling illegal state errors."""
+
+    def __init__(self, msg: str = None) -> None:
+        """IllegalStateException constructor."""
+        if msg:
+            super().__init__(msg)
+        else:
+            super().__init__()
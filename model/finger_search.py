@@ -0,0 +1,268 @@
+"""
+finger_search module.
+
+This module provides the finger search of a RedBlackTree, enabled by
+:meth:`RedBlackTree.enable_finger_search`. The tree remembers the node of
+its last search (the finger) and its greatest node, and every search:
+
+    * returns the greatest node at once when the value is not lower than it,
+      so inserting ascending values, like timestamps, costs *O(1)* comparisons
+      plus the rebalancing
+    * otherwise climbs from the finger to the lowest ancestor whose subtree
+      holds the position of the value, and descends from it, so a value at
+      distance *d* of the previous one is found in *O(log d)* time; the climb
+      falls back to the root after about *log n* levels
+
+An appended node is also rebalanced up the right spine by a fix without the
+cases which cannot happen there.
+
+Like the statistics, the finger search changes the class of the tree to a
+subclass mixing :class:`RedBlackTreeFingerSearch` in, so a tree without
+finger runs the original code.
+"""
+from typing import *
+from model.tree_set import RedBlackTree
+from model.utils.data_utils import TreeNode
+
+
+class RedBlackTreeFingerSearch:
+    """
+    Mixin starting the searches of a RedBlackTree from its last searched
+    node, or from its greatest node.
+    """
+
+    __attributes = {
+        "_RedBlackTreeFingerSearch__finger",
+        "_RedBlackTreeFingerSearch__maximum",
+    }
+
+    @classmethod
+    def enable(cls, tree: RedBlackTree) -> None:
+        """
+        Starts the searches of the given tree from its last searched node.
+
+        :param tree: the tree to search
+        :type tree: RedBlackTree
+        """
+        tree._set_feature(cls, True)
+        tree._RedBlackTreeFingerSearch__reset()
+
+    def disable_finger_search(self) -> None:
+        """
+        Starts the searches of the tree from its root again.
+        """
+        for attribute in self.__attributes:
+            object.__delattr__(self, attribute)
+        self._set_feature(RedBlackTreeFingerSearch, False)
+
+    def __reset(self) -> None:
+        """
+        Forgets the finger and finds the greatest node again, after the tree
+        was relinked or some nodes were unlinked at once.
+        """
+        self.__finger = None
+        node = self._RedBlackTree__root
+        if node is self._NULL:
+            self.__maximum = None
+            return
+
+        while node.right is not self._NULL:
+            node = node.right
+        self.__maximum = node
+
+    def __climb(self, value: Any) -> TreeNode:
+        """
+        Finds the node to descend from to search the given value, which is
+        lower than the greatest one and different from the finger.
+
+        The search climbs from the finger (or from the greatest node if there
+        is none) to the lowest ancestor whose subtree holds the position of
+        the value: leaving a right child, or a left child for a value lower
+        than the finger, only extends the subtree on the side of the value.
+        A value at distance *d* of the finger is thus found in *O(log d)*
+        time, and the climb gives up for the root after about *log n* levels
+        so that a distant value costs no more than a search from the root.
+
+        :param value: the searched value
+        :type value: Any
+        :return: the node to descend from, or the node holding the value
+        :rtype: TreeNode
+        """
+        finger = self.__finger
+        if finger is None:
+            finger = self.__maximum
+        above = finger.value < value
+
+        for _ in range(self._RedBlackTree__size.bit_length() // 2):
+            if (parent := finger.parent) is None:
+                return finger
+            if finger is (parent.left if above else parent.right):
+                if value < parent.value if above else parent.value < value:
+                    return finger
+                if parent.value == value:
+                    return parent
+            finger = parent
+
+        return self._RedBlackTree__root
+
+    def _RedBlackTree__contains(self, value: Any) -> TreeNode:
+        """
+        Searches the given value from the greatest node or the finger, and
+        moves the finger to the returned node.
+
+        :param value: the value to check
+        :type value: Any
+        :return: TreeNode having the searched value or a leaf
+        :rtype: TreeNode
+        """
+        maximum = self.__maximum
+        if maximum is None:
+            return self._NULL
+        if not value < maximum.value:
+            self.__finger = maximum
+            return maximum
+
+        finger = self.__finger
+        if finger is not None and finger.value == value:
+            return finger
+        current = self.__climb(value)
+
+        parent = self._NULL
+        while current is not self._NULL:
+            if current.value == value:
+                break
+
+            parent = current
+            if value < current.value:
+                current = current.left
+            else:
+                current = current.right
+        else:
+            current = parent
+
+        self.__finger = current
+        return current
+
+    def _insert(self, value: Any) -> Tuple[TreeNode, bool]:
+        """
+        Inserts a value unless it already exists, moving the finger to its
+        node.
+
+        :param value: the value to insert
+        :type value: Any
+        :return: the node holding the value, and False if it already existed
+            in the tree, True otherwise
+        :rtype: Tuple[TreeNode, bool]
+        """
+        node, added = super()._insert(value)
+        if added and (self.__maximum is None
+                      or self.__maximum.value < node.value):
+            self.__maximum = node
+        self.__finger = node
+        return node, added
+
+    def _RedBlackTree__fix_after_insertion(self, node: TreeNode) -> None:
+        """
+        Fixes the RedBlackTree after an insertion operation. A node appended
+        below the greatest one is rebalanced up the right spine, where its
+        ancestors are all right children, without the cases of the generic
+        fix.
+
+        :param node: the node that was inserted
+        :type node: TreeNode
+        """
+        parent = node.parent
+        if parent is not self.__maximum or node is not parent.right:
+            super()._RedBlackTree__fix_after_insertion(node)
+            return
+
+        red, black = self._RED, self._BLACK
+        while parent.color is red:
+            grandparent = parent.parent
+            uncle = grandparent.left
+            if uncle.color is not red:
+                parent.color = black
+                grandparent.color = red
+                self._RedBlackTree__left_rotation(grandparent)
+                break
+
+            uncle.color = black
+            parent.color = black
+            grandparent.color = red
+            if (parent := grandparent.parent) is None:
+                break
+
+        self._RedBlackTree__root.color = black
+
+    def _extract_node(self, node: TreeNode) -> None:
+        """
+        Deletes the value of the given node, moving the finger and the
+        greatest node to its predecessor if they are the deleted node.
+
+        :param node: the node to unlink
+        :type node: TreeNode
+        """
+        if node is self.__finger or node is self.__maximum:
+            predecessor = self._predecessor(node)
+            predecessor = None if predecessor is self._NULL else predecessor
+            if node is self.__finger:
+                self.__finger = predecessor
+            if node is self.__maximum:
+                self.__maximum = predecessor
+
+        super()._extract_node(node)
+
+    def _detach_range(self, low: Any, high: Any, low_inclusive: bool = True,
+                      high_inclusive: bool = True) -> List[Any]:
+        """
+        Removes the values between the given bounds and forgets the finger.
+
+        :param low: the lowest value of the range, or None if unbounded
+        :type low: Any
+        :param high: the greatest value of the range, or None if unbounded
+        :type high: Any
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: the removed values, in order
+        :rtype: List[Any]
+        """
+        removed = super()._detach_range(low, high, low_inclusive,
+                                        high_inclusive)
+        self.__reset()
+        return removed
+
+    def _remove_where(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """
+        Removes the values satisfying the given predicate and forgets the
+        finger.
+
+        :param predicate: function returning True for the values to remove
+        :type predicate: Callable[[Any], bool]
+        :return: the removed values, in order
+        :rtype: List[Any]
+        """
+        removed = super()._remove_where(predicate)
+        self.__reset()
+        return removed
+
+    def _merge(self, values: List[Any]) -> int:
+        """
+        Inserts the given sorted values and forgets the finger.
+
+        :param values: the sorted values without duplicates
+        :type values: List[Any]
+        :return: the number of values which were not in the tree
+        :rtype: int
+        """
+        added = super()._merge(values)
+        self.__reset()
+        return added
+
+    def clear(self) -> None:
+        """
+        Clears the tree and forgets the finger.
+        """
+        super().clear()
+        self.__reset()
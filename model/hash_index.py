@@ -0,0 +1,267 @@
+"""
+hash_index module.
+
+This module provides the hash index of a TreeSet, enabled by
+:meth:`TreeSet.enable_hash_index`: a dict from every element to the node of
+the Red-Black Tree holding it, kept in sync by every insertion and deletion.
+Membership tests and deletions find the node in *O(1)* average time instead
+of descending from the root, and the neighbours of an element are reached by
+stepping from its node.
+
+Like the statistics, the hash index changes the class of the TreeSet to a
+subclass mixing :class:`TreeSetHashIndex` in, so a TreeSet without index runs
+the original code.
+"""
+from typing import *
+from model.tree_set import RedBlackTree, TreeSet
+from model.utils.data_utils import TreeNode
+
+E = TypeVar('E')
+
+
+class TreeSetHashIndex:
+    """
+    Mixin keeping a dict from the elements of a TreeSet to their nodes.
+    """
+
+    __attributes = {"_TreeSetHashIndex__index"}
+
+    @classmethod
+    def enable(cls, tree: TreeSet) -> None:
+        """
+        Indexes the nodes of the given TreeSet.
+
+        :param tree: the TreeSet to index
+        :type tree: TreeSet
+        :raises TypeError: if some element is not hashable
+        """
+        index = {node.value: node
+                 for node in tree._RedBlackTree__inorder(True)}
+        tree._set_feature(cls, True)
+        tree._TreeSetHashIndex__index = index
+
+    def disable_hash_index(self) -> None:
+        """
+        Removes the hash index of the TreeSet.
+        """
+        for attribute in self.__attributes:
+            object.__delattr__(self, attribute)
+        self._set_feature(TreeSetHashIndex, False)
+
+    def __reindex(self) -> None:
+        """
+        Indexes again every node of the tree, in *O(n)* time.
+        """
+        self.__index = {node.value: node
+                        for node in self._RedBlackTree__inorder(True)}
+
+    def _insert(self, value: E) -> Tuple[TreeNode, bool]:
+        """
+        Inserts a value unless it already exists, and indexes its node.
+
+        :param value: the value to insert
+        :type value: E
+        :return: the node holding the value, and False if it already existed
+            in the tree, True otherwise
+        :rtype: Tuple[TreeNode, bool]
+        :raises TypeError: if the value is not hashable
+        """
+        node = self.__index.get(value)
+        if node is not None:
+            return node, False
+
+        node, added = super()._insert(value)
+        self.__index[value] = node
+        return node, added
+
+    def _extract(self, value: E) -> Union[TreeNode, None]:
+        """
+        Deletes a value found in the index, without searching the tree.
+
+        :param value: the value to delete
+        :type value: E
+        :return: the unlinked node which held the value, or None if the value
+            does not exist in the tree
+        :rtype: Union[TreeNode, None]
+        """
+        try:
+            node = self.__index.pop(value, None)
+        except TypeError:
+            return None
+
+        if node is not None:
+            self._extract_node(node)
+        return node
+
+    def _detach_range(self, low: E, high: E, low_inclusive: bool = True,
+                      high_inclusive: bool = True) -> List[E]:
+        """
+        Removes the values between the given bounds and their index entries.
+
+        :param low: the lowest value of the range, or None if unbounded
+        :type low: E
+        :param high: the greatest value of the range, or None if unbounded
+        :type high: E
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: the removed values, in order
+        :rtype: List[E]
+        """
+        removed = super()._detach_range(low, high, low_inclusive,
+                                        high_inclusive)
+        for value in removed:
+            del self.__index[value]
+        return removed
+
+    def _remove_where(self, predicate: Callable[[E], bool]) -> List[E]:
+        """
+        Removes the values satisfying the given predicate and their index
+        entries.
+
+        :param predicate: function returning True for the values to remove
+        :type predicate: Callable[[E], bool]
+        :return: the removed values, in order
+        :rtype: List[E]
+        """
+        removed = super()._remove_where(predicate)
+        for value in removed:
+            del self.__index[value]
+        return removed
+
+    def _merge(self, values: List[E]) -> int:
+        """
+        Inserts the given sorted values, indexing their nodes one by one when
+        they are inserted one by one, or all the nodes again after a rebuild.
+
+        :param values: the sorted values without duplicates
+        :type values: List[E]
+        :return: the number of values which were not in the tree
+        :rtype: int
+        """
+        rebuilt = len(values) > self.REBUILD_FRACTION \
+            * self._RedBlackTree__size
+        added = super()._merge(values)
+        if rebuilt:
+            self.__reindex()
+        return added
+
+    def clear(self) -> None:
+        """
+        Clears the TreeSet and its index.
+        """
+        super().clear()
+        self.__index = {}
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def __contains__(self, value: E) -> bool:
+        """
+        Check if the given value is contained in the TreeSet or not, with a
+        single dict lookup (so without comparisons, nor checking the value is
+        comparable).
+
+        :param value: the value to check
+        :type value: E
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        return self.__indexed(value)
+
+    def __neighbour(self, value: E, higher: bool) -> Union[E, None]:
+        """
+        Steps from the node of an indexed value to its neighbour.
+
+        :param value: the indexed value
+        :type value: E
+        :param higher: True for the next value, False for the previous one
+        :type higher: bool
+        :return: the neighbour value, or None if there is none
+        :rtype: Union[E, None]
+        """
+        node = self.__index[value]
+        node = self._successor(node) if higher else self._predecessor(node)
+        return None if node is self._NULL else node.value
+
+    def __indexed(self, value: E) -> bool:
+        """
+        Checks if a value is indexed, tolerating unhashable values.
+
+        :param value: the value
+        :type value: E
+        :return: True if the value is in the index
+        :rtype: bool
+        """
+        try:
+            return value in self.__index
+        except TypeError:
+            return False
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def higher(self, value: E) -> Union[E, None]:
+        """
+        Returns the next higher value, stepping from the node of the given
+        value when it is in the TreeSet.
+
+        :param value: value to compare
+        :type value: E
+        :return: the next higher value in the tree compared to the given value
+        :rtype: Union[E, None]
+        """
+        if self.__indexed(value):
+            return self.__neighbour(value, True)
+        return super().higher(value)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def lower(self, value: E) -> Union[E, None]:
+        """
+        Returns the next lower value, stepping from the node of the given
+        value when it is in the TreeSet.
+
+        :param value: value to compare
+        :type value: E
+        :return: the next lower value in the tree compared to the given value
+        :rtype: Union[E, None]
+        """
+        if self.__indexed(value):
+            return self.__neighbour(value, False)
+        return super().lower(value)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def ceiling(self, value: E) -> Union[E, None]:
+        """
+        Returns the given value if it is in the TreeSet, otherwise the least
+        greater value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the least value greater than or equal to the given value
+        :rtype: Union[E, None]
+        """
+        if self.__indexed(value):
+            return self.__index[value].value
+        return super().ceiling(value)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def floor(self, value: E) -> Union[E, None]:
+        """
+        Returns the given value if it is in the TreeSet, otherwise the
+        greatest lower value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest value lower than or equal to the given value
+        :rtype: Union[E, None]
+        """
+        if self.__indexed(value):
+            return self.__index[value].value
+        return super().floor(value)
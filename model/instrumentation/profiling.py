@@ -0,0 +1,303 @@
+"""
+profiling module.
+
+This module provides the latency histograms recorded once
+:meth:`RedBlackTree.enable_profiling` is called, and the mixins which time the
+public methods of the tree. Like the statistics, profiling changes the class
+of the tree to a subclass mixing these classes in, so a tree whose profiling
+is disabled dispatches its methods exactly as before.
+"""
+from time import perf_counter_ns
+from typing import *
+from model.tree_set import RedBlackTree
+
+Callback = Callable[[str, Dict[str, float]], None]
+
+
+class LatencyHistogram:
+    """
+    Class that represents a histogram of latencies in nanoseconds with
+    logarithmic buckets, as HDR histograms do: every power of two is split
+    into ``2 ** SUB_BUCKET_BITS`` buckets, so the percentiles are precise up
+    to ``1 / 2 ** SUB_BUCKET_BITS`` of their value whatever their magnitude.
+    """
+
+    SUB_BUCKET_BITS = 4
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self) -> None:
+        """
+        Constructor of the class.
+        Initializes a new empty LatencyHistogram.
+        """
+        sub_buckets = 1 << self.SUB_BUCKET_BITS
+        self.__counts = [0] * (64 - self.SUB_BUCKET_BITS + 1) * sub_buckets
+        self.__count = 0
+        self.__total = 0
+        self.__min = None
+        self.__max = None
+
+    @classmethod
+    def bucket(cls, nanoseconds: int) -> int:
+        """
+        Returns the index of the bucket of the given latency.
+
+        :param nanoseconds: the latency
+        :type nanoseconds: int
+        :return: the index of its bucket
+        :rtype: int
+        """
+        sub_buckets = 1 << cls.SUB_BUCKET_BITS
+        if nanoseconds < sub_buckets:
+            return nanoseconds
+
+        shift = nanoseconds.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return (shift + 1) * sub_buckets + (nanoseconds >> shift) - sub_buckets
+
+    @classmethod
+    def bucket_limit(cls, index: int) -> int:
+        """
+        Returns the highest latency of the given bucket.
+
+        :param index: the index of the bucket
+        :type index: int
+        :return: the highest latency stored in the bucket
+        :rtype: int
+        """
+        sub_buckets = 1 << cls.SUB_BUCKET_BITS
+        if index < sub_buckets:
+            return index
+
+        shift = index // sub_buckets - 1
+        return ((index % sub_buckets + sub_buckets + 1) << shift) - 1
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Records a latency.
+
+        :param nanoseconds: the latency
+        :type nanoseconds: int
+        """
+        self.__counts[self.bucket(nanoseconds)] += 1
+        self.__count += 1
+        self.__total += nanoseconds
+        if self.__min is None or nanoseconds < self.__min:
+            self.__min = nanoseconds
+        if self.__max is None or nanoseconds > self.__max:
+            self.__max = nanoseconds
+
+    def count(self) -> int:
+        """
+        Returns the number of recorded latencies.
+
+        :return: the number of recorded latencies
+        :rtype: int
+        """
+        return self.__count
+
+    def percentile(self, percentile: float) -> Union[int, None]:
+        """
+        Returns the latency below or at which the given percentage of the
+        recorded latencies are, rounded up to the limit of its bucket (and
+        bounded by the maximum latency).
+
+        :param percentile: the percentage, between 0 and 100
+        :type percentile: float
+        :return: the latency, or None if no latency was recorded
+        :rtype: Union[int, None]
+        :raises ValueError: if the percentage is not between 0 and 100
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+
+        if not self.__count:
+            return None
+
+        rank = max(1, -(-self.__count * percentile // 100))
+        seen = 0
+        for index, count in enumerate(self.__counts):
+            seen += count
+            if seen >= rank:
+                return min(self.bucket_limit(index), self.__max)
+
+        return self.__max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Returns the count, minimum, mean, maximum and usual percentiles
+        (``p50``, ``p90``, ``p99`` and ``p99.9``) of the latencies.
+
+        :return: the summary of the histogram, with latencies in nanoseconds
+        :rtype: Dict[str, float]
+        """
+        summary = {
+            "count": self.__count,
+            "min": self.__min,
+            "mean": self.__total / self.__count if self.__count else None,
+            "max": self.__max,
+        }
+        for percentile in self.PERCENTILES:
+            summary[f"p{percentile:g}"] = self.percentile(percentile)
+
+        return summary
+
+    def reset(self) -> None:
+        """
+        Removes every recorded latency.
+        """
+        self.__init__()
+
+
+def _profiled(name: str) -> Callable:
+    """
+    Creates a method recording the latency of the method of the given name
+    of the profiled class.
+
+    :param name: the name of the method
+    :type name: str
+    :return: the profiling method
+    :rtype: Callable
+    """
+
+    def method(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return getattr(super(RedBlackTreeProfiling, self), name)(*args,
+                                                                     **kwargs)
+        finally:
+            self._RedBlackTreeProfiling__record(name,
+                                                perf_counter_ns() - start)
+
+    method.__name__ = name
+    method.__doc__ = f"Records the latency of :meth:`{name}`."
+    return method
+
+
+class RedBlackTreeProfiling:
+    """
+    Mixin recording the latency of the public methods of a RedBlackTree.
+    """
+
+    __attributes = {
+        "_RedBlackTreeProfiling__histograms",
+        "_RedBlackTreeProfiling__callback",
+        "_RedBlackTreeProfiling__interval",
+        "_RedBlackTreeProfiling__calls",
+    }
+
+    METHODS = ("add", "remove", "clear", "__contains__")
+    # Outermost feature, so the latencies include the work of the others
+    _feature_order = -2
+
+    @classmethod
+    def enable(cls, tree: RedBlackTree, callback: Callback,
+               report_interval: int) -> None:
+        """
+        Starts profiling the given tree.
+
+        :param tree: the tree to profile
+        :type tree: RedBlackTree
+        :param callback: the function receiving the reports
+        :type callback: Callback
+        :param report_interval: the number of calls between reports
+        :type report_interval: int
+        """
+        tree._set_feature(cls, True)
+        tree._RedBlackTreeProfiling__histograms = {}
+        tree._RedBlackTreeProfiling__callback = callback
+        tree._RedBlackTreeProfiling__interval = report_interval
+        tree._RedBlackTreeProfiling__calls = 0
+
+    def enable_profiling(self, callback: Callback = None,
+                         report_interval: int = None) -> None:
+        """
+        Changes the reporting of the profiling, which is already enabled.
+
+        :param callback: the function receiving the reports
+        :type callback: Callback
+        :param report_interval: the number of calls between reports
+        :type report_interval: int
+        :raises ValueError: if the report interval is not positive
+        """
+        if report_interval is not None and report_interval < 1:
+            raise ValueError("Report interval must be positive")
+
+        self.__callback = callback
+        self.__interval = report_interval
+        self.__calls = 0
+
+    def disable_profiling(self) -> None:
+        """
+        Stops profiling the tree and discards the histograms.
+        """
+        for attribute in self.__attributes:
+            object.__delattr__(self, attribute)
+        self._set_feature(self._profiling_mixin(), False)
+
+    def profile(self, reset: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the summary of the latencies of every called method.
+
+        :param reset: if True the histograms are reset after the snapshot
+        :type reset: bool
+        :return: the summary of the histogram of every method
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        summaries = {name: histogram.summary()
+                     for name, histogram in self.__histograms.items()
+                     if histogram.count()}
+        if reset:
+            for histogram in self.__histograms.values():
+                histogram.reset()
+
+        return summaries
+
+    def report_profile(self, reset: bool = False) -> None:
+        """
+        Sends the summary of the latencies of every called method to the
+        callback.
+
+        :param reset: if True the histograms are reset after the report
+        :type reset: bool
+        """
+        summaries = self.profile(reset)
+        if self.__callback is not None:
+            for name, summary in summaries.items():
+                self.__callback(name, summary)
+
+    def __record(self, name: str, nanoseconds: int) -> None:
+        """
+        Records the latency of a call and reports the histograms when the
+        report interval is reached.
+
+        :param name: the name of the called method
+        :type name: str
+        :param nanoseconds: the latency of the call
+        :type nanoseconds: int
+        """
+        if (histogram := self.__histograms.get(name)) is None:
+            histogram = self.__histograms[name] = LatencyHistogram()
+        histogram.record(nanoseconds)
+
+        if self.__interval:
+            self.__calls += 1
+            if self.__calls >= self.__interval:
+                self.__calls = 0
+                self.report_profile(reset=True)
+
+
+class TreeSetProfiling(RedBlackTreeProfiling):
+    """
+    Mixin recording the latency of the public methods of a TreeSet.
+    """
+
+    METHODS = ("add_all", "contains", "higher", "lower", "ceiling", "floor",
+               "first", "last", "poll_first", "poll_last", "clone", "size",
+               "is_empty", "rank", "count_range", "remove_range",
+               "drain_until", "remove_all", "retain_all", "remove_if",
+               "sum_range", "mean_range", "min_range", "max_range", "flush")
+
+
+for _mixin in (RedBlackTreeProfiling, TreeSetProfiling):
+    for _name in _mixin.METHODS:
+        setattr(_mixin, _name, _profiled(_name))
@@ -0,0 +1,288 @@
+"""
+tree_stats module.
+
+This module provides the mixins that count the internal operations of a
+RedBlackTree once :meth:`RedBlackTree.enable_stats` is called:
+
+    * ``comparisons``: element comparisons made while descending the tree
+      and between nodes while rebalancing it
+    * ``node_visits``: nodes visited while descending the tree
+    * ``left_rotations`` and ``right_rotations``: rotations performed
+    * ``recolors``: node color changes made while rebalancing the tree
+    * ``allocations``: nodes created
+
+The tree is instrumented by changing its class to a subclass mixing these
+classes in, and its nodes are changed to a counting node class owned by the
+tree, so a tree whose statistics are disabled runs the original code.
+"""
+from typing import *
+from model.tree_set import RedBlackTree
+from model.utils.data_utils import TreeNode
+
+E = TypeVar('E')
+
+COUNTERS = ("comparisons", "node_visits", "left_rotations", "right_rotations",
+            "recolors", "allocations")
+
+
+class CountingTreeNode:
+    """
+    Node mixin counting the allocations, recolors and comparisons of the
+    nodes of an instrumented tree in the ``_counters`` of its class.
+    """
+
+    _counters = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Counts the allocation of a node before initializing it.
+        """
+        self._counters["allocations"] += 1
+        super().__init__(*args, **kwargs)
+
+    def __set_color(self, color: TreeNode.TreeNodeUtils) -> None:
+        """
+        Counts the color change of the node before setting its color.
+
+        :param color: the new color for the node
+        :type color: TreeNode.TreeNodeUtils
+        """
+        if self.__dict__.get("_TreeNode__color", color) is not color:
+            self._counters["recolors"] += 1
+        TreeNode.color.fset(self, color)
+
+    color = property(TreeNode.color.fget, __set_color)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Counts the comparison before checking the equality of the nodes.
+
+        :param other: the other node to compare with
+        :type other: Any
+        :return: True if the nodes are equal, False otherwise
+        :rtype: bool
+        """
+        self._counters["comparisons"] += 1
+        return super().__eq__(other)
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        Counts the comparison before comparing the nodes.
+
+        :param other: the other node to compare with
+        :type other: Any
+        :return: True if the current node is less than the other node, False
+            otherwise
+        :rtype: bool
+        """
+        self._counters["comparisons"] += 1
+        return super().__lt__(other)
+
+
+class RedBlackTreeStats:
+    """
+    Mixin counting the internal operations of a RedBlackTree.
+    """
+
+    __attributes = {"_node_type", "_RedBlackTreeStats__counters"}
+
+    @classmethod
+    def enable(cls, tree: RedBlackTree) -> None:
+        """
+        Instruments the given tree and its nodes.
+
+        :param tree: the tree to instrument
+        :type tree: RedBlackTree
+        """
+        counters = dict.fromkeys(COUNTERS, 0)
+        node_type = type("CountingTreeNode",
+                         (CountingTreeNode, type(tree)._node_type),
+                         {"_counters": counters})
+
+        tree._set_feature(cls, True)
+        tree._node_type = node_type
+        tree._RedBlackTreeStats__counters = counters
+        for node in tree._RedBlackTree__inorder(True):
+            object.__setattr__(node, "__class__", node_type)
+
+    def enable_stats(self) -> None:
+        """
+        Does nothing, since the statistics are already enabled.
+        """
+
+    def disable_stats(self) -> None:
+        """
+        Stops counting the operations of the tree and discards the counters.
+        """
+        object.__delattr__(self, "_node_type")
+        object.__delattr__(self, "_RedBlackTreeStats__counters")
+        self._set_feature(self._stats_mixin(), False)
+        for node in self._RedBlackTree__inorder(True):
+            object.__setattr__(node, "__class__", self._node_type)
+
+    def stats(self, reset: bool = False) -> Dict[str, int]:
+        """
+        Returns a snapshot of the counters of the tree.
+
+        :param reset: if True the counters are reset after the snapshot
+        :type reset: bool
+        :return: the value of every counter
+        :rtype: Dict[str, int]
+        """
+        snapshot = dict(self.__counters)
+        if reset:
+            self.reset_stats()
+        return snapshot
+
+    def reset_stats(self) -> None:
+        """
+        Sets every counter of the tree to zero.
+        """
+        for counter in self.__counters:
+            self.__counters[counter] = 0
+
+    def _RedBlackTree__contains(self, value: E) -> TreeNode:
+        """
+        Counts the comparisons and visits of the search of the given value.
+
+        :param value: the value to check
+        :type value: E
+        :return: TreeNode having the searched value or a leaf
+        :rtype: TreeNode
+        """
+        counters = self.__counters
+        parent = RedBlackTree._NULL
+        current = self._RedBlackTree__root
+
+        while current is not RedBlackTree._NULL:
+            counters["node_visits"] += 1
+            counters["comparisons"] += 1
+            if current.value == value:
+                return current
+
+            parent = current
+            counters["comparisons"] += 1
+            if value < current.value:
+                current = current.left
+            else:
+                current = current.right
+
+        return parent
+
+    def _RedBlackTree__left_rotation(self, node: TreeNode) -> None:
+        """
+        Counts the left rotation before performing it.
+
+        :param node: the node to perform the rotation on
+        :type node: TreeNode
+        """
+        self.__counters["left_rotations"] += 1
+        super()._RedBlackTree__left_rotation(node)
+
+    def _RedBlackTree__right_rotation(self, node: TreeNode) -> None:
+        """
+        Counts the right rotation before performing it.
+
+        :param node: the node to perform the rotation on
+        :type node: TreeNode
+        """
+        self.__counters["right_rotations"] += 1
+        super()._RedBlackTree__right_rotation(node)
+
+
+class TreeSetStats(RedBlackTreeStats):
+    """
+    Mixin counting the internal operations of a TreeSet, including the ones
+    of its navigation methods.
+    """
+
+    def __navigate(self, value: E, lower: bool, inclusive: bool) \
+            -> Union[E, None]:
+        """
+        Counts the comparisons and visits of the search of the closest value
+        to the given one.
+
+        :param value: the value to compare
+        :type value: E
+        :param lower: True to search a lower value else a higher one
+        :type lower: bool
+        :param inclusive: True if the given value itself can be returned
+        :type inclusive: bool
+        :return: the closest value or None if there is no such value
+        :rtype: Union[E, None]
+        """
+        counters = self._RedBlackTreeStats__counters
+        current = self._RedBlackTree__root
+        result = None
+
+        while current is not RedBlackTree._NULL:
+            counters["node_visits"] += 1
+            if inclusive:
+                counters["comparisons"] += 1
+                if current.value == value:
+                    return value
+
+            counters["comparisons"] += 1
+            if current.value < value if lower else current.value > value:
+                result = current.value
+                current = current.right if lower else current.left
+            else:
+                current = current.left if lower else current.right
+
+        return result
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def higher(self, value: E) -> Union[E, None]:
+        """
+        Counts the operations of :meth:`TreeSet.higher`.
+
+        :param value: value to compare
+        :type value: E
+        :return: the next higher value in the tree compared to the given value
+        :rtype: Union[E, None]
+        """
+        return self.__navigate(value, False, False)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def lower(self, value: E) -> Union[E, None]:
+        """
+        Counts the operations of :meth:`TreeSet.lower`.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest element lower than the given value
+        :rtype: Union[E, None]
+        """
+        return self.__navigate(value, True, False)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def ceiling(self, value: E) -> Union[E, None]:
+        """
+        Counts the operations of :meth:`TreeSet.ceiling`.
+
+        :param value: value to compare
+        :type value: E
+        :return: the least element greater than or equal to the given value
+        :rtype: Union[E, None]
+        """
+        return self.__navigate(value, False, True)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def floor(self, value: E) -> Union[E, None]:
+        """
+        Counts the operations of :meth:`TreeSet.floor`.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest element less than or equal to the given value
+        :rtype: Union[E, None]
+        """
+        return self.__navigate(value, True, True)
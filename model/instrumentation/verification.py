@@ -0,0 +1,169 @@
+"""
+verification module.
+
+This module provides the mixin which verifies the invariants of a tree after
+its modifications once :meth:`RedBlackTree.enable_verification` is called.
+Like the statistics, the verification changes the class of the tree to a
+subclass mixing it in, so a tree whose verification is disabled runs the
+original code.
+"""
+import random
+from typing import *
+from model.tree_set import RedBlackTree
+
+E = TypeVar('E')
+
+
+class RedBlackTreeVerification:
+    """
+    Mixin verifying a sample of the modifications of a tree (insertions,
+    deletions, range and batch removals, merges).
+    """
+
+    __attributes = {
+        "_RedBlackTreeVerification__rate",
+        "_RedBlackTreeVerification__paths",
+    }
+
+    @classmethod
+    def enable(cls, tree: RedBlackTree, rate: float, paths: int) -> None:
+        """
+        Starts verifying the modifications of the given tree.
+
+        :param tree: the tree to verify
+        :type tree: RedBlackTree
+        :param rate: the fraction of the modifications to verify
+        :type rate: float
+        :param paths: the number of random paths to check, or None to check
+            the whole tree
+        :type paths: int
+        """
+        tree._set_feature(cls, True)
+        tree.enable_verification(rate, paths)
+
+    def enable_verification(self, rate: float = 1.0,
+                            paths: int = None) -> None:
+        """
+        Changes the sampling of the verification, which is already enabled.
+
+        :param rate: the fraction of the modifications to verify
+        :type rate: float
+        :param paths: the number of random paths to check, or None to check
+            the whole tree
+        :type paths: int
+        :raises ValueError: if the rate is not between 0 and 1 or the number
+            of paths is not positive
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError("Rate must be between 0 and 1")
+        if paths is not None and paths < 1:
+            raise ValueError("Number of paths must be positive")
+
+        self.__rate = rate
+        self.__paths = paths
+
+    def disable_verification(self) -> None:
+        """
+        Stops verifying the modifications of the tree.
+        """
+        for attribute in self.__attributes:
+            object.__delattr__(self, attribute)
+        self._set_feature(RedBlackTreeVerification, False)
+
+    def __verify(self, modified: bool) -> None:
+        """
+        Verifies the tree if it was modified and the modification is sampled.
+
+        :param modified: True if the tree was modified
+        :type modified: bool
+        :raises IllegalStateException: if some invariant does not hold
+        """
+        if modified and random.random() < self.__rate:
+            self.verify(self.__paths)
+
+    def add(self, value: E, *args) -> Any:
+        """
+        Inserts a new value and verifies the tree if it is sampled.
+
+        :param value: the value to insert
+        :type value: E
+        :param args: the other arguments of the method of the tree, like the
+            number of occurrences of a TreeMultiset
+        :return: False if the value already exists in the tree, otherwise the
+            result of the method of the tree
+        :rtype: Any
+        :raises IllegalStateException: if some invariant does not hold
+        """
+        added = super().add(value, *args)
+        self.__verify(added is not False)
+        return added
+
+    def remove(self, value: E, *args) -> Any:
+        """
+        Deletes a value and verifies the tree if it is sampled.
+
+        :param value: the value to delete
+        :type value: E
+        :param args: the other arguments of the method of the tree, like the
+            number of occurrences of a TreeMultiset
+        :return: False if the value does not exist in the tree, otherwise the
+            result of the method of the tree
+        :rtype: Any
+        :raises IllegalStateException: if some invariant does not hold
+        """
+        removed = super().remove(value, *args)
+        self.__verify(removed is not False)
+        return removed
+
+    def _detach_range(self, low: E, high: E, low_inclusive: bool = True,
+                      high_inclusive: bool = True) -> List[E]:
+        """
+        Removes the values between the given bounds and verifies the tree if
+        the removal is sampled.
+
+        :param low: the lowest value of the range, or None if unbounded
+        :type low: E
+        :param high: the greatest value of the range, or None if unbounded
+        :type high: E
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: the removed values, in order
+        :rtype: List[E]
+        :raises IllegalStateException: if some invariant does not hold
+        """
+        removed = super()._detach_range(low, high, low_inclusive,
+                                        high_inclusive)
+        self.__verify(bool(removed))
+        return removed
+
+    def _remove_where(self, predicate: Callable[[E], bool]) -> List[E]:
+        """
+        Removes the values satisfying the given predicate and verifies the
+        tree if the removal is sampled.
+
+        :param predicate: function returning True for the values to remove
+        :type predicate: Callable[[E], bool]
+        :return: the removed values, in order
+        :rtype: List[E]
+        :raises IllegalStateException: if some invariant does not hold
+        """
+        removed = super()._remove_where(predicate)
+        self.__verify(bool(removed))
+        return removed
+
+    def _merge(self, values: List[E]) -> int:
+        """
+        Inserts the given sorted values and verifies the tree if the merge is
+        sampled.
+
+        :param values: the sorted values without duplicates
+        :type values: List[E]
+        :return: the number of values which were not in the tree
+        :rtype: int
+        :raises IllegalStateException: if some invariant does not hold
+        """
+        added = super()._merge(values)
+        self.__verify(bool(added))
+        return added
@@ -0,0 +1,242 @@
+"""
+interval_tree_set module.
+
+This module provides the IntervalTreeSet class, a TreeSet of closed intervals
+ordered by their low endpoint (then by their high endpoint). Every node of its
+Red-Black Tree also keeps the greatest high endpoint of its subtree, which is
+recomputed wherever the subtree sizes are (rotations, insertion and deletion
+paths, splits and joins), so the intervals overlapping a point or another
+interval are found by skipping every subtree ending before it instead of
+scanning the whole set.
+"""
+from typing import *
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import RedBlackTree, TreeSet
+from model.utils.data_utils import TreeNode
+
+
+class Interval(NamedTuple):
+    """
+    Closed interval between two comparable endpoints.
+    """
+
+    low: Any
+    high: Any
+
+
+class IntervalTreeNode(TreeNode):
+    """
+    TreeNode of an IntervalTreeSet, which also keeps the greatest high
+    endpoint of the intervals of its subtree.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Constructor of the class.
+        Initializes a new node whose subtree is only itself.
+        """
+        super().__init__(*args, **kwargs)
+        self.max_high = self.value.high
+
+
+class IntervalTreeSet(TreeSet):
+    """
+    Class that represents a set of closed intervals (see :class:`Interval`)
+    stored in an augmented Red-Black Tree, which answers the overlapping
+    queries visiting only the subtrees which can hold an overlapping interval.
+    """
+
+    BACKENDS = ("red_black",)
+    _node_type = IntervalTreeNode
+
+    def __init__(self, intervals: Collection[Interval] = None) -> None:
+        """
+        Initialize an empty IntervalTreeSet or constructs one with the
+        intervals contained into the given collection.
+
+        :param intervals: a collection of intervals to add
+        :type intervals: Collection[Interval]
+        :raises TypeError: if some value is not an Interval
+        :raises NullPointerException: if some value is None
+        :raises ValueError: if some interval ends before it starts
+        """
+        super().__init__(Interval, intervals)
+
+    @staticmethod
+    def __check_interval(interval: Interval) -> None:
+        """
+        Checks that the given interval does not end before it starts.
+
+        :param interval: the interval to check
+        :type interval: Interval
+        :raises ValueError: if the interval ends before it starts
+        """
+        if interval.high < interval.low:
+            raise ValueError(f"Interval ends before it starts: {interval}")
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def add(self, value: Interval) -> bool:
+        """
+        Inserts a new interval into the IntervalTreeSet.
+
+        :param value: the interval to insert
+        :type value: Interval
+        :return: False if the interval already exists in the set, True
+            otherwise
+        :rtype: bool
+        :raises ValueError: if the interval ends before it starts
+        """
+        self.__check_interval(value)
+        return super().add(value)
+
+    def add_all(self, values: Collection[Interval]) -> bool:
+        """
+        Inserts the given intervals into the current IntervalTreeSet. If some
+        value is not a valid interval, an exception will be thrown, and no
+        interval will be added.
+
+        :param values: intervals to insert into the IntervalTreeSet
+        :type values: Collection[Interval]
+        :return: True if all intervals could be inserted else False
+        :rtype: bool
+        :raises TypeError: if some value is not an Interval
+        :raises NullPointerException: if some value is None
+        :raises ValueError: if some interval ends before it starts
+        """
+        if isinstance(values, Collection):
+            for value in values:
+                if isinstance(value, Interval):
+                    self.__check_interval(value)
+
+        return super().add_all(values)
+
+    def enable_write_buffer(self,
+                            threshold: int = TreeSet.WRITE_BUFFER_THRESHOLD) \
+            -> None:
+        """
+        The intervals are checked when they are inserted, so they cannot be
+        buffered.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException(
+            "Write buffer is not supported by IntervalTreeSet")
+
+    def clone(self) -> 'IntervalTreeSet':
+        """
+        Clones the current IntervalTreeSet and returns that clone.
+
+        :return: a shallow copy of the current IntervalTreeSet instance.
+        :rtype: IntervalTreeSet
+        """
+        return IntervalTreeSet(self)
+
+    def _update_node(self, node: IntervalTreeNode) -> None:
+        """
+        Recomputes the subtree size and the greatest high endpoint of a node
+        from the ones of its children.
+
+        :param node: the node to update
+        :type node: IntervalTreeNode
+        """
+        super()._update_node(node)
+        high = node.value.high
+        for child in (node.left, node.right):
+            if child is not self._NULL and high < child.max_high:
+                high = child.max_high
+        node.max_high = high
+
+    def _update_path(self, node: Union[IntervalTreeNode, None],
+                     delta: int) -> None:
+        """
+        Updates the subtree sizes and recomputes the greatest high endpoints
+        of the given node and its ancestors after an insertion or a deletion
+        below them.
+
+        :param node: the deepest node whose subtree changed, or None
+        :type node: Union[IntervalTreeNode, None]
+        :param delta: 1 after an insertion, -1 after a deletion
+        :type delta: int
+        """
+        super()._update_path(node, delta)
+        while node is not None:
+            high = node.value.high
+            for child in (node.left, node.right):
+                if child is not self._NULL and high < child.max_high:
+                    high = child.max_high
+            node.max_high = high
+            node = node.parent
+
+    def overlapping(self, low: Any, high: Any = None) -> List[Interval]:
+        """
+        Returns, in order, the intervals containing the given point or, if a
+        high endpoint is also given, the ones overlapping the closed interval
+        between both. The subtrees whose greatest high endpoint is lower than
+        the low endpoint are skipped, as well as every interval starting after
+        the high endpoint, so reporting *k* intervals visits *O((k + 1) log n)*
+        nodes at most instead of *n*.
+
+        :param low: the point, or the low endpoint of the interval
+        :type low: Any
+        :param high: the high endpoint of the interval, or None for a point
+        :type high: Any
+        :return: the overlapping intervals
+        :rtype: List[Interval]
+        :raises NullPointerException: if the low endpoint is None
+        :raises ValueError: if the interval ends before it starts
+        """
+        if low is None:
+            raise NullPointerException("Value cannot be None")
+        if high is None:
+            high = low
+        self.__check_interval(Interval(low, high))
+
+        result = []
+        stack = []
+        node = self._RedBlackTree__root
+        while True:
+            if node is not self._NULL and not node.max_high < low:
+                stack.append(node)
+                node = node.left
+            elif stack:
+                node = stack.pop()
+                if high < node.value.low:
+                    break
+                if not node.value.high < low:
+                    result.append(node.value)
+                node = node.right
+            else:
+                break
+
+        return result
+
+    def verify(self, paths: int = None) -> bool:
+        """
+        Verifies the invariants of the Red-Black Tree (see
+        :meth:`RedBlackTree.verify`) and, when the whole tree is checked, the
+        greatest high endpoint kept by every node.
+
+        :param paths: the number of random paths to check, or None to check
+            the whole tree
+        :type paths: int
+        :return: True if the tree is valid
+        :rtype: bool
+        :raises IllegalStateException: if some invariant does not hold
+        :raises ValueError: if the number of paths is not positive
+        """
+        super().verify(paths)
+        if paths is not None:
+            return True
+
+        for node in self._RedBlackTree__inorder(True):
+            high = max([node.value.high] + [
+                child.max_high for child in (node.left, node.right)
+                if child is not self._NULL])
+            if node.max_high != high:
+                raise IllegalStateException(
+                    f"Invalid IntervalTreeSet: greatest high endpoint "
+                    f"{node.max_high!r} instead of {high!r} at {node.value!r}")
+
+        return True
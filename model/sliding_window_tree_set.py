@@ -0,0 +1,329 @@
+"""
+sliding_window_tree_set module.
+
+This module provides the SlidingWindowTreeSet class, which keeps the last
+events of a stream, the last ``max_size`` ones and/or the ones of the last
+``max_age`` seconds, sorted in a TreeMultiset (so repeated values are counted
+once per event) while a ring buffer remembers their arrival order. Every new
+event evicts the oldest ones in *O(log n)* time each, and the order statistics
+of the window (rank, quantiles, median) are weighted selections in
+*O(log n)* time.
+"""
+import math
+import numbers
+import time
+from collections import deque
+from typing import *
+from model.exceptions.tree_set_exceptions import *
+from model.tree_multiset import TreeMultiset
+
+E = TypeVar('E')
+
+
+class SlidingWindowTreeSet:
+    """
+    Class that represents a sliding window over a stream of comparable
+    values, evicting the oldest ones when the window holds more than
+    ``max_size`` events or when they are older than ``max_age`` seconds.
+    """
+
+    def __init__(self, generic_type: Type, max_size: int = None,
+                 max_age: float = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize an empty SlidingWindowTreeSet.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param max_size: the number of events of the window, or None if it
+            is only bounded by their age
+        :type max_size: int
+        :param max_age: the age in seconds after which an event is evicted,
+            or None if the window is only bounded by its size
+        :type max_age: float
+        :param clock: the function giving the timestamp of the events added
+            without one
+        :type clock: Callable[[], float]
+        :raises ValueError: if no bound is given or a bound is not positive
+        """
+        if max_size is None and max_age is None:
+            raise ValueError("Window needs a maximum size or a maximum age")
+        if max_size is not None and max_size < 1:
+            raise ValueError("Maximum size must be positive")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("Maximum age must be positive")
+
+        self.__window = TreeMultiset(generic_type)
+        self.__events = deque()
+        self.__max_size = max_size
+        self.__max_age = max_age
+        self.__clock = clock
+        self.__latest = None
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the type of the values of the window.
+
+        :return: the type of the values
+        :rtype: Type
+        """
+        return self.__window.object_type
+
+    @property
+    def max_size(self) -> Union[int, None]:
+        """
+        Getter method to retrieve the number of events of the window.
+
+        :return: the maximum size, or None if the window is not bounded by it
+        :rtype: Union[int, None]
+        """
+        return self.__max_size
+
+    @property
+    def max_age(self) -> Union[float, None]:
+        """
+        Getter method to retrieve the age in seconds after which an event is
+        evicted.
+
+        :return: the maximum age, or None if the window is not bounded by it
+        :rtype: Union[float, None]
+        """
+        return self.__max_age
+
+    def add(self, value: E, timestamp: float = None) -> List[E]:
+        """
+        Adds an event to the window and evicts the oldest events which are
+        out of it, in *O(log n)* time per event.
+
+        :param value: the value of the event
+        :type value: E
+        :param timestamp: the time of the event, not lower than the ones of
+            the previous events, or None to read the clock
+        :type timestamp: float
+        :return: the values of the evicted events, oldest first
+        :rtype: List[E]
+        :raises TypeError: if the given value does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        :raises ValueError: if the timestamp is lower than the one of the
+            newest event
+        """
+        if timestamp is None:
+            timestamp = self.__clock()
+        if self.__latest is not None and timestamp < self.__latest:
+            raise ValueError(f"Timestamp {timestamp} is lower than the "
+                             f"newest one {self.__latest}")
+
+        self.__window.add(value)
+        self.__events.append((timestamp, value))
+        self.__latest = timestamp
+        evicted = self.evict_expired(timestamp)
+        if self.__max_size is not None:
+            while len(self.__events) > self.__max_size:
+                evicted.append(self.__evict())
+        return evicted
+
+    def evict_expired(self, now: float = None) -> List[E]:
+        """
+        Evicts the events older than the maximum age at the given time, which
+        only happens otherwise when a new event is added.
+
+        :param now: the current time, or None to read the clock
+        :type now: float
+        :return: the values of the evicted events, oldest first
+        :rtype: List[E]
+        """
+        if self.__max_age is None:
+            return []
+        if now is None:
+            now = self.__clock()
+
+        evicted = []
+        while self.__events and now - self.__events[0][0] > self.__max_age:
+            evicted.append(self.__evict())
+        return evicted
+
+    def __evict(self) -> E:
+        """
+        Evicts the oldest event.
+
+        :return: the value of the evicted event
+        :rtype: E
+        """
+        _, value = self.__events.popleft()
+        self.__window.remove(value)
+        return value
+
+    def __check_not_empty(self) -> None:
+        """
+        Checks that the window holds some event.
+
+        :raises NoSuchElementException: if the window is empty
+        """
+        if not self.__events:
+            raise NoSuchElementException("Window is empty")
+
+    def quantile(self, q: float) -> E:
+        """
+        Returns the quantile of the values of the window, in *O(log n)* time.
+        For numbers, it is interpolated linearly between the two values
+        surrounding the position ``q * (size - 1)`` of the sorted window,
+        like :func:`statistics.quantiles` with the inclusive method; for other
+        types, it is the lower of both values.
+
+        :param q: the fraction of the values below the quantile, from 0 (the
+            least value) to 1 (the greatest one)
+        :type q: float
+        :return: the quantile
+        :rtype: E
+        :raises ValueError: if the fraction is not between 0 and 1
+        :raises NoSuchElementException: if the window is empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.__check_not_empty()
+
+        position = q * (len(self.__events) - 1)
+        index = math.floor(position)
+        lower = self.__window.select(index)
+        if index == position or not issubclass(self.object_type,
+                                               numbers.Number):
+            return lower
+
+        upper = self.__window.select(index + 1)
+        return lower + (upper - lower) * (position - index)
+
+    def median(self) -> E:
+        """
+        Returns the median of the values of the window (see
+        :meth:`quantile`), in *O(log n)* time.
+
+        :return: the median
+        :rtype: E
+        :raises NoSuchElementException: if the window is empty
+        """
+        return self.quantile(0.5)
+
+    def rank(self, value: E) -> int:
+        """
+        Returns the number of events of the window whose value is lower than
+        the given one, in *O(log n)* time.
+
+        :param value: value to compare
+        :type value: E
+        :return: the number of lower values
+        :rtype: int
+        """
+        return self.__window.rank(value)
+
+    def count(self, value: E) -> int:
+        """
+        Returns the number of events of the window with the given value.
+
+        :param value: the value
+        :type value: E
+        :return: its number of events
+        :rtype: int
+        """
+        return self.__window.count(value)
+
+    def first(self) -> E:
+        """
+        Returns the least value of the window.
+
+        :return: the least value
+        :rtype: E
+        :raises NoSuchElementException: if the window is empty
+        """
+        self.__check_not_empty()
+        return self.__window.select(0)
+
+    def last(self) -> E:
+        """
+        Returns the greatest value of the window.
+
+        :return: the greatest value
+        :rtype: E
+        :raises NoSuchElementException: if the window is empty
+        """
+        self.__check_not_empty()
+        return self.__window.select(-1)
+
+    def events(self) -> Iterator[Tuple[float, E]]:
+        """
+        Returns an iterator over the events of the window in arrival order.
+
+        :return: an iterator over the (timestamp, value) pairs
+        :rtype: Iterator[Tuple[float, E]]
+        """
+        return iter(self.__events)
+
+    def size(self) -> int:
+        """
+        Returns the number of events of the window.
+
+        :return: the number of events
+        :rtype: int
+        """
+        return len(self.__events)
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the window is empty or not.
+
+        :return: True if the window is empty else False
+        :rtype: bool
+        """
+        return not self.__events
+
+    def clear(self) -> None:
+        """
+        Evicts every event of the window and forgets the newest timestamp.
+        """
+        self.__window.clear()
+        self.__events.clear()
+        self.__latest = None
+
+    def __contains__(self, value: E) -> bool:
+        """
+        Check if some event of the window has the given value. This method is
+        called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: E
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        return self.__window.count(value) > 0
+
+    def __iter__(self) -> Iterator[E]:
+        """
+        Method to iterate over the values of the window in order, once per
+        event.
+
+        :return: an iterator over the sorted values
+        :rtype: Iterator[E]
+        """
+        return iter(self.__window)
+
+    def __len__(self) -> int:
+        """
+        Provides the number of events of the window. It is used with the
+        built-in method len().
+
+        :return: the number of events
+        :rtype: int
+        """
+        return len(self.__events)
+
+    def __str__(self) -> str:
+        """
+        Provides the string representation of the sorted values of the
+        window.
+
+        :return: the values between square brackets
+        :rtype: str
+        """
+        return f"[{', '.join(str(value) for value in self)}]"
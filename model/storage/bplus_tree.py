@@ -0,0 +1,845 @@
+"""
+bplus_tree module.
+
+This module provides a BPlusTreeSet class, a set of fixed-width numbers
+(``int`` or ``float``) stored in a paged B+tree inside a single file, so the
+set can grow beyond the available memory. Pages have a fixed size, the most
+recently used ones are kept in an LRU page cache of configurable size, and
+leaves are doubly linked for sequential scans in both directions.
+
+File layout: page 0 holds the metadata of the tree and every other page is
+either a leaf (sorted keys) or an internal page (sorted separator keys and
+child page numbers). The keys of the child at position ``i`` of an internal
+page are lower than its separator ``i`` and greater than or equal to its
+separator ``i - 1``.
+
+Removing keys never merges pages: underfull and empty leaves are kept in
+place and skipped by navigation and iteration.
+"""
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import *
+from model.tree_set import RedBlackTree
+from model.exceptions.tree_set_exceptions import *
+from model.storage.sorted_array_file import type_code
+
+MAGIC = b"BPTS"
+VERSION = 1
+
+_META = struct.Struct("<4sHcxIIIQ")
+_PAGE_HEADER = struct.Struct("<BxHII")
+_LEAF = 1
+_INTERNAL = 2
+_NO_PAGE = 0
+_ROOT_LEAF = 1
+
+
+class _Page:
+    """
+    In-memory copy of a page of a BPlusTreeSet file.
+    """
+
+    def __init__(self, page_id: int, kind: int, keys: List[Any] = None,
+                 children: List[int] = None, next_page: int = _NO_PAGE,
+                 previous_page: int = _NO_PAGE) -> None:
+        """
+        Constructor of the class.
+
+        :param page_id: the number of the page inside the file
+        :param kind: leaf or internal page
+        :param keys: the sorted keys of the page
+        :param children: the child page numbers of an internal page
+        :param next_page: the next leaf of a leaf page
+        :param previous_page: the previous leaf of a leaf page
+        """
+        self.page_id = page_id
+        self.kind = kind
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+        self.next_page = next_page
+        self.previous_page = previous_page
+
+    @property
+    def is_leaf(self) -> bool:
+        """
+        Checks if the page is a leaf.
+
+        :return: True if the page is a leaf else False
+        :rtype: bool
+        """
+        return self.kind == _LEAF
+
+    def encode(self, code: str, page_size: int) -> bytes:
+        """
+        Encodes the page.
+
+        :param code: the struct code of the keys
+        :type code: str
+        :param page_size: the size of the page
+        :type page_size: int
+        :return: the encoded page, padded to the page size
+        :rtype: bytes
+        """
+        content = _PAGE_HEADER.pack(self.kind, len(self.keys), self.next_page,
+                                    self.previous_page)
+        content += struct.pack(f"<{len(self.keys)}{code}", *self.keys)
+        if not self.is_leaf:
+            content += struct.pack(f"<{len(self.children)}I", *self.children)
+
+        return content.ljust(page_size, b"\x00")
+
+    @staticmethod
+    def decode(page_id: int, content: bytes, code: str) -> '_Page':
+        """
+        Decodes a page.
+
+        :param page_id: the number of the page
+        :type page_id: int
+        :param content: the encoded page
+        :type content: bytes
+        :param code: the struct code of the keys
+        :type code: str
+        :return: the decoded page
+        :rtype: _Page
+        """
+        kind, count, next_page, previous_page = _PAGE_HEADER.unpack_from(content)
+        keys_format = struct.Struct(f"<{count}{code}")
+        keys = list(keys_format.unpack_from(content, _PAGE_HEADER.size))
+        children = []
+        if kind == _INTERNAL:
+            children = list(struct.unpack_from(
+                f"<{count + 1}I", content, _PAGE_HEADER.size + keys_format.size))
+
+        return _Page(page_id, kind, keys, children, next_page, previous_page)
+
+
+class BPlusTreeSet:
+    """
+    Class that represents a set of numbers stored in a disk-resident B+tree.
+    It provides the navigation API of :class:`TreeSet` (``higher``, ``lower``,
+    ``ceiling``, ``floor``, ``first``, ``last`` and iteration) with
+    *O(log n)* page reads per lookup.
+
+    Modified pages stay in the page cache until they are evicted or
+    :meth:`flush` is called, so the set must be closed to persist them.
+    """
+
+    def __init__(self, path: str, generic_type: Type = None,
+                 page_size: int = 4096, cache_pages: int = 256) -> None:
+        """
+        Constructor of the class.
+        Opens the B+tree file at the given path, creating it if it does not
+        exist.
+
+        :param path: the path of the B+tree file
+        :type path: str
+        :param generic_type: the type of the keys, int or float. It is
+            mandatory when creating a new file
+        :type generic_type: Type
+        :param page_size: the size in bytes of the pages of a new file
+        :type page_size: int
+        :param cache_pages: the maximum number of pages kept in memory
+        :type cache_pages: int
+        :raises ValueError: if the file is not valid, its type does not match
+            the given one or the sizes are too small
+        :raises TypeError: if the given type cannot be stored
+        """
+        if cache_pages < 1:
+            raise ValueError("The page cache must hold at least one page")
+
+        self.__path = path
+        self.__cache = OrderedDict()
+        self.__cache_pages = cache_pages
+        self.__dirty = set()
+        self.__hits = 0
+        self.__misses = 0
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.__file = open(path, "r+b")
+            self.__read_meta(generic_type)
+        else:
+            if generic_type is None:
+                raise ValueError("The type is mandatory to create a new file")
+            if page_size < 64:
+                raise ValueError("Page size must be at least 64 bytes")
+
+            code = type_code(generic_type)
+            self.__object_type = int if code == b"q" else float
+            self.__code = code.decode()
+            self.__file = open(path, "w+b")
+            self.__page_size = page_size
+            self.__root = _ROOT_LEAF
+            self.__page_count = 2
+            self.__size = 0
+            self.__store(_Page(_ROOT_LEAF, _LEAF))
+            self.flush()
+
+        key_size = struct.calcsize(self.__code)
+        space = self.__page_size - _PAGE_HEADER.size
+        self.__leaf_capacity = space // key_size
+        self.__internal_capacity = (space - 4) // (key_size + 4)
+
+    def __read_meta(self, generic_type: Type) -> None:
+        """
+        Reads and validates the metadata page.
+
+        :param generic_type: the expected type of the keys, if any
+        :type generic_type: Type
+        :raises ValueError: if the file is not valid or its type does not
+            match the given one
+        """
+        content = self.__file.read(_META.size)
+        if len(content) < _META.size:
+            raise ValueError("File is too small to be a B+tree file")
+
+        magic, version, code, page_size, root, page_count, size = \
+            _META.unpack(content)
+        if magic != MAGIC:
+            raise ValueError("File is not a B+tree file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported B+tree file version {version}")
+
+        self.__object_type = int if code == b"q" else float
+        if generic_type is not None and type_code(generic_type) != code:
+            raise ValueError(
+                f"Stored set type is '{self.__object_type}' but "
+                f"'{generic_type}' was given")
+
+        self.__code = code.decode()
+        self.__page_size = page_size
+        self.__root = root
+        self.__page_count = page_count
+        self.__size = size
+
+    def __load(self, page_id: int) -> _Page:
+        """
+        Returns a page, reading it from the file if it is not cached.
+
+        :param page_id: the number of the page
+        :type page_id: int
+        :return: the page
+        :rtype: _Page
+        """
+        page = self.__cache.get(page_id)
+        if page is not None:
+            self.__hits += 1
+            self.__cache.move_to_end(page_id)
+            return page
+
+        self.__misses += 1
+        self.__file.seek(page_id * self.__page_size)
+        page = _Page.decode(page_id, self.__file.read(self.__page_size),
+                            self.__code)
+        self.__cache[page_id] = page
+        return page
+
+    def __store(self, page: _Page) -> None:
+        """
+        Marks a page as modified, keeping it cached until it is written.
+
+        :param page: the modified page
+        :type page: _Page
+        """
+        self.__cache[page.page_id] = page
+        self.__cache.move_to_end(page.page_id)
+        self.__dirty.add(page.page_id)
+
+    def __allocate(self, kind: int) -> _Page:
+        """
+        Allocates a new page at the end of the file.
+
+        :param kind: leaf or internal page
+        :type kind: int
+        :return: the new page
+        :rtype: _Page
+        """
+        page = _Page(self.__page_count, kind)
+        self.__page_count += 1
+        self.__store(page)
+        return page
+
+    def __write(self, page: _Page) -> None:
+        """
+        Writes a page into the file.
+
+        :param page: the page to write
+        :type page: _Page
+        """
+        self.__file.seek(page.page_id * self.__page_size)
+        self.__file.write(page.encode(self.__code, self.__page_size))
+        self.__dirty.discard(page.page_id)
+
+    def __evict(self) -> None:
+        """
+        Evicts the least recently used pages until the cache fits into its
+        capacity, writing the modified ones. It is only called between
+        operations, so the pages used by an operation are never evicted
+        while it runs.
+        """
+        while len(self.__cache) > self.__cache_pages:
+            page_id, page = self.__cache.popitem(last=False)
+            if page_id in self.__dirty:
+                self.__write(page)
+
+    def __find_leaf(self, value: Any) -> Tuple[_Page, List[Tuple[_Page, int]]]:
+        """
+        Descends from the root to the leaf where the given value belongs.
+
+        :param value: the value to look for
+        :type value: Any
+        :return: the leaf and the path of internal pages and child positions
+        :rtype: Tuple[_Page, List[Tuple[_Page, int]]]
+        """
+        path = []
+        page = self.__load(self.__root)
+        while not page.is_leaf:
+            index = bisect_right(page.keys, value)
+            path.append((page, index))
+            page = self.__load(page.children[index])
+
+        return page, path
+
+    def __insert_separator(self, path: List[Tuple[_Page, int]], key: Any,
+                           right: _Page) -> None:
+        """
+        Inserts a separator and its right page into the parent pages, splitting
+        them while they overflow.
+
+        :param path: the internal pages from the root to the split page
+        :type path: List[Tuple[_Page, int]]
+        :param key: the separator key
+        :type key: Any
+        :param right: the new right page
+        :type right: _Page
+        """
+        while path:
+            parent, index = path.pop()
+            parent.keys.insert(index, key)
+            parent.children.insert(index + 1, right.page_id)
+            self.__store(parent)
+            if len(parent.keys) <= self.__internal_capacity:
+                return
+
+            middle = len(parent.keys) // 2
+            right = self.__allocate(_INTERNAL)
+            key = parent.keys[middle]
+            right.keys = parent.keys[middle + 1:]
+            right.children = parent.children[middle + 1:]
+            parent.keys = parent.keys[:middle]
+            parent.children = parent.children[:middle + 1]
+
+        root = self.__allocate(_INTERNAL)
+        root.keys = [key]
+        root.children = [self.__root, right.page_id]
+        self.__root = root.page_id
+
+    def __next_leaf(self, leaf: _Page) -> Union[_Page, None]:
+        """
+        Returns the next non-empty leaf.
+
+        :param leaf: the current leaf
+        :type leaf: _Page
+        :return: the next non-empty leaf, or None if there is no such leaf
+        :rtype: Union[_Page, None]
+        """
+        while leaf.next_page != _NO_PAGE:
+            leaf = self.__load(leaf.next_page)
+            if leaf.keys:
+                return leaf
+
+        return None
+
+    def __previous_leaf(self, leaf: _Page) -> Union[_Page, None]:
+        """
+        Returns the previous non-empty leaf.
+
+        :param leaf: the current leaf
+        :type leaf: _Page
+        :return: the previous non-empty leaf, or None if there is no such leaf
+        :rtype: Union[_Page, None]
+        """
+        while leaf.previous_page != _NO_PAGE:
+            leaf = self.__load(leaf.previous_page)
+            if leaf.keys:
+                return leaf
+
+        return None
+
+    def __leftmost_leaf(self) -> _Page:
+        """
+        Returns the leftmost leaf of the tree.
+
+        :return: the leftmost leaf
+        :rtype: _Page
+        """
+        page = self.__load(self.__root)
+        while not page.is_leaf:
+            page = self.__load(page.children[0])
+
+        return page
+
+    def __rightmost_leaf(self) -> _Page:
+        """
+        Returns the rightmost leaf of the tree.
+
+        :return: the rightmost leaf
+        :rtype: _Page
+        """
+        page = self.__load(self.__root)
+        while not page.is_leaf:
+            page = self.__load(page.children[-1])
+
+        return page
+
+    def __successor(self, value: Any, inclusive: bool) -> Union[Any, None]:
+        """
+        Returns the least key greater than (or equal to) the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :param inclusive: if True an equal key is returned
+        :type inclusive: bool
+        :return: the found key, or None if there is no such key
+        :rtype: Union[Any, None]
+        """
+        leaf, _ = self.__find_leaf(value)
+        index = bisect_left(leaf.keys, value) if inclusive \
+            else bisect_right(leaf.keys, value)
+        if index < len(leaf.keys):
+            result = leaf.keys[index]
+        else:
+            leaf = self.__next_leaf(leaf)
+            result = leaf.keys[0] if leaf is not None else None
+
+        self.__evict()
+        return result
+
+    def __predecessor(self, value: Any, inclusive: bool) -> Union[Any, None]:
+        """
+        Returns the greatest key lower than (or equal to) the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :param inclusive: if True an equal key is returned
+        :type inclusive: bool
+        :return: the found key, or None if there is no such key
+        :rtype: Union[Any, None]
+        """
+        leaf, _ = self.__find_leaf(value)
+        index = bisect_right(leaf.keys, value) if inclusive \
+            else bisect_left(leaf.keys, value)
+        if index > 0:
+            result = leaf.keys[index - 1]
+        else:
+            leaf = self.__previous_leaf(leaf)
+            result = leaf.keys[-1] if leaf is not None else None
+
+        self.__evict()
+        return result
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the BPlusTreeSet object type.
+
+        :return: the BPlusTreeSet object type
+        :rtype: Type
+        """
+        return self.__object_type
+
+    @property
+    def path(self) -> str:
+        """
+        Getter method to retrieve the path of the B+tree file.
+
+        :return: the path of the B+tree file
+        :rtype: str
+        """
+        return self.__path
+
+    @property
+    def page_size(self) -> int:
+        """
+        Getter method to retrieve the size of the pages.
+
+        :return: the size of the pages in bytes
+        :rtype: int
+        """
+        return self.__page_size
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def add(self, value: Any) -> bool:
+        """
+        Inserts a new value into the BPlusTreeSet.
+
+        :param value: the value to insert
+        :type value: Any
+        :return: False if the value already exists in the set, True otherwise
+        :rtype: bool
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        leaf, path = self.__find_leaf(value)
+        index = bisect_left(leaf.keys, value)
+        if index < len(leaf.keys) and leaf.keys[index] == value:
+            self.__evict()
+            return False
+
+        leaf.keys.insert(index, value)
+        self.__store(leaf)
+        self.__size += 1
+
+        if len(leaf.keys) > self.__leaf_capacity:
+            middle = len(leaf.keys) // 2
+            right = self.__allocate(_LEAF)
+            right.keys = leaf.keys[middle:]
+            leaf.keys = leaf.keys[:middle]
+
+            right.previous_page = leaf.page_id
+            right.next_page = leaf.next_page
+            if leaf.next_page != _NO_PAGE:
+                following = self.__load(leaf.next_page)
+                following.previous_page = right.page_id
+                self.__store(following)
+            leaf.next_page = right.page_id
+
+            self.__insert_separator(path, right.keys[0], right)
+
+        self.__evict()
+        return True
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def remove(self, value: Any) -> bool:
+        """
+        Deletes a value from the BPlusTreeSet.
+
+        :param value: the value to delete
+        :type value: Any
+        :return: False if the value does not exist in the set, True otherwise
+        :rtype: bool
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        leaf, _ = self.__find_leaf(value)
+        index = bisect_left(leaf.keys, value)
+        if index == len(leaf.keys) or leaf.keys[index] != value:
+            self.__evict()
+            return False
+
+        del leaf.keys[index]
+        self.__store(leaf)
+        self.__size -= 1
+        self.__evict()
+        return True
+
+    def size(self) -> int:
+        """
+        Returns the size of the BPlusTreeSet.
+
+        :return: the size of the BPlusTreeSet
+        :rtype: int
+        """
+        return self.__size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the current BPlusTreeSet is empty or not.
+
+        :return: True if BPlusTreeSet is empty else False
+        :rtype: bool
+        """
+        return self.__size == 0
+
+    def contains(self, value: Any) -> bool:
+        """
+        Checks if a given value is contained into the BPlusTreeSet.
+
+        :param value: to check if it is contained
+        :type value: Any
+        :return: True if value is contained else False
+        :rtype: bool
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return value in self
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def higher(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the least element strictly greater than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least greater element, or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__successor(value, False)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def lower(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the greatest element strictly lower than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest lower element, or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__predecessor(value, False)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def ceiling(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the least element greater than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least element greater than or equal to the given value,
+            or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__successor(value, True)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def floor(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the greatest element lower than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest element lower than or equal to the given value,
+            or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__predecessor(value, True)
+
+    def first(self) -> Any:
+        """
+        Returns the lowest element contained in the BPlusTreeSet.
+
+        :return: the lowest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        leaf = self.__leftmost_leaf()
+        if not leaf.keys:
+            leaf = self.__next_leaf(leaf)
+        self.__evict()
+        return leaf.keys[0]
+
+    def last(self) -> Any:
+        """
+        Returns the greatest element contained in the BPlusTreeSet.
+
+        :return: the greatest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        leaf = self.__rightmost_leaf()
+        if not leaf.keys:
+            leaf = self.__previous_leaf(leaf)
+        self.__evict()
+        return leaf.keys[-1]
+
+    def range(self, low: Any, high: Any) -> Iterator[Any]:
+        """
+        Iterates in order over the elements between the given values, both
+        included, following the linked leaves.
+
+        :param low: the lowest value of the range
+        :type low: Any
+        :param high: the greatest value of the range
+        :type high: Any
+        :return: an iterator over the elements of the range
+        :rtype: Iterator[Any]
+        :raises TypeError: if the values do not match the instance type
+        :raises NullPointerException: if some value is None
+        """
+        for value in (low, high):
+            if value is None:
+                raise NullPointerException("Value cannot be None")
+            if not isinstance(value, self.object_type):
+                raise TypeError(
+                    f"Value type must be '{self.object_type}: {type(value)}'")
+
+        return self.__range(low, high)
+
+    def __range(self, low: Any, high: Any) -> Iterator[Any]:
+        """
+        Generator that scans the leaves from the given low value until a key
+        greater than the high value is found.
+
+        :param low: the lowest value of the range
+        :type low: Any
+        :param high: the greatest value of the range
+        :type high: Any
+        """
+        leaf, _ = self.__find_leaf(low)
+        keys = leaf.keys[bisect_left(leaf.keys, low):]
+
+        while True:
+            self.__evict()
+            for key in keys:
+                if key > high:
+                    return
+                yield key
+
+            if (leaf := self.__next_leaf(leaf)) is None:
+                return
+            keys = list(leaf.keys)
+
+    def iterator(self) -> Iterator[Any]:
+        """
+        Provides an iterator of the BPlusTreeSet elements.
+
+        :return: BPlusTreeSet elements iterator
+        :rtype: Iterator[Any]
+        """
+        return iter(self)
+
+    def descending_iterator(self) -> Iterator[Any]:
+        """
+        Provides a descending iterator of the BPlusTreeSet elements.
+
+        :return: BPlusTreeSet elements descending iterator
+        :rtype: Iterator[Any]
+        """
+        return iter(reversed(self))
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Returns the statistics of the page cache.
+
+        :return: the hits, misses, cached pages and capacity of the cache
+        :rtype: Dict[str, int]
+        """
+        return {"hits": self.__hits, "misses": self.__misses,
+                "pages": len(self.__cache), "capacity": self.__cache_pages}
+
+    def flush(self) -> None:
+        """
+        Writes every modified page and the metadata into the file and syncs
+        it to disk.
+        """
+        for page_id in sorted(self.__dirty):
+            self.__write(self.__cache[page_id])
+
+        self.__file.seek(0)
+        self.__file.write(_META.pack(
+            MAGIC, VERSION, self.__code.encode(), self.__page_size,
+            self.__root, self.__page_count, self.__size
+        ).ljust(self.__page_size, b"\x00"))
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+
+    def close(self) -> None:
+        """
+        Flushes and closes the BPlusTreeSet file.
+        """
+        if self.__file.closed:
+            return
+
+        self.flush()
+        self.__file.close()
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if the given value is contained in the BPlusTreeSet or not.
+        This method is called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: Any
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        leaf, _ = self.__find_leaf(value)
+        index = bisect_left(leaf.keys, value)
+        self.__evict()
+        return index < len(leaf.keys) and leaf.keys[index] == value
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Method to iterate over the BPlusTreeSet following the linked leaves.
+
+        :return: an iterator over the BPlusTreeSet instance
+        :rtype: Iterator[Any]
+        """
+        leaf = self.__leftmost_leaf()
+        while leaf is not None:
+            keys = list(leaf.keys)
+            self.__evict()
+            yield from keys
+            leaf = self.__next_leaf(leaf)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Method to iterate reversely over the BPlusTreeSet following the linked
+        leaves.
+
+        :return: a reversed iterator over the BPlusTreeSet instance
+        :rtype: Iterator[Any]
+        """
+        leaf = self.__rightmost_leaf()
+        while leaf is not None:
+            keys = list(reversed(leaf.keys))
+            self.__evict()
+            yield from keys
+            leaf = self.__previous_leaf(leaf)
+
+    def __len__(self) -> int:
+        """
+        Provides the length of the BPlusTreeSet. It is used with the built-in
+        method len().
+
+        :return: the length of the BPlusTreeSet
+        :rtype: int
+        """
+        return self.__size
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the current BPlusTreeSet.
+
+        :return: BPlusTreeSet string representation
+        :rtype: str
+        """
+        return f"{[value for value in self]}"
+
+    def __enter__(self) -> 'BPlusTreeSet':
+        """
+        Enters the runtime context of the BPlusTreeSet.
+
+        :return: the BPlusTreeSet itself
+        :rtype: BPlusTreeSet
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Exits the runtime context of the BPlusTreeSet, closing it.
+        """
+        self.close()
@@ -0,0 +1,823 @@
+"""
+lsm_tree_set module.
+
+This module provides an LSMTreeSet class, a write-optimized set of numbers
+(``int`` or ``float``) structured as a log-structured merge tree. Insertions
+and removals are blind writes into a small in-memory dict (the memtable): they
+do not check whether the value is already stored, and the duplicates are
+resolved when the memtable is flushed into an immutable sorted run, and when
+the runs are merged. Runs are memory-mapped sorted array files, so reading
+them costs binary searches, and they are merged together by a compaction, in
+a background thread by default, when there are too many of them.
+
+Removals are recorded as tombstones, which hide the value in the older runs
+until a compaction discards both. Queries look at the memtable first and then
+at the runs from the newest to the oldest one: the first source knowing a value
+decides whether it is contained or not.
+
+The manifest stores the number of values of the runs, updated by the flushes
+(compactions do not change it), and the size of the set adds the values of
+the memtable that the runs do not contain, minus the tombstones hiding one of
+their values, found when the size is requested or the memtable flushed.
+
+Directory layout::
+
+    MANIFEST                 the runs from the newest to the oldest one
+    run-<number>.live        values inserted by the run
+    run-<number>.tomb        values removed by the run (tombstones)
+"""
+import heapq
+import json
+import os
+import threading
+from typing import *
+from model.tree_set import RedBlackTree, TreeSet
+from model.exceptions.tree_set_exceptions import *
+from model.storage.sorted_array_file import (MappedTreeSet, type_code,
+                                             write_sorted_array)
+
+MANIFEST_FILE = "MANIFEST"
+VERSION = 1
+
+
+class _Run:
+    """
+    Immutable sorted run of an LSMTreeSet: the values it inserted and the
+    values it removed, both memory-mapped.
+    """
+
+    def __init__(self, directory: str, number: int) -> None:
+        """
+        Constructor of the class.
+        Maps the files of the run.
+
+        :param directory: the directory of the LSMTreeSet
+        :param number: the number of the run
+        """
+        self.number = number
+        self.live = MappedTreeSet(_run_path(directory, number, "live"))
+        self.tombstones = MappedTreeSet(_run_path(directory, number, "tomb"))
+
+    def lookup(self, value: Any) -> Union[bool, None]:
+        """
+        Looks for a value in the run.
+
+        :param value: the value to look for
+        :return: True if the run inserted it, False if the run removed it and
+            None if the run does not know it
+        """
+        if value in self.live:
+            return True
+        if value in self.tombstones:
+            return False
+        return None
+
+    def lookup_sorted(self, values: Sequence[Any]) -> List[Union[bool, None]]:
+        """
+        Looks for several values in the run in a single pass.
+
+        :param values: the values to look for, in ascending order
+        :return: for every value, True if the run inserted it, False if the
+            run removed it and None if the run does not know it
+        """
+        return [True if live else False if removed else None
+                for live, removed in zip(self.live.contains_sorted(values),
+                                         self.tombstones.contains_sorted(
+                                             values))]
+
+
+def _run_path(directory: str, number: int, kind: str) -> str:
+    """
+    Returns the path of a run file.
+
+    :param directory: the directory of the LSMTreeSet
+    :type directory: str
+    :param number: the number of the run
+    :type number: int
+    :param kind: "live" or "tomb"
+    :type kind: str
+    :return: the path of the run file
+    :rtype: str
+    """
+    return os.path.join(directory, f"run-{number:08d}.{kind}")
+
+
+class LSMTreeSet:
+    """
+    Class that represents a write-optimized set of numbers based on a
+    log-structured merge tree. It provides the navigation API of
+    :class:`TreeSet`, merging the memtable and every sorted run.
+
+    The memtable lives in memory: it is written into a run when it reaches
+    ``memtable_limit`` values, when :meth:`flush` is called and when the set
+    is closed. Writes do not read the runs, so :meth:`add` and :meth:`remove`
+    cost *O(1)* besides the flushes, while the first query after some writes
+    sorts the memtable.
+    """
+
+    def __init__(self, directory: str, generic_type: Type,
+                 memtable_limit: int = 10000, max_runs: int = 4,
+                 background_compaction: bool = True) -> None:
+        """
+        Constructor of the class.
+        Opens the LSMTreeSet stored in the given directory, creating it if it
+        does not exist.
+
+        :param directory: the directory holding the runs
+        :type directory: str
+        :param generic_type: the type of the values, int or float
+        :type generic_type: Type
+        :param memtable_limit: number of values (insertions and tombstones) of
+            the memtable that triggers a flush
+        :type memtable_limit: int
+        :param max_runs: number of runs that triggers a compaction
+        :type max_runs: int
+        :param background_compaction: if True compactions run in a background
+            thread, otherwise they block the flush that triggered them
+        :type background_compaction: bool
+        :raises ValueError: if the limits are not positive or the stored set
+            has a different type
+        :raises TypeError: if the given type cannot be stored
+        """
+        if memtable_limit < 1 or max_runs < 1:
+            raise ValueError("Memtable limit and max runs must be positive")
+
+        code = type_code(generic_type)
+        self.__object_type = int if code == b"q" else float
+        self.__directory = directory
+        self.__memtable_limit = memtable_limit
+        self.__max_runs = max_runs
+        self.__background_compaction = background_compaction
+        self.__memtable = {}
+        self.__view = None
+        self.__pending = 0
+        self.__runs = []
+        self.__next_run = 0
+        self.__disk_size = 0
+        self.__lock = threading.RLock()
+        self.__compaction = None
+
+        os.makedirs(directory, exist_ok=True)
+        self.__load_manifest()
+
+    def __load_manifest(self) -> None:
+        """
+        Loads the manifest and maps its runs, deleting the files of the runs
+        it does not reference (left by an interrupted flush or compaction).
+
+        :raises ValueError: if the stored set has a different type
+        """
+        manifest = os.path.join(self.__directory, MANIFEST_FILE)
+        if os.path.exists(manifest):
+            with open(manifest) as file:
+                content = json.load(file)
+
+            if content["version"] != VERSION:
+                raise ValueError(
+                    f"Unsupported manifest version {content['version']}")
+            if content["type"] != self.__object_type.__name__:
+                raise ValueError(
+                    f"Stored set type is '{content['type']}' but "
+                    f"'{self.__object_type.__name__}' was given")
+
+            self.__runs = [_Run(self.__directory, number)
+                           for number in content["runs"]]
+            self.__next_run = content["next_run"]
+            self.__disk_size = content["size"]
+
+        referenced = {os.path.basename(_run_path(self.__directory, run.number,
+                                                 kind))
+                      for run in self.__runs for kind in ("live", "tomb")}
+        for name in os.listdir(self.__directory):
+            if name.startswith("run-") and name not in referenced:
+                os.remove(os.path.join(self.__directory, name))
+
+    def __write_manifest(self) -> None:
+        """
+        Atomically replaces the manifest with the current runs and the number
+        of values they contain, which does not count the memtable.
+        """
+        manifest = os.path.join(self.__directory, MANIFEST_FILE)
+        temporary = f"{manifest}.tmp"
+        with open(temporary, "w") as file:
+            json.dump({
+                "version": VERSION,
+                "type": self.__object_type.__name__,
+                "runs": [run.number for run in self.__runs],
+                "next_run": self.__next_run,
+                "size": self.__disk_size,
+            }, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, manifest)
+
+    def __write_run(self, live: Iterable[Any],
+                    tombstones: Iterable[Any]) -> _Run:
+        """
+        Writes a new run with the given sorted values.
+
+        :param live: the sorted inserted values
+        :type live: Iterable[Any]
+        :param tombstones: the sorted removed values
+        :type tombstones: Iterable[Any]
+        :return: the new run
+        :rtype: _Run
+        """
+        with self.__lock:
+            number = self.__next_run
+            self.__next_run += 1
+
+        write_sorted_array(_run_path(self.__directory, number, "live"),
+                           self.__object_type, live)
+        write_sorted_array(_run_path(self.__directory, number, "tomb"),
+                           self.__object_type, tombstones)
+        return _Run(self.__directory, number)
+
+    def __lookup(self, value: Any) -> bool:
+        """
+        Checks if a value is contained, looking at the memtable and then at
+        the runs from the newest to the oldest one.
+
+        :param value: the value to look for
+        :type value: Any
+        :return: True if the value is contained else False
+        :rtype: bool
+        """
+        if (contained := self.__memtable.get(value)) is not None:
+            return contained
+
+        return self.__stored(value)
+
+    def __stored(self, value: Any) -> bool:
+        """
+        Checks if a value is contained in the runs, from the newest to the
+        oldest one.
+
+        :param value: the value to look for
+        :type value: Any
+        :return: True if the runs contain the value else False
+        :rtype: bool
+        """
+        for run in self.__runs:
+            if (found := run.lookup(value)) is not None:
+                return found
+
+        return False
+
+    def __pending_size(self) -> int:
+        """
+        Returns the difference the memtable makes to the number of values of
+        the runs, looking up its sorted values in every run in a single pass
+        once after it changed.
+
+        :return: the number of values of the memtable which the runs do not
+            contain, minus the number of tombstones hiding a value of the runs
+        :rtype: int
+        """
+        if self.__pending is None:
+            unknown = sorted(self.__memtable)
+            stored = {}
+            for run in self.__runs:
+                if not unknown:
+                    break
+
+                remaining = []
+                for value, found in zip(unknown, run.lookup_sorted(unknown)):
+                    if found is None:
+                        remaining.append(value)
+                    else:
+                        stored[value] = found
+                unknown = remaining
+
+            self.__pending = sum(contained - stored.get(value, False)
+                                 for value, contained
+                                 in self.__memtable.items())
+        return self.__pending
+
+    def __memtable_values(self) -> Tuple[List[Any], List[Any]]:
+        """
+        Returns the values and the tombstones of the memtable, sorted.
+
+        :return: the inserted values and the removed ones
+        :rtype: Tuple[List[Any], List[Any]]
+        """
+        entries = sorted(self.__memtable.items())
+        return tuple([value for value, contained in entries
+                      if contained is state] for state in (True, False))
+
+    def __memtable_view(self) -> Tuple[TreeSet, TreeSet]:
+        """
+        Returns the values and the tombstones of the memtable as sorted sets
+        for the queries, built again after the memtable changed.
+
+        :return: the inserted values and the removed ones
+        :rtype: Tuple[TreeSet, TreeSet]
+        """
+        if self.__view is None:
+            self.__view = tuple(TreeSet(self.__object_type, values,
+                                        backend="blocked")
+                                for values in self.__memtable_values())
+        return self.__view
+
+    def __sources(self) -> List[Any]:
+        """
+        Returns the sets holding inserted values, from the newest one.
+
+        :return: the memtable and the live values of every run
+        :rtype: List[Any]
+        """
+        return [self.__memtable_view()[0]] + [run.live for run in self.__runs]
+
+    def __navigate(self, value: Any, method: str,
+                   strict: str) -> Union[Any, None]:
+        """
+        Finds the closest contained value in one direction: the closest
+        inserted value of every source is a candidate, and a candidate hidden
+        by a newer tombstone makes the search continue past it.
+
+        :param value: value to compare
+        :type value: Any
+        :param method: "ceiling", "higher", "floor" or "lower"
+        :type method: str
+        :param strict: the strict version of the method, used to continue
+        :type strict: str
+        :return: the found value, or None if there is no such value
+        :rtype: Union[Any, None]
+        """
+        ascending = method in ("ceiling", "higher")
+        with self.__lock:
+            while True:
+                candidates = [candidate for source in self.__sources()
+                              if (candidate := getattr(source, method)(value))
+                              is not None]
+                if not candidates:
+                    return None
+
+                value = min(candidates) if ascending else max(candidates)
+                if self.__lookup(value):
+                    return value
+                method = strict
+
+    def __merge(self, sources: List[Tuple[Iterable[Any], Iterable[Any]]]) \
+            -> Iterator[Tuple[Any, bool]]:
+        """
+        Merges sorted sources of inserted and removed values. Every value is
+        yielded once, with the state given by the newest source knowing it.
+
+        :param sources: pairs of inserted and removed values, from the newest
+        :type sources: List[Tuple[Iterable[Any], Iterable[Any]]]
+        :return: an iterator of values and whether they are contained
+        :rtype: Iterator[Tuple[Any, bool]]
+        """
+        def tag(values: Iterable[Any], priority: int,
+                contained: bool) -> Iterator[Tuple[Any, int, bool]]:
+            for value in values:
+                yield value, priority, contained
+
+        streams = []
+        for priority, (live, tombstones) in enumerate(sources):
+            streams.append(tag(live, priority, True))
+            streams.append(tag(tombstones, priority, False))
+
+        previous = None
+        for value, _, contained in heapq.merge(*streams):
+            if previous is None or value != previous[0]:
+                previous = (value,)
+                yield value, contained
+
+    def __flush(self) -> None:
+        """
+        Writes the memtable into a new run if it is not empty and starts a
+        compaction if there are too many runs.
+        """
+        if not self.__memtable:
+            return
+
+        live, tombstones = self.__memtable_values()
+        pending = self.__pending_size()
+        run = self.__write_run(live, tombstones)
+        self.__runs.insert(0, run)
+        self.__disk_size += pending
+        self.__memtable = {}
+        self.__view = None
+        self.__pending = 0
+        self.__write_manifest()
+
+        if len(self.__runs) > self.__max_runs:
+            if self.__background_compaction:
+                if self.__compaction is None \
+                        or not self.__compaction.is_alive():
+                    self.__compaction = threading.Thread(target=self.__compact,
+                                                         daemon=True)
+                    self.__compaction.start()
+            else:
+                self.__compact()
+
+    def __compact(self) -> None:
+        """
+        Merges every run existing when it starts into a single run. The merged
+        run is the oldest one, so its tombstones are discarded. Runs flushed
+        while merging stay on top of it.
+        """
+        with self.__lock:
+            runs = list(self.__runs)
+        if len(runs) < 2:
+            return
+
+        merged = self.__merge([(run.live, run.tombstones) for run in runs])
+        run = self.__write_run((value for value, contained in merged
+                                if contained), ())
+
+        with self.__lock:
+            self.__runs = self.__runs[:len(self.__runs) - len(runs)] + [run]
+            self.__write_manifest()
+
+        for old in runs:
+            for kind in ("live", "tomb"):
+                try:
+                    os.remove(_run_path(self.__directory, old.number, kind))
+                except OSError:
+                    pass
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the LSMTreeSet object type.
+
+        :return: the LSMTreeSet object type
+        :rtype: Type
+        """
+        return self.__object_type
+
+    @property
+    def directory(self) -> str:
+        """
+        Getter method to retrieve the directory of the LSMTreeSet.
+
+        :return: the directory of the LSMTreeSet
+        :rtype: str
+        """
+        return self.__directory
+
+    def run_count(self) -> int:
+        """
+        Returns the number of sorted runs.
+
+        :return: the number of sorted runs
+        :rtype: int
+        """
+        return len(self.__runs)
+
+    def __write(self, value: Any, contained: bool) -> None:
+        """
+        Records the state of a value in the memtable, without looking for it
+        in the runs, and flushes the memtable if it is full.
+
+        :param value: the inserted or removed value
+        :type value: Any
+        :param contained: True for an insertion, False for a removal
+        :type contained: bool
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        if value is None:
+            raise NullPointerException("Value cannot be None")
+        if not isinstance(value, self.__object_type):
+            raise TypeError(
+                f"Value type must be '{self.__object_type}: {type(value)}'")
+
+        with self.__lock:
+            self.__memtable[value] = contained
+            self.__view = self.__pending = None
+            if len(self.__memtable) >= self.__memtable_limit:
+                self.__flush()
+
+    def add(self, value: Any) -> None:
+        """
+        Inserts a value into the memtable. The write is blind: it does not
+        check whether the value already exists, so it does not tell it.
+
+        :param value: the value to insert
+        :type value: Any
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        self.__write(value, True)
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes a value, recording a tombstone in the memtable. The write is
+        blind: it does not check whether the value exists, so it does not tell
+        it.
+
+        :param value: the value to delete
+        :type value: Any
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        self.__write(value, False)
+
+    def size(self) -> int:
+        """
+        Returns the size of the LSMTreeSet, looking up in the runs the values
+        of the memtable written since the last call.
+
+        :return: the size of the LSMTreeSet
+        :rtype: int
+        """
+        with self.__lock:
+            return self.__disk_size + self.__pending_size()
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the current LSMTreeSet is empty or not.
+
+        :return: True if LSMTreeSet is empty else False
+        :rtype: bool
+        """
+        return self.size() == 0
+
+    def contains(self, value: Any) -> bool:
+        """
+        Checks if a given value is contained into the LSMTreeSet.
+
+        :param value: to check if it is contained
+        :type value: Any
+        :return: True if value is contained else False
+        :rtype: bool
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return value in self
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def higher(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the least element strictly greater than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least greater element, or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__navigate(value, "higher", "higher")
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def lower(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the greatest element strictly lower than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest lower element, or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__navigate(value, "lower", "lower")
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def ceiling(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the least element greater than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least element greater than or equal to the given value,
+            or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__navigate(value, "ceiling", "higher")
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def floor(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the greatest element lower than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest element lower than or equal to the given value,
+            or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        """
+        return self.__navigate(value, "floor", "lower")
+
+    def first(self) -> Any:
+        """
+        Returns the lowest element contained in the LSMTreeSet.
+
+        :return: the lowest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        return next(iter(self))
+
+    def last(self) -> Any:
+        """
+        Returns the greatest element contained in the LSMTreeSet.
+
+        :return: the greatest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        return next(reversed(self))
+
+    def range(self, low: Any, high: Any) -> Iterator[Any]:
+        """
+        Iterates in order over the elements between the given values, both
+        included.
+
+        :param low: the lowest value of the range
+        :type low: Any
+        :param high: the greatest value of the range
+        :type high: Any
+        :return: an iterator over the elements of the range
+        :rtype: Iterator[Any]
+        :raises TypeError: if the values do not match the instance type
+        :raises NullPointerException: if some value is None
+        """
+        for value in (low, high):
+            if value is None:
+                raise NullPointerException("Value cannot be None")
+            if not isinstance(value, self.object_type):
+                raise TypeError(
+                    f"Value type must be '{self.object_type}: {type(value)}'")
+
+        return self.__range(low, high)
+
+    def __range(self, low: Any, high: Any) -> Iterator[Any]:
+        """
+        Generator that walks the contained values from the given low value
+        until a value greater than the high value is found.
+
+        :param low: the lowest value of the range
+        :type low: Any
+        :param high: the greatest value of the range
+        :type high: Any
+        """
+        value = self.ceiling(low)
+        while value is not None and value <= high:
+            yield value
+            value = self.higher(value)
+
+    def flush(self) -> None:
+        """
+        Writes the memtable into a new sorted run.
+        """
+        with self.__lock:
+            self.__flush()
+
+    def compact(self) -> None:
+        """
+        Flushes the memtable and merges every run into a single one, blocking
+        until it finishes.
+        """
+        self.wait_for_compaction()
+        with self.__lock:
+            self.__flush()
+        self.wait_for_compaction()
+        self.__compact()
+
+    def wait_for_compaction(self) -> None:
+        """
+        Waits until the running background compaction, if any, finishes.
+        """
+        compaction = self.__compaction
+        if compaction is not None:
+            compaction.join()
+
+    def close(self) -> None:
+        """
+        Flushes the memtable and waits for the background compaction.
+        """
+        self.flush()
+        self.wait_for_compaction()
+
+    def iterator(self) -> Iterator[Any]:
+        """
+        Provides an iterator of the LSMTreeSet elements.
+
+        :return: LSMTreeSet elements iterator
+        :rtype: Iterator[Any]
+        """
+        return iter(self)
+
+    def descending_iterator(self) -> Iterator[Any]:
+        """
+        Provides a descending iterator of the LSMTreeSet elements.
+
+        :return: LSMTreeSet elements descending iterator
+        :rtype: Iterator[Any]
+        """
+        return iter(reversed(self))
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if the given value is contained in the LSMTreeSet or not.
+        This method is called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: Any
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        with self.__lock:
+            return self.__lookup(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Method to iterate over the LSMTreeSet merging the memtable and every
+        run. It iterates over a snapshot taken when it starts.
+
+        :return: an iterator over the LSMTreeSet instance
+        :rtype: Iterator[Any]
+        """
+        with self.__lock:
+            sources = [self.__memtable_values()] + \
+                      [(run.live, run.tombstones) for run in self.__runs]
+
+        for value, contained in self.__merge(sources):
+            if contained:
+                yield value
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Method to iterate reversely over the LSMTreeSet merging the memtable
+        and every run.
+
+        :return: a reversed iterator over the LSMTreeSet instance
+        :rtype: Iterator[Any]
+        """
+        value = self.__last_candidate()
+        while value is not None:
+            yield value
+            value = self.lower(value)
+
+    def __last_candidate(self) -> Union[Any, None]:
+        """
+        Returns the greatest contained value.
+
+        :return: the greatest contained value, or None if the set is empty
+        :rtype: Union[Any, None]
+        """
+        with self.__lock:
+            candidates = [source.last() for source in self.__sources()
+                          if not source.is_empty()]
+            if not candidates:
+                return None
+
+            value = max(candidates)
+            return value if self.__lookup(value) \
+                else self.__navigate(value, "lower", "lower")
+
+    def __len__(self) -> int:
+        """
+        Provides the length of the LSMTreeSet. It is used with the built-in
+        method len().
+
+        :return: the length of the LSMTreeSet
+        :rtype: int
+        """
+        return self.size()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the current LSMTreeSet.
+
+        :return: LSMTreeSet string representation
+        :rtype: str
+        """
+        return f"{[value for value in self]}"
+
+    def __enter__(self) -> 'LSMTreeSet':
+        """
+        Enters the runtime context of the LSMTreeSet.
+
+        :return: the LSMTreeSet itself
+        :rtype: LSMTreeSet
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Exits the runtime context of the LSMTreeSet, closing it.
+        """
+        self.close()
@@ -0,0 +1,500 @@
+"""
+sorted_array_file module.
+
+This module provides the versioned binary format used to persist a TreeSet of
+fixed-width numbers (``int`` or ``float``) as a sorted array, and a
+MappedTreeSet class, which is a read-only set that answers its queries directly
+from a memory-mapped file using binary search.
+
+File layout (little-endian)::
+
+    magic (4 bytes) | version (uint16) | type code (1 byte) | pad (1 byte)
+    | count (uint64) | count * item (int64 or float64)
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import *
+from model.tree_set import RedBlackTree, TreeSet
+from model.exceptions.tree_set_exceptions import *
+
+MAGIC = b"TSET"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHcxQ")
+_TYPE_CODES = {int: b"q", float: b"d"}
+_CODE_TYPES = {code: generic_type for generic_type, code in _TYPE_CODES.items()}
+
+
+def type_code(generic_type: Type) -> bytes:
+    """
+    Returns the item code used to store values of the given type.
+
+    :param generic_type: the type of the values to store
+    :type generic_type: Type
+    :return: the struct code of the type
+    :rtype: bytes
+    :raises TypeError: if the type cannot be stored with a fixed width
+    """
+    for stored_type, code in _TYPE_CODES.items():
+        if issubclass(generic_type, stored_type):
+            return code
+
+    raise TypeError(
+        f"Only int and float values can be stored but {generic_type} was given")
+
+
+def write_sorted_array(path: str, generic_type: Type,
+                       values: Iterable[Any]) -> int:
+    """
+    Writes the given sorted values into a sorted array file. The file is
+    written next to its destination and then renamed, so a reader never
+    observes a partially written file.
+
+    :param path: destination of the file
+    :type path: str
+    :param generic_type: type of the values
+    :type generic_type: Type
+    :param values: values to write, already sorted and without duplicates
+    :type values: Iterable[Any]
+    :return: the number of written values
+    :rtype: int
+    :raises TypeError: if the type cannot be stored with a fixed width
+    :raises OverflowError: if an int value does not fit into 64 bits
+    """
+    code = type_code(generic_type)
+    items = array(code.decode(), values)
+    if sys.byteorder != "little":
+        items.byteswap()
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, code, len(items)))
+        items.tofile(file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+    return len(items)
+
+
+def read_header(buffer: Any) -> Tuple[Type, int]:
+    """
+    Reads and validates the header of a sorted array file.
+
+    :param buffer: the buffer holding the file content
+    :type buffer: Any
+    :return: the type of the stored values and their number
+    :rtype: Tuple[Type, int]
+    :raises ValueError: if the buffer does not hold a valid sorted array file
+    """
+    if len(buffer) < _HEADER.size:
+        raise ValueError("File is too small to be a sorted array file")
+
+    magic, version, code, count = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("File is not a sorted array file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported sorted array file version {version}")
+    if code not in _CODE_TYPES:
+        raise ValueError(f"Unknown item type code {code}")
+    if len(buffer) < _HEADER.size + count * struct.calcsize(code.decode()):
+        raise ValueError("File is truncated")
+
+    return _CODE_TYPES[code], count
+
+
+class _SwappedItems:
+    """
+    Sequence of items stored in little-endian order, used when the running
+    machine is big-endian and the buffer cannot be cast directly.
+    """
+
+    def __init__(self, buffer: Any, code: bytes, count: int) -> None:
+        """
+        Constructor of the class.
+
+        :param buffer: the buffer holding the items
+        :param code: the struct code of the items
+        :param count: the number of items
+        """
+        self.__buffer = buffer
+        self.__item = struct.Struct(f"<{code.decode()}")
+        self.__count = count
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Returns the item stored at the given index.
+
+        :param index: the index of the item
+        :type index: int
+        :return: the stored item
+        :rtype: Any
+        :raises IndexError: if the index is out of range
+        """
+        if not 0 <= index < self.__count:
+            raise IndexError("Index out of range")
+        return self.__item.unpack_from(self.__buffer,
+                                       index * self.__item.size)[0]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items.
+
+        :return: the number of items
+        :rtype: int
+        """
+        return self.__count
+
+    def release(self) -> None:
+        """
+        Releases the underlying buffer.
+        """
+        self.__buffer.release()
+
+
+class MappedTreeSet:
+    """
+    Class that represents a read-only set of numbers backed by a memory-mapped
+    sorted array file. Opening it is *O(1)*, lookups are *O(log n)* binary
+    searches over the mapped pages, and the pages are shared by every process
+    mapping the same file.
+
+    Any attempt to modify it raises an UnsupportedOperationException.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Constructor of the class.
+        Maps the given sorted array file in read-only mode.
+
+        :param path: the path of the file written by :meth:`TreeSet.save`
+        :type path: str
+        :raises ValueError: if the file is not a valid sorted array file
+        """
+        with open(path, "rb") as file:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.__object_type, self.__size = read_header(self.__mmap)
+        except ValueError:
+            self.__mmap.close()
+            raise
+
+        code = _TYPE_CODES[self.__object_type]
+        end = _HEADER.size + self.__size * struct.calcsize(code.decode())
+        buffer = memoryview(self.__mmap)[_HEADER.size:end]
+        if sys.byteorder == "little":
+            self.__items = buffer.cast(code.decode())
+        else:
+            self.__items = _SwappedItems(buffer, code, self.__size)
+        self.__path = path
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the MappedTreeSet object type.
+
+        :return: the MappedTreeSet object type
+        :rtype: Type
+        """
+        return self.__object_type
+
+    @property
+    def path(self) -> str:
+        """
+        Getter method to retrieve the path of the mapped file.
+
+        :return: the path of the mapped file
+        :rtype: str
+        """
+        return self.__path
+
+    def close(self) -> None:
+        """
+        Unmaps the file. The MappedTreeSet cannot be used afterwards.
+        """
+        if self.__mmap.closed:
+            return
+
+        self.__items.release()
+        self.__mmap.close()
+
+    def size(self) -> int:
+        """
+        Returns the size of the MappedTreeSet.
+
+        :return: the size of the MappedTreeSet
+        :rtype: int
+        """
+        return self.__size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the current MappedTreeSet is empty or not.
+
+        :return: True if MappedTreeSet is empty else False
+        :rtype: bool
+        """
+        return self.__size == 0
+
+    def contains(self, value: Any) -> bool:
+        """
+        Checks if a given value is contained into the MappedTreeSet.
+
+        :param value: to check if it is contained
+        :type value: Any
+        :return: True if value is contained else False
+        :rtype: bool
+        :raises TypeError: if the given value does not match the instance type
+        :raises NullPointerException: if the given value is None
+        """
+        return value in self
+
+    def contains_sorted(self, values: Sequence[Any]) -> List[bool]:
+        """
+        Checks if several values are contained in a single pass, every binary
+        search starting from the position of the previous value.
+
+        :param values: the values to check, of the type of the MappedTreeSet
+            and in ascending order
+        :type values: Sequence[Any]
+        :return: for every value, True if it is contained else False
+        :rtype: List[bool]
+        """
+        items, size = self.__items, self.__size
+        contained, index = [], 0
+        for value in values:
+            index = bisect_left(items, value, index)
+            contained.append(index < size and items[index] == value)
+        return contained
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def rank(self, value: Any) -> int:
+        """
+        Returns the number of elements strictly lower than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the number of elements lower than the given value
+        :rtype: int
+        :raises TypeError: if the given value does not match the instance type
+        :raises NullPointerException: if the given value is None
+        """
+        return bisect_left(self.__items, value)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def higher(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the least element strictly greater than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least greater element, or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the given value does not match the instance type
+        :raises NullPointerException: if the given value is None
+        """
+        index = bisect_right(self.__items, value)
+        return self.__items[index] if index < self.__size else None
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def lower(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the greatest element strictly lower than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest lower element, or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the given value does not match the instance type
+        :raises NullPointerException: if the given value is None
+        """
+        index = bisect_left(self.__items, value)
+        return self.__items[index - 1] if index > 0 else None
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def ceiling(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the least element greater than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least element greater than or equal to the given value,
+            or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the given value does not match the instance type
+        :raises NullPointerException: if the given value is None
+        """
+        index = bisect_left(self.__items, value)
+        return self.__items[index] if index < self.__size else None
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def floor(self, value: Any) -> Union[Any, None]:
+        """
+        Returns the greatest element lower than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest element lower than or equal to the given value,
+            or None if there is no such element
+        :rtype: Union[Any, None]
+        :raises TypeError: if the given value does not match the instance type
+        :raises NullPointerException: if the given value is None
+        """
+        index = bisect_right(self.__items, value)
+        return self.__items[index - 1] if index > 0 else None
+
+    def first(self) -> Any:
+        """
+        Returns the lowest element contained in the MappedTreeSet.
+
+        :return: the lowest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        return self.__items[0]
+
+    def last(self) -> Any:
+        """
+        Returns the greatest element contained in the MappedTreeSet.
+
+        :return: the greatest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        return self.__items[self.__size - 1]
+
+    def iterator(self) -> Iterator[Any]:
+        """
+        Provides an iterator of the MappedTreeSet elements.
+
+        :return: MappedTreeSet elements iterator
+        :rtype: Iterator[Any]
+        """
+        return iter(self)
+
+    def descending_iterator(self) -> Iterator[Any]:
+        """
+        Provides a descending iterator of the MappedTreeSet elements.
+
+        :return: MappedTreeSet elements descending iterator
+        :rtype: Iterator[Any]
+        """
+        return iter(reversed(self))
+
+    def to_tree_set(self) -> TreeSet:
+        """
+        Loads every element of the MappedTreeSet into a new mutable TreeSet.
+
+        :return: a TreeSet with the same elements
+        :rtype: TreeSet
+        """
+        return TreeSet(self.__object_type, list(self))
+
+    def add(self, value: Any) -> bool:
+        """
+        MappedTreeSet instances are read-only.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException("MappedTreeSet is read-only")
+
+    def remove(self, value: Any) -> bool:
+        """
+        MappedTreeSet instances are read-only.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException("MappedTreeSet is read-only")
+
+    def clear(self) -> None:
+        """
+        MappedTreeSet instances are read-only.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException("MappedTreeSet is read-only")
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if the given value is contained in the MappedTreeSet or not.
+        This method is called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: Any
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        index = bisect_left(self.__items, value)
+        return index < self.__size and self.__items[index] == value
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Method to iterate over the MappedTreeSet instance.
+
+        :return: an iterator over the MappedTreeSet instance
+        :rtype: Iterator[Any]
+        """
+        for index in range(self.__size):
+            yield self.__items[index]
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Method to iterate reversely over the MappedTreeSet instance.
+
+        :return: a reversed iterator over the MappedTreeSet instance
+        :rtype: Iterator[Any]
+        """
+        for index in range(self.__size - 1, -1, -1):
+            yield self.__items[index]
+
+    def __len__(self) -> int:
+        """
+        Provides the length of the MappedTreeSet. It is used with the built-in
+        method len().
+
+        :return: the length of the MappedTreeSet
+        :rtype: int
+        """
+        return self.__size
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the current MappedTreeSet.
+
+        :return: MappedTreeSet string representation
+        :rtype: str
+        """
+        return f"{[value for value in self]}"
+
+    def __enter__(self) -> 'MappedTreeSet':
+        """
+        Enters the runtime context of the MappedTreeSet.
+
+        :return: the MappedTreeSet itself
+        :rtype: MappedTreeSet
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Exits the runtime context of the MappedTreeSet, unmapping the file.
+        """
+        self.close()
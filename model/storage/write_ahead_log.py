@@ -0,0 +1,556 @@
+"""
+write_ahead_log module.
+
+This module provides a DurableTreeSet class, which wraps a TreeSet and makes
+its modifications survive crashes. Every successful ``add``/``remove``/``clear``
+is appended to a write-ahead log, the log is synced to disk in groups of
+records (group commit), and a compact snapshot of the set is checkpointed
+periodically so the log never grows without bound. Opening a DurableTreeSet
+loads the last snapshot and replays the log written since then.
+
+Directory layout::
+
+    snapshot.bin    pickled (version, type, sorted values) of the last checkpoint
+    wal.log         records appended since the last checkpoint
+
+Every log record is ``length (uint32) | crc32 (uint32) | operation (1 byte) |
+pickled value``. A torn or corrupt record at the end of the log (a crash in
+the middle of a write) is discarded on replay.
+"""
+import os
+import pickle
+import struct
+import zlib
+from typing import *
+from model.tree_set import TreeSet
+
+SNAPSHOT_FILE = "snapshot.bin"
+LOG_FILE = "wal.log"
+VERSION = 1
+
+_RECORD = struct.Struct("<II")
+_ADD = b"a"
+_REMOVE = b"r"
+_CLEAR = b"c"
+
+
+def _fsync_directory(directory: str) -> None:
+    """
+    Syncs a directory so the files renamed into it are durable.
+
+    :param directory: the directory to sync
+    :type directory: str
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def encode_record(operation: bytes, value: Any) -> bytes:
+    """
+    Encodes a log record.
+
+    :param operation: the operation code of the record
+    :type operation: bytes
+    :param value: the value of the operation
+    :type value: Any
+    :return: the encoded record
+    :rtype: bytes
+    """
+    payload = operation + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    return _RECORD.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_records(path: str) -> Tuple[List[Tuple[bytes, Any]], int]:
+    """
+    Reads every complete and valid record of a log file.
+
+    :param path: the path of the log file
+    :type path: str
+    :return: the decoded records and the length of the valid prefix of the file
+    :rtype: Tuple[List[Tuple[bytes, Any]], int]
+    """
+    records = []
+    if not os.path.exists(path):
+        return records, 0
+
+    with open(path, "rb") as file:
+        content = file.read()
+
+    offset = 0
+    while offset + _RECORD.size <= len(content):
+        length, checksum = _RECORD.unpack_from(content, offset)
+        start = offset + _RECORD.size
+        payload = content[start:start + length]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            break
+
+        records.append((payload[:1], pickle.loads(payload[1:])))
+        offset = start + length
+
+    return records, offset
+
+
+class DurableTreeSet:
+    """
+    Class that represents a TreeSet whose modifications are persisted into a
+    write-ahead log stored in a directory.
+
+    Records are synced to disk every ``sync_batch_size`` modifications: a batch
+    size of 1 makes every modification durable before returning, while greater
+    sizes trade the last unsynced modifications on a crash for throughput. The
+    :meth:`sync` method forces the pending records to disk.
+
+    The wrapped TreeSet must not be modified directly, otherwise its changes
+    will not be logged.
+    """
+
+    def __init__(self, directory: str, generic_type: Type,
+                 sync_batch_size: int = 1,
+                 checkpoint_interval: int = 100000) -> None:
+        """
+        Constructor of the class.
+        Opens the DurableTreeSet stored in the given directory, creating it if
+        it does not exist, and recovers its content.
+
+        :param directory: the directory holding the snapshot and the log
+        :type directory: str
+        :param generic_type: the generic type of the set
+        :type generic_type: Type
+        :param sync_batch_size: number of records synced together
+        :type sync_batch_size: int
+        :param checkpoint_interval: number of logged records after which a
+            checkpoint is taken automatically, None to disable it
+        :type checkpoint_interval: int
+        :raises ValueError: if the batch size is not positive or the stored
+            set has a different type
+        """
+        if sync_batch_size < 1:
+            raise ValueError("Sync batch size must be greater than 0")
+
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__sync_batch_size = sync_batch_size
+        self.__checkpoint_interval = checkpoint_interval
+        self.__tree = TreeSet(generic_type)
+        self.__pending = bytearray()
+        self.__pending_records = 0
+        self.__logged_records = 0
+
+        self.__recover()
+        self.__log = open(self.__path(LOG_FILE), "ab")
+
+    def __path(self, name: str) -> str:
+        """
+        Returns the path of a file of the DurableTreeSet directory.
+
+        :param name: the name of the file
+        :type name: str
+        :return: the path of the file
+        :rtype: str
+        """
+        return os.path.join(self.__directory, name)
+
+    def __recover(self) -> None:
+        """
+        Loads the last snapshot and replays the log written since then. A torn
+        record at the end of the log is truncated.
+
+        :raises ValueError: if the stored set has a different type
+        """
+        snapshot = self.__path(SNAPSHOT_FILE)
+        if os.path.exists(snapshot):
+            with open(snapshot, "rb") as file:
+                version, generic_type, values = pickle.load(file)
+
+            if version != VERSION:
+                raise ValueError(f"Unsupported snapshot version {version}")
+            if generic_type is not self.__tree.object_type:
+                raise ValueError(
+                    f"Stored set type is '{generic_type}' but "
+                    f"'{self.__tree.object_type}' was given")
+            self.__tree.add_all(values)
+
+        log = self.__path(LOG_FILE)
+        records, valid_length = read_records(log)
+        for operation, value in records:
+            if operation == _ADD:
+                self.__tree.add(value)
+            elif operation == _REMOVE:
+                self.__tree.remove(value)
+            else:
+                self.__tree.clear()
+
+        if os.path.exists(log) and os.path.getsize(log) != valid_length:
+            with open(log, "r+b") as file:
+                file.truncate(valid_length)
+                os.fsync(file.fileno())
+        self.__logged_records = len(records)
+
+    def __append(self, operation: bytes, value: Any) -> None:
+        """
+        Appends a record to the log, syncing the pending records when the
+        batch is complete and checkpointing when the log is long enough.
+
+        :param operation: the operation code of the record
+        :type operation: bytes
+        :param value: the value of the operation
+        :type value: Any
+        """
+        self.__pending += encode_record(operation, value)
+        self.__pending_records += 1
+        self.__logged_records += 1
+
+        if self.__pending_records >= self.__sync_batch_size:
+            self.sync()
+
+        if self.__checkpoint_interval is not None \
+                and self.__logged_records >= self.__checkpoint_interval:
+            self.checkpoint()
+
+    @property
+    def directory(self) -> str:
+        """
+        Getter method to retrieve the directory of the DurableTreeSet.
+
+        :return: the directory of the DurableTreeSet
+        :rtype: str
+        """
+        return self.__directory
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the DurableTreeSet object type.
+
+        :return: the DurableTreeSet object type
+        :rtype: Type
+        """
+        return self.__tree.object_type
+
+    @property
+    def tree(self) -> TreeSet:
+        """
+        Getter method to retrieve the wrapped TreeSet. It must only be read.
+
+        :return: the wrapped TreeSet
+        :rtype: TreeSet
+        """
+        return self.__tree
+
+    def add(self, value: Any) -> bool:
+        """
+        Inserts a new value and logs the insertion.
+
+        :param value: the value to insert
+        :type value: Any
+        :return: False if the value already exists in the set, True otherwise
+        :rtype: bool
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        :raises ClassCastException: if the value is not comparable
+        """
+        if not self.__tree.add(value):
+            return False
+
+        self.__append(_ADD, value)
+        return True
+
+    def add_all(self, values: Collection[Any]) -> bool:
+        """
+        Inserts the given values and logs each insertion.
+
+        :param values: values to insert
+        :type values: Collection[Any]
+        :return: True if all values could be inserted else False
+        :rtype: bool
+        :raises TypeError: if some value does not match the instance type
+        :raises NullPointerException: if some value is None
+        :raises ClassCastException: if some value is not comparable
+        """
+        inserted = True
+        for value in values:
+            inserted = self.add(value) and inserted
+
+        return inserted
+
+    def remove(self, value: Any) -> bool:
+        """
+        Deletes a value and logs the deletion.
+
+        :param value: the value to delete
+        :type value: Any
+        :return: False if the value does not exist in the set, True otherwise
+        :rtype: bool
+        :raises TypeError: if the value does not match the instance type
+        :raises NullPointerException: if the value is None
+        :raises ClassCastException: if the value is not comparable
+        """
+        if not self.__tree.remove(value):
+            return False
+
+        self.__append(_REMOVE, value)
+        return True
+
+    def poll_first(self) -> Any:
+        """
+        Retrieves, removes and logs the removal of the lowest element.
+
+        :return: the lowest element, or None if this set is empty
+        :rtype: Any
+        """
+        if self.__tree.is_empty():
+            return None
+
+        self.remove(value := self.__tree.first())
+        return value
+
+    def poll_last(self) -> Any:
+        """
+        Retrieves, removes and logs the removal of the greatest element.
+
+        :return: the greatest element, or None if this set is empty
+        :rtype: Any
+        """
+        if self.__tree.is_empty():
+            return None
+
+        self.remove(value := self.__tree.last())
+        return value
+
+    def clear(self) -> None:
+        """
+        Clears the set and logs it.
+        """
+        self.__tree.clear()
+        self.__append(_CLEAR, None)
+
+    def contains(self, value: Any) -> bool:
+        """
+        Checks if a given value is contained into the set.
+
+        :param value: to check if it is contained
+        :type value: Any
+        :return: True if value is contained else False
+        :rtype: bool
+        """
+        return self.__tree.contains(value)
+
+    def higher(self, value: Any) -> Any:
+        """
+        Returns the least element strictly greater than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least greater element, or None if there is no such element
+        :rtype: Any
+        """
+        return self.__tree.higher(value)
+
+    def lower(self, value: Any) -> Any:
+        """
+        Returns the greatest element strictly lower than the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest lower element, or None if there is no such element
+        :rtype: Any
+        """
+        return self.__tree.lower(value)
+
+    def ceiling(self, value: Any) -> Any:
+        """
+        Returns the least element greater than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the least element greater than or equal to the given value,
+            or None if there is no such element
+        :rtype: Any
+        """
+        return self.__tree.ceiling(value)
+
+    def floor(self, value: Any) -> Any:
+        """
+        Returns the greatest element lower than or equal to the given value.
+
+        :param value: value to compare
+        :type value: Any
+        :return: the greatest element lower than or equal to the given value,
+            or None if there is no such element
+        :rtype: Any
+        """
+        return self.__tree.floor(value)
+
+    def first(self) -> Any:
+        """
+        Returns the lowest element contained in the set.
+
+        :return: the lowest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        return self.__tree.first()
+
+    def last(self) -> Any:
+        """
+        Returns the greatest element contained in the set.
+
+        :return: the greatest contained element
+        :rtype: Any
+        :raises NoSuchElementException: if there is no such element
+        """
+        return self.__tree.last()
+
+    def size(self) -> int:
+        """
+        Returns the size of the set.
+
+        :return: the size of the set
+        :rtype: int
+        """
+        return self.__tree.size()
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the set is empty or not.
+
+        :return: True if the set is empty else False
+        :rtype: bool
+        """
+        return self.__tree.is_empty()
+
+    def sync(self) -> None:
+        """
+        Writes the pending records to the log and syncs it to disk.
+        """
+        if not self.__pending:
+            return
+
+        self.__log.write(self.__pending)
+        self.__log.flush()
+        os.fsync(self.__log.fileno())
+        self.__pending = bytearray()
+        self.__pending_records = 0
+
+    def checkpoint(self) -> None:
+        """
+        Writes a snapshot of the whole set and empties the log. The snapshot is
+        renamed into place only once it is durable, and the log is truncated
+        afterwards, so a crash at any point leaves a recoverable state:
+        replaying a log over a snapshot that already includes it yields the
+        same set.
+        """
+        self.sync()
+
+        snapshot = self.__path(SNAPSHOT_FILE)
+        temporary = f"{snapshot}.tmp"
+        with open(temporary, "wb") as file:
+            pickle.dump((VERSION, self.__tree.object_type, list(self.__tree)),
+                        file, pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, snapshot)
+        _fsync_directory(self.__directory)
+
+        self.__log.truncate(0)
+        self.__log.flush()
+        os.fsync(self.__log.fileno())
+        self.__logged_records = 0
+
+    def close(self) -> None:
+        """
+        Syncs the pending records and closes the log.
+        """
+        if self.__log.closed:
+            return
+
+        self.sync()
+        self.__log.close()
+
+    def iterator(self) -> Iterator[Any]:
+        """
+        Provides an iterator of the set elements.
+
+        :return: set elements iterator
+        :rtype: Iterator[Any]
+        """
+        return self.__tree.iterator()
+
+    def descending_iterator(self) -> Iterator[Any]:
+        """
+        Provides a descending iterator of the set elements.
+
+        :return: set elements descending iterator
+        :rtype: Iterator[Any]
+        """
+        return self.__tree.descending_iterator()
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if the given value is contained in the set or not.
+        This method is called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: Any
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        return value in self.__tree
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Method to iterate over the set.
+
+        :return: an iterator over the set
+        :rtype: Iterator[Any]
+        """
+        return iter(self.__tree)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Method to iterate reversely over the set.
+
+        :return: a reversed iterator over the set
+        :rtype: Iterator[Any]
+        """
+        return reversed(self.__tree)
+
+    def __len__(self) -> int:
+        """
+        Provides the length of the set. It is used with the built-in method
+        len().
+
+        :return: the length of the set
+        :rtype: int
+        """
+        return len(self.__tree)
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the set.
+
+        :return: the set string representation
+        :rtype: str
+        """
+        return str(self.__tree)
+
+    def __enter__(self) -> 'DurableTreeSet':
+        """
+        Enters the runtime context of the DurableTreeSet.
+
+        :return: the DurableTreeSet itself
+        :rtype: DurableTreeSet
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Exits the runtime context of the DurableTreeSet, closing it.
+        """
+        self.close()
@@ -0,0 +1,672 @@
+"""
+tree_map module.
+
+This module provides the TreeMap class, a mapping sorted by its keys stored in
+a Red-Black Tree whose nodes also hold the value of their key, so every keyed
+operation is a single descent of the tree, and the SubMap class, a live view
+of the entries of a TreeMap between two bounds.
+"""
+from typing import *
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import RedBlackTree
+from model.utils.data_utils import TreeNode
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class MapTreeNode(TreeNode):
+    """
+    TreeNode of a TreeMap, whose value is a key and which also holds the
+    value mapped to it in its ``payload``.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Constructor of the class.
+        Initializes a new node whose key is not mapped yet.
+        """
+        super().__init__(*args, **kwargs)
+        self.payload = None
+
+
+class TreeMap(RedBlackTree):
+    """
+    Class that represents a mapping sorted by its keys, like the Java TreeMap.
+    The keys must be of the generic type of the map and comparable, while the
+    values can be anything. Iterating a TreeMap gives its keys in order.
+    """
+
+    _node_type = MapTreeNode
+
+    def __init__(self, key_type: Type,
+                 mapping: Union[Mapping[K, V], Collection[Tuple[K, V]]] = None
+                 ) -> None:
+        """
+        Initialize an empty TreeMap if the key type is given or constructs one
+        with the entries of the given mapping or collection of pairs.
+
+        :param key_type: the generic type of the keys
+        :type key_type: type
+        :param mapping: a mapping or a collection of (key, value) pairs
+        :type mapping: Union[Mapping[K, V], Collection[Tuple[K, V]]]
+        :raises TypeError: if some key does not match the instance type
+        :raises NullPointerException: if some key is None
+        :raises ClassCastException: if some key is not comparable
+        """
+        super().__init__(key_type)
+        if not mapping:
+            return
+
+        if isinstance(mapping, Mapping):
+            mapping = mapping.items()
+        for key, value in mapping:
+            self.put(key, value)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def _validate(self, key: K) -> None:
+        """
+        Validates a key given to a method taking several arguments, which
+        cannot use the validation decorators.
+
+        :param key: the key to validate
+        :type key: K
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+
+    def put(self, key: K, value: V) -> Union[V, None]:
+        """
+        Maps the given key to the given value, in a single descent.
+
+        :param key: the key
+        :type key: K
+        :param value: the value
+        :type value: V
+        :return: the value previously mapped to the key, or None if it was
+            not in the map
+        :rtype: Union[V, None]
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        self._validate(key)
+        node, _ = self._insert(key)
+        previous, node.payload = node.payload, value
+        return previous
+
+    def get(self, key: K, default: V = None) -> Union[V, None]:
+        """
+        Returns the value mapped to the given key.
+
+        :param key: the key
+        :type key: K
+        :param default: the value returned if the key is not in the map
+        :type default: V
+        :return: the value mapped to the key, or the default one
+        :rtype: Union[V, None]
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        self._validate(key)
+        node = self._RedBlackTree__contains(key)
+        if node is self._NULL or node.value != key:
+            return default
+
+        return node.payload
+
+    def pop(self, key: K, default: V = None) -> Union[V, None]:
+        """
+        Removes the given key and returns its value, in a single descent.
+
+        :param key: the key
+        :type key: K
+        :param default: the value returned if the key is not in the map
+        :type default: V
+        :return: the value mapped to the key, or the default one
+        :rtype: Union[V, None]
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        self._validate(key)
+        node = self._extract(key)
+        return default if node is None else node.payload
+
+    def contains_key(self, key: K) -> bool:
+        """
+        Checks if the given key is in the map.
+
+        :param key: the key
+        :type key: K
+        :return: True if it is in the map else False
+        :rtype: bool
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        return key in self
+
+    def __navigate(self, key: K, lower: bool, inclusive: bool) \
+            -> Union[Tuple[K, V], None]:
+        """
+        Searches the entry whose key is the closest to the given one.
+
+        :param key: the key to compare
+        :type key: K
+        :param lower: True to search a lower key else a higher one
+        :type lower: bool
+        :param inclusive: True if the given key itself can be returned
+        :type inclusive: bool
+        :return: the closest entry or None if there is no such entry
+        :rtype: Union[Tuple[K, V], None]
+        """
+        self._validate(key)
+        current = self._RedBlackTree__root
+        result = None
+
+        while current is not self._NULL:
+            if inclusive and current.value == key:
+                return current.value, current.payload
+
+            if current.value < key if lower else current.value > key:
+                result = current
+                current = current.right if lower else current.left
+            else:
+                current = current.left if lower else current.right
+
+        return None if result is None else (result.value, result.payload)
+
+    def floor_entry(self, key: K) -> Union[Tuple[K, V], None]:
+        """
+        Returns the entry with the greatest key lower than or equal to the
+        given one.
+
+        :param key: the key to compare
+        :type key: K
+        :return: the (key, value) pair or None if there is no such entry
+        :rtype: Union[Tuple[K, V], None]
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        return self.__navigate(key, True, True)
+
+    def ceiling_entry(self, key: K) -> Union[Tuple[K, V], None]:
+        """
+        Returns the entry with the least key greater than or equal to the
+        given one.
+
+        :param key: the key to compare
+        :type key: K
+        :return: the (key, value) pair or None if there is no such entry
+        :rtype: Union[Tuple[K, V], None]
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        return self.__navigate(key, False, True)
+
+    def higher_entry(self, key: K) -> Union[Tuple[K, V], None]:
+        """
+        Returns the entry with the least key strictly greater than the given
+        one.
+
+        :param key: the key to compare
+        :type key: K
+        :return: the (key, value) pair or None if there is no such entry
+        :rtype: Union[Tuple[K, V], None]
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        return self.__navigate(key, False, False)
+
+    def lower_entry(self, key: K) -> Union[Tuple[K, V], None]:
+        """
+        Returns the entry with the greatest key strictly lower than the given
+        one.
+
+        :param key: the key to compare
+        :type key: K
+        :return: the (key, value) pair or None if there is no such entry
+        :rtype: Union[Tuple[K, V], None]
+        :raises TypeError: if the key does not match the instance type
+        :raises NullPointerException: if the key is None
+        :raises ClassCastException: if the key is not comparable
+        """
+        return self.__navigate(key, True, False)
+
+    def __edge(self, first: bool) -> TreeNode:
+        """
+        Returns the node with the lowest or the greatest key.
+
+        :param first: True for the lowest key else the greatest
+        :type first: bool
+        :return: the node
+        :rtype: TreeNode
+        :raises NoSuchElementException: if the map is empty
+        """
+        current = self._RedBlackTree__root
+        if current is self._NULL:
+            raise NoSuchElementException("TreeMap is empty")
+
+        child = current.left if first else current.right
+        while child is not self._NULL:
+            current = child
+            child = current.left if first else current.right
+
+        return current
+
+    def first_entry(self) -> Tuple[K, V]:
+        """
+        Returns the entry with the lowest key.
+
+        :return: the (key, value) pair
+        :rtype: Tuple[K, V]
+        :raises NoSuchElementException: if the map is empty
+        """
+        node = self.__edge(True)
+        return node.value, node.payload
+
+    def last_entry(self) -> Tuple[K, V]:
+        """
+        Returns the entry with the greatest key.
+
+        :return: the (key, value) pair
+        :rtype: Tuple[K, V]
+        :raises NoSuchElementException: if the map is empty
+        """
+        node = self.__edge(False)
+        return node.value, node.payload
+
+    def poll_first_entry(self) -> Tuple[K, V]:
+        """
+        Removes and returns the entry with the lowest key.
+
+        :return: the (key, value) pair
+        :rtype: Tuple[K, V]
+        :raises NoSuchElementException: if the map is empty
+        """
+        node = self._extract(self.__edge(True).value)
+        return node.value, node.payload
+
+    def poll_last_entry(self) -> Tuple[K, V]:
+        """
+        Removes and returns the entry with the greatest key.
+
+        :return: the (key, value) pair
+        :rtype: Tuple[K, V]
+        :raises NoSuchElementException: if the map is empty
+        """
+        node = self._extract(self.__edge(False).value)
+        return node.value, node.payload
+
+    def keys(self) -> Iterator[K]:
+        """
+        Returns an iterator over the keys, in order.
+
+        :return: an iterator over the keys
+        :rtype: Iterator[K]
+        """
+        return iter(self)
+
+    def values(self) -> Iterator[V]:
+        """
+        Returns an iterator over the values, in the order of their keys.
+
+        :return: an iterator over the values
+        :rtype: Iterator[V]
+        """
+        for node in self._RedBlackTree__inorder(True):
+            yield node.payload
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """
+        Returns an iterator over the (key, value) pairs, in order.
+
+        :return: an iterator over the entries
+        :rtype: Iterator[Tuple[K, V]]
+        """
+        for node in self._RedBlackTree__inorder(True):
+            yield node.value, node.payload
+
+    def _entries(self, low: K, high: K, low_inclusive: bool,
+                 high_inclusive: bool) -> Iterator[Tuple[K, V]]:
+        """
+        Returns an iterator over the entries whose keys are between the given
+        bounds, which starts with a single descent to the low bound, so
+        iterating *k* entries takes *O(log n + k)* time.
+
+        :param low: the lowest key of the range, or None if unbounded
+        :type low: K
+        :param high: the greatest key of the range, or None if unbounded
+        :type high: K
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: an iterator over the entries of the range, in order
+        :rtype: Iterator[Tuple[K, V]]
+        """
+        stack = []
+        current = self._RedBlackTree__root
+        while current is not self._NULL:
+            if low is None or low < current.value \
+                    or low_inclusive and low == current.value:
+                stack.append(current)
+                current = current.left
+            else:
+                current = current.right
+
+        while stack:
+            current = stack.pop()
+            if high is not None and not (current.value < high
+                                         or high_inclusive
+                                         and current.value == high):
+                return
+
+            yield current.value, current.payload
+            current = current.right
+            while current is not self._NULL:
+                stack.append(current)
+                current = current.left
+
+    def sub_map(self, low: K = None, high: K = None,
+                inclusive: Union[bool, Tuple[bool, bool]] = (True, False)) \
+            -> 'SubMap':
+        """
+        Returns a live view of the entries whose keys are between the given
+        bounds. By default, like in Java, the low bound belongs to the range
+        and the high bound does not.
+
+        :param low: the lowest key of the range, or None if unbounded
+        :type low: K
+        :param high: the greatest key of the range, or None if unbounded
+        :type high: K
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the view of the range
+        :rtype: SubMap
+        :raises TypeError: if some bound does not match the instance type
+        :raises ClassCastException: if some bound is not comparable
+        """
+        for bound in (low, high):
+            if bound is not None:
+                self._validate(bound)
+
+        low_inclusive, high_inclusive = (inclusive, inclusive) \
+            if isinstance(inclusive, bool) else inclusive
+        return SubMap(self, low, high, low_inclusive, high_inclusive)
+
+    def head_map(self, high: K, inclusive: bool = False) -> 'SubMap':
+        """
+        Returns a live view of the entries whose keys are lower than the
+        given one.
+
+        :param high: the greatest key of the range
+        :type high: K
+        :param inclusive: True if the high bound belongs to the range
+        :type inclusive: bool
+        :return: the view of the range
+        :rtype: SubMap
+        :raises TypeError: if the bound does not match the instance type
+        :raises NullPointerException: if the bound is None
+        :raises ClassCastException: if the bound is not comparable
+        """
+        self._validate(high)
+        return self.sub_map(None, high, (True, inclusive))
+
+    def tail_map(self, low: K, inclusive: bool = True) -> 'SubMap':
+        """
+        Returns a live view of the entries whose keys are greater than the
+        given one.
+
+        :param low: the lowest key of the range
+        :type low: K
+        :param inclusive: True if the low bound belongs to the range
+        :type inclusive: bool
+        :return: the view of the range
+        :rtype: SubMap
+        :raises TypeError: if the bound does not match the instance type
+        :raises NullPointerException: if the bound is None
+        :raises ClassCastException: if the bound is not comparable
+        """
+        self._validate(low)
+        return self.sub_map(low, None, (inclusive, True))
+
+    def clone(self) -> 'TreeMap':
+        """
+        Clones the current TreeMap and returns that clone.
+
+        :return: a shallow copy of the current TreeMap instance.
+        :rtype: TreeMap
+        """
+        return TreeMap(self.object_type, list(self.items()))
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Returns the value mapped to the given key.
+
+        :param key: the key
+        :type key: K
+        :return: the value mapped to the key
+        :rtype: V
+        :raises KeyError: if the key is not in the map
+        """
+        self._validate(key)
+        node = self._RedBlackTree__contains(key)
+        if node is self._NULL or node.value != key:
+            raise KeyError(key)
+
+        return node.payload
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """
+        Maps the given key to the given value.
+
+        :param key: the key
+        :type key: K
+        :param value: the value
+        :type value: V
+        """
+        self.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Removes the given key.
+
+        :param key: the key
+        :type key: K
+        :raises KeyError: if the key is not in the map
+        """
+        self._validate(key)
+        if self._extract(key) is None:
+            raise KeyError(key)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Checks if both maps have the same entries, walking them in order in
+        lock-step.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if instances are equal else False
+        :rtype: bool
+        """
+        if not isinstance(other, TreeMap) or self.size() != other.size():
+            return False
+
+        for entry, other_entry in zip(self.items(), other.items()):
+            if not entry == other_entry:
+                return False
+
+        return True
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the current TreeMap.
+
+        :return: TreeMap string representation
+        :rtype: str
+        """
+        entries = ", ".join(f"{key!r}: {value!r}"
+                            for key, value in self.items())
+        return f"{{{entries}}}"
+
+
+class SubMap:
+    """
+    Class that represents a live read-only view of the entries of a TreeMap
+    whose keys are between two bounds: it reflects the later modifications
+    of the map.
+    """
+
+    def __init__(self, tree_map: TreeMap, low: K, high: K,
+                 low_inclusive: bool, high_inclusive: bool) -> None:
+        """
+        Constructor of the class.
+        Initializes a new view of the given range of a TreeMap.
+
+        :param tree_map: the viewed map
+        :type tree_map: TreeMap
+        :param low: the lowest key of the range, or None if unbounded
+        :type low: K
+        :param high: the greatest key of the range, or None if unbounded
+        :type high: K
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        """
+        self.__map = tree_map
+        self.__low = low
+        self.__high = high
+        self.__low_inclusive = low_inclusive
+        self.__high_inclusive = high_inclusive
+
+    def __in_range(self, key: K) -> bool:
+        """
+        Checks if the given key is between the bounds of the view.
+
+        :param key: the key
+        :type key: K
+        :return: True if it is in the range else False
+        :rtype: bool
+        """
+        low, high = self.__low, self.__high
+        return (low is None or low < key or self.__low_inclusive
+                and low == key) and (high is None or key < high
+                                     or self.__high_inclusive and key == high)
+
+    def get(self, key: K, default: V = None) -> Union[V, None]:
+        """
+        Returns the value mapped to the given key if it is in the range.
+
+        :param key: the key
+        :type key: K
+        :param default: the value returned if the key is not in the view
+        :type default: V
+        :return: the value mapped to the key, or the default one
+        :rtype: Union[V, None]
+        """
+        if key is None or not self.__in_range(key):
+            return default
+
+        return self.__map.get(key, default)
+
+    def keys(self) -> Iterator[K]:
+        """
+        Returns an iterator over the keys of the range, in order.
+
+        :return: an iterator over the keys
+        :rtype: Iterator[K]
+        """
+        return iter(self)
+
+    def values(self) -> Iterator[V]:
+        """
+        Returns an iterator over the values of the range, in the order of
+        their keys.
+
+        :return: an iterator over the values
+        :rtype: Iterator[V]
+        """
+        for _, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """
+        Returns an iterator over the entries of the range, in order.
+
+        :return: an iterator over the entries
+        :rtype: Iterator[Tuple[K, V]]
+        """
+        return self.__map._entries(self.__low, self.__high,
+                                   self.__low_inclusive, self.__high_inclusive)
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Returns the value mapped to the given key.
+
+        :param key: the key
+        :type key: K
+        :return: the value mapped to the key
+        :rtype: V
+        :raises KeyError: if the key is not in the view
+        """
+        if key is None or not self.__in_range(key):
+            raise KeyError(key)
+
+        return self.__map[key]
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks if the given key is in the view.
+
+        :param key: the key
+        :type key: K
+        :return: True if it is in the view else False
+        :rtype: bool
+        """
+        return key is not None and self.__in_range(key) and key in self.__map
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Returns an iterator over the keys of the range, in order.
+
+        :return: an iterator over the keys
+        :rtype: Iterator[K]
+        """
+        for key, _ in self.items():
+            yield key
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries of the range in *O(log n)* time, from
+        the subtree sizes of the map.
+
+        :return: the number of entries of the range
+        :rtype: int
+        """
+        high = self.__map.size() if self.__high is None \
+            else self.__map._count_lower(self.__high, self.__high_inclusive)
+        low = 0 if self.__low is None \
+            else self.__map._count_lower(self.__low, not self.__low_inclusive)
+        return max(0, high - low)
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the view.
+
+        :return: the view string representation
+        :rtype: str
+        """
+        entries = ", ".join(f"{key!r}: {value!r}"
+                            for key, value in self.items())
+        return f"{{{entries}}}"
@@ -0,0 +1,403 @@
+"""
+tree_multiset module.
+
+This module provides the TreeMultiset class, a sorted collection which may
+hold several occurrences of the same element. Every node of its Red-Black
+Tree stores a distinct element with its number of occurrences, and the total
+number of occurrences of its subtree, so the memory is proportional to the
+number of distinct elements and ranks and selections are weighted by the
+occurrences in *O(log n)* time.
+"""
+from typing import *
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import RedBlackTree
+from model.utils.data_utils import TreeNode
+
+E = TypeVar('E')
+
+
+class CountedTreeNode(TreeNode):
+    """
+    TreeNode of a TreeMultiset, which keeps the number of occurrences of its
+    element and the total number of occurrences of its subtree.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Constructor of the class.
+        Initializes a new node without occurrences yet.
+        """
+        super().__init__(*args, **kwargs)
+        self.count = 0
+        self.weight = 0
+
+
+class TreeMultiset(RedBlackTree):
+    """
+    Class that represents a sorted multiset, like the Guava TreeMultiset:
+    :meth:`add` and :meth:`remove` take a number of occurrences, the size is
+    the total number of occurrences, and iterating it gives every occurrence
+    in order.
+    """
+
+    _node_type = CountedTreeNode
+
+    def __init__(self, generic_type: Type,
+                 sequence: Collection[E] = None) -> None:
+        """
+        Initialize an empty TreeMultiset if type is given or constructs one
+        with every occurrence contained into the given collection.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param: sequence: a collection to take occurrences from
+        :type sequence: Collection[E]
+        :raises TypeError: if the given values does not match the instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        super().__init__(generic_type)
+        if not sequence:
+            return
+
+        if not isinstance(sequence, Collection):
+            raise TypeError(
+                f"Second argument must be a sequence but {type(sequence)} was given"
+            )
+
+        for value in sequence:
+            self.add(value)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def _validate(self, value: E) -> None:
+        """
+        Validates a value given to a method taking several arguments, which
+        cannot use the validation decorators.
+
+        :param value: the value to validate
+        :type value: E
+        :raises TypeError: if the given value does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+
+    @staticmethod
+    def __check_occurrences(occurrences: int) -> None:
+        """
+        Checks that the given number of occurrences is not negative.
+
+        :param occurrences: the number of occurrences
+        :type occurrences: int
+        :raises ValueError: if the number of occurrences is negative
+        """
+        if occurrences < 0:
+            raise ValueError(
+                f"Number of occurrences cannot be negative: {occurrences}")
+
+    def __weigh(self, node: CountedTreeNode) -> None:
+        """
+        Recomputes the total number of occurrences of the subtree of a node.
+
+        :param node: the node
+        :type node: CountedTreeNode
+        """
+        weight = node.count
+        if node.left is not self._NULL:
+            weight += node.left.weight
+        if node.right is not self._NULL:
+            weight += node.right.weight
+        node.weight = weight
+
+    def _update_node(self, node: CountedTreeNode) -> None:
+        """
+        Recomputes the subtree size and the total number of occurrences of a
+        node from the ones of its children.
+
+        :param node: the node to update
+        :type node: CountedTreeNode
+        """
+        super()._update_node(node)
+        self.__weigh(node)
+
+    def _update_path(self, node: Union[CountedTreeNode, None],
+                     delta: int) -> None:
+        """
+        Updates the subtree sizes and recomputes the total number of
+        occurrences of the given node and its ancestors after an insertion or
+        a deletion below them.
+
+        :param node: the deepest node whose subtree changed, or None
+        :type node: Union[CountedTreeNode, None]
+        :param delta: 1 after an insertion, -1 after a deletion
+        :type delta: int
+        """
+        super()._update_path(node, delta)
+        while node is not None:
+            self.__weigh(node)
+            node = node.parent
+
+    def add(self, value: E, occurrences: int = 1) -> int:
+        """
+        Adds occurrences of an element, in a single descent.
+
+        :param value: the element
+        :type value: E
+        :param occurrences: the number of occurrences to add
+        :type occurrences: int
+        :return: the number of occurrences of the element before the call
+        :rtype: int
+        :raises TypeError: if the given value does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        :raises ValueError: if the number of occurrences is negative
+        """
+        self._validate(value)
+        self.__check_occurrences(occurrences)
+        if not occurrences:
+            return self.count(value)
+
+        node, _ = self._insert(value)
+        previous = node.count
+        node.count += occurrences
+        self._update_path(node, 0)
+        return previous
+
+    def remove(self, value: E, occurrences: int = 1) -> int:
+        """
+        Removes occurrences of an element, deleting its node when none is
+        left.
+
+        :param value: the element
+        :type value: E
+        :param occurrences: the number of occurrences to remove, at most the
+            ones of the element
+        :type occurrences: int
+        :return: the number of occurrences of the element before the call
+        :rtype: int
+        :raises TypeError: if the given value does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        :raises ValueError: if the number of occurrences is negative
+        """
+        self._validate(value)
+        self.__check_occurrences(occurrences)
+        node = self._RedBlackTree__contains(value)
+        if node is self._NULL or node.value != value:
+            return 0
+
+        previous = node.count
+        if occurrences >= previous:
+            self._extract(value)
+        elif occurrences:
+            node.count -= occurrences
+            self._update_path(node, 0)
+
+        return previous
+
+    def count(self, value: E) -> int:
+        """
+        Returns the number of occurrences of an element.
+
+        :param value: the element
+        :type value: E
+        :return: its number of occurrences, 0 if it is not in the multiset
+        :rtype: int
+        :raises TypeError: if the given value does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(value)
+        node = self._RedBlackTree__contains(value)
+        if node is self._NULL or node.value != value:
+            return 0
+
+        return node.count
+
+    def rank(self, value: E) -> int:
+        """
+        Returns the number of occurrences lower than the given value, which
+        is the position of its first occurrence, in *O(log n)* time.
+
+        :param value: value to compare
+        :type value: E
+        :return: the number of occurrences lower than the given value
+        :rtype: int
+        :raises TypeError: if the given value does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(value)
+        current = self._RedBlackTree__root
+        rank = 0
+
+        while current is not self._NULL:
+            if current.value < value:
+                if current.left is not self._NULL:
+                    rank += current.left.weight
+                rank += current.count
+                current = current.right
+            else:
+                current = current.left
+
+        return rank
+
+    def select(self, index: int) -> E:
+        """
+        Returns the occurrence at the given position of the sorted multiset,
+        in *O(log n)* time.
+
+        :param index: the position, from 0 (negative positions count from the
+            end)
+        :type index: int
+        :return: the element at that position
+        :rtype: E
+        :raises IndexError: if the position is out of range
+        """
+        size = self.size()
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Position out of range: {index}")
+
+        current = self._RedBlackTree__root
+        while True:
+            left = current.left.weight if current.left is not self._NULL \
+                else 0
+            if index < left:
+                current = current.left
+            elif index < left + current.count:
+                return current.value
+            else:
+                index -= left + current.count
+                current = current.right
+
+    def size(self) -> int:
+        """
+        Returns the total number of occurrences of the TreeMultiset.
+
+        :return: the number of occurrences
+        :rtype: int
+        """
+        root = self._RedBlackTree__root
+        return 0 if root is self._NULL else root.weight
+
+    def distinct_size(self) -> int:
+        """
+        Returns the number of distinct elements of the TreeMultiset.
+
+        :return: the number of distinct elements
+        :rtype: int
+        """
+        return super().size()
+
+    def items(self) -> Iterator[Tuple[E, int]]:
+        """
+        Returns an iterator over the distinct elements and their number of
+        occurrences, in order.
+
+        :return: an iterator over the (element, occurrences) pairs
+        :rtype: Iterator[Tuple[E, int]]
+        """
+        for node in self._RedBlackTree__inorder(True):
+            yield node.value, node.count
+
+    def clone(self) -> 'TreeMultiset':
+        """
+        Clones the current TreeMultiset and returns that clone.
+
+        :return: a shallow copy of the current TreeMultiset instance.
+        :rtype: TreeMultiset
+        """
+        clone = TreeMultiset(self.object_type)
+        for value, occurrences in self.items():
+            clone.add(value, occurrences)
+        return clone
+
+    def verify(self, paths: int = None) -> bool:
+        """
+        Verifies the invariants of the Red-Black Tree (see
+        :meth:`RedBlackTree.verify`) and, when the whole tree is checked, the
+        occurrences kept by every node.
+
+        :param paths: the number of random paths to check, or None to check
+            the whole tree
+        :type paths: int
+        :return: True if the tree is valid
+        :rtype: bool
+        :raises IllegalStateException: if some invariant does not hold
+        :raises ValueError: if the number of paths is not positive
+        """
+        super().verify(paths)
+        if paths is not None:
+            return True
+
+        for node in self._RedBlackTree__inorder(True):
+            weight = node.weight
+            self.__weigh(node)
+            if node.count < 1 or node.weight != weight:
+                raise IllegalStateException(
+                    f"Invalid TreeMultiset: {node.count} occurrences and "
+                    f"total {weight} at {node.value!r}")
+
+        return True
+
+    def __iter__(self) -> Iterator[E]:
+        """
+        Method to iterate over every occurrence of the TreeMultiset, in
+        order.
+
+        :return: an iterator over the occurrences
+        :rtype: Iterator[E]
+        """
+        for node in self._RedBlackTree__inorder(True):
+            for _ in range(node.count):
+                yield node.value
+
+    def __reversed__(self) -> Iterator[E]:
+        """
+        Method to iterate reversely over every occurrence of the
+        TreeMultiset.
+
+        :return: an iterator over the occurrences
+        :rtype: Iterator[E]
+        """
+        for node in self._RedBlackTree__inorder(False):
+            for _ in range(node.count):
+                yield node.value
+
+    def __len__(self) -> int:
+        """
+        Provides the total number of occurrences of the TreeMultiset. It is
+        used with the built-in method len().
+
+        :return: the number of occurrences
+        :rtype: int
+        """
+        return self.size()
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Checks if both multisets have the same elements with the same number
+        of occurrences, walking them in order in lock-step.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if instances are equal else False
+        :rtype: bool
+        """
+        if not isinstance(other, TreeMultiset) or self.size() != other.size() \
+                or self.distinct_size() != other.distinct_size():
+            return False
+
+        for item, other_item in zip(self.items(), other.items()):
+            if not item == other_item:
+                return False
+
+        return True
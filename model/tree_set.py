@@ -7,12 +7,38 @@ RedBlackTree class, which is a self-balancing binary search tree. The TreeSet
 class extends the RedBlackTree class and provides additional methods for
 managing the set of elements.
 """
+import heapq
+import numbers
+import operator
+import random
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain
 from typing import *
 from model.utils.data_utils import TreeNode, SimpleStack
 from model.exceptions.tree_set_exceptions import *
 
 E = TypeVar('E')
 
+_MASK = (1 << 64) - 1
+
+
+def _mix_hash(value: Any) -> int:
+    """
+    Returns the hash of the given value scrambled with the splitmix64
+    finalizer, so that summing the mixed hashes of a set gives a fingerprint
+    where close values (whose Python hashes are close) do not cancel out.
+
+    :param value: the value to hash
+    :type value: Any
+    :return: the mixed 64-bit hash
+    :rtype: int
+    :raises TypeError: if the value is not hashable
+    """
+    mixed = hash(value) & _MASK
+    mixed = (mixed ^ (mixed >> 30)) * 0xBF58476D1CE4E5B9 & _MASK
+    mixed = (mixed ^ (mixed >> 27)) * 0x94D049BB133111EB & _MASK
+    return mixed ^ (mixed >> 31)
+
 
 class RedBlackTree:
     """
@@ -24,13 +50,66 @@ class RedBlackTree:
 
     __attributes = {
         "_RedBlackTree__root", "_RedBlackTree__size",
-        "_RedBlackTree__object_type"
+        "_RedBlackTree__object_type", "_RedBlackTree__fingerprint"
     }
 
     _RED = TreeNode.TreeNodeUtils.RED
     _BLACK = TreeNode.TreeNodeUtils.BLACK
     _NULL = TreeNode(TreeNode.TreeNodeUtils.NULL, None, None,
                      TreeNode.TreeNodeUtils.BLACK)
+    _NULL.subtree_size = 0
+    _node_type = TreeNode
+    REBUILD_FRACTION = 0.1
+
+    __variants = {}
+    _variant_of = None
+    _features = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Registers the private attributes declared by a subclass in its own
+        ``__attributes`` set, so they can be assigned despite
+        :meth:`__setattr__` restrictions.
+        """
+        super().__init_subclass__(**kwargs)
+        attributes = set(cls.__attributes)
+        for klass in cls.__mro__:
+            name = f"_{klass.__name__.lstrip('_')}__attributes"
+            attributes |= klass.__dict__.get(name, set())
+        cls.__attributes = attributes
+
+    def _set_feature(self, feature: Type, enabled: bool) -> None:
+        """
+        Enables or disables an optional feature by changing the class of the
+        instance to the subclass of its original class that mixes in the
+        features enabled, so disabled features do not cost anything. The
+        subclasses are created once per combination of features, and the
+        mixins are ordered by their ``_feature_order`` (0 if they have none),
+        then by name, so a mixin with a lower order wraps the other ones.
+
+        :param feature: the mixin class implementing the feature
+        :type feature: Type
+        :param enabled: True to enable the feature else False
+        :type enabled: bool
+        """
+        base = type(self)._variant_of or type(self)
+        features = type(self)._features | {feature} if enabled \
+            else type(self)._features - {feature}
+
+        if (variant := RedBlackTree.__variants.get((base, features))) is None:
+            variant = base
+            if features:
+                mixins = sorted(features, key=lambda mixin: (
+                    getattr(mixin, "_feature_order", 0), mixin.__name__))
+                variant = type(base.__name__, (*mixins, base), {
+                    "__module__": base.__module__,
+                    "__qualname__": base.__qualname__,
+                    "_variant_of": base,
+                    "_features": features,
+                })
+            RedBlackTree.__variants[(base, features)] = variant
+
+        object.__setattr__(self, "__class__", variant)
 
     def _type_validation(function):
         """
@@ -184,6 +263,7 @@ class RedBlackTree:
         self.__root = self._NULL
         self.__size = 0
         self.__object_type = self.__complete_comparator(generic_type)
+        self._reset_fingerprint()
 
     @property
     def object_type(self) -> Type:
@@ -207,11 +287,24 @@ class RedBlackTree:
         :return: False if the value already exists in the tree, True otherwise
         :rtype: bool
         """
+        return self._insert(value)[1]
+
+    def _insert(self, value: Any) -> Tuple[TreeNode, bool]:
+        """
+        Inserts a value unless it already exists, in a single descent.
+
+        :param value: the value to insert
+        :type value: Any
+        :return: the node holding the value, and False if it already existed
+            in the tree, True otherwise
+        :rtype: Tuple[TreeNode, bool]
+        """
         if (parent := self.__contains(
                 value)) is not self._NULL and parent.value == value:
-            return False
+            return parent, False
 
-        node = TreeNode(value, self._NULL, self._NULL, self._RED)
+        node = self._node_type(value, self._NULL, self._NULL, self._RED)
+        self._update_node(node)
         parent = None if parent is self._NULL else parent
 
         node.parent = parent
@@ -221,6 +314,7 @@ class RedBlackTree:
             parent.left = node
         else:
             parent.right = node
+        self._update_path(parent, 1)
 
         if node.parent is None:
             node.color = self._BLACK
@@ -228,7 +322,9 @@ class RedBlackTree:
             self.__fix_after_insertion(node)
 
         self.__size += 1
-        return True
+        self._update_fingerprint(value, True)
+        self._on_insert(value)
+        return node, True
 
     @_null_validation
     @_type_validation
@@ -242,11 +338,46 @@ class RedBlackTree:
         :return: False if the value does not exist in the tree, True otherwise
         :rtype: bool
         """
+        return self._extract(value) is not None
+
+    def _extract(self, value: Any) -> Union[TreeNode, None]:
+        """
+        Deletes a value, in a single descent.
+
+        :param value: the value to delete
+        :type value: Any
+        :return: the unlinked node which held the value, or None if the value
+            does not exist in the tree
+        :rtype: Union[TreeNode, None]
+        """
         if (
                 node := self.__contains(
                     value)) is self._NULL or node.value != value:
-            return False
+            return None
+
+        self._extract_node(node)
+        return node
+
+    def _extract_node(self, node: TreeNode) -> None:
+        """
+        Deletes the value of the given node of the tree, without searching
+        it.
+
+        :param node: the node to unlink
+        :type node: TreeNode
+        """
+        self.__delete(node)
+        self.__size -= 1
+        self._update_fingerprint(node.value, False)
+        self._on_delete(node.value)
+
+    def __delete(self, node: TreeNode) -> None:
+        """
+        Unlinks the given node from the tree and rebalances it.
 
+        :param node: the node to delete
+        :type node: TreeNode
+        """
         successor = node
         successor_color = successor.color
         if node.left is self._NULL:
@@ -271,13 +402,12 @@ class RedBlackTree:
             successor.left = node.left
             successor.left.parent = successor
             successor.color = node.color
+            successor.subtree_size = node.subtree_size
 
+        self._update_path(replacement.parent, -1)
         if successor_color == self._BLACK:
             self.__fix_after_deletion(replacement)
 
-        self.__size -= 1
-        return True
-
     def size(self) -> int:
         """
         Returns the size of the RedBlackTree.
@@ -302,6 +432,504 @@ class RedBlackTree:
         """
         self.__root = self._NULL
         self.__size = 0
+        self._reset_fingerprint()
+        self._on_clear()
+
+    def fingerprint(self) -> Union[int, None]:
+        """
+        Returns an order-independent 64-bit hash of the content of the tree,
+        maintained incrementally by the insertions and deletions. Equal trees
+        have equal fingerprints, so different fingerprints prove in *O(1)*
+        that two trees are different.
+
+        Fingerprints rely on the hashes of the elements, so they are not
+        available for unhashable types, and the ones of strings and bytes are
+        only comparable within the same process (see ``PYTHONHASHSEED``).
+
+        :return: the fingerprint, or None if the elements are not hashable
+        :rtype: Union[int, None]
+        """
+        return self.__fingerprint
+
+    def _reset_fingerprint(self) -> None:
+        """
+        Resets the fingerprint to the one of an empty tree, or disables it if
+        the type of the tree is not hashable.
+        """
+        self.__fingerprint = 0 if self.__object_type.__hash__ is not None \
+            else None
+
+    def _update_fingerprint(self, value: Any, added: bool) -> None:
+        """
+        Updates the fingerprint after the insertion or the deletion of a
+        value. The fingerprint is disabled if the value is not hashable.
+
+        :param value: the inserted or deleted value
+        :type value: Any
+        :param added: True if the value was inserted else False
+        :type added: bool
+        """
+        if self.__fingerprint is None:
+            return
+
+        try:
+            mixed = _mix_hash(value)
+        except TypeError:
+            self.__fingerprint = None
+            return
+
+        self.__fingerprint = (self.__fingerprint
+                              + (mixed if added else -mixed)) & _MASK
+
+    def _on_insert(self, value: Any) -> None:
+        """
+        Hook called after the insertion of a value, on every insertion path,
+        for the features following the content of the tree. It does nothing
+        by default.
+
+        :param value: the inserted value
+        :type value: Any
+        """
+
+    def _on_delete(self, value: Any) -> None:
+        """
+        Hook called after the deletion of a value, on every deletion path,
+        for the features following the content of the tree. It does nothing
+        by default.
+
+        :param value: the deleted value
+        :type value: Any
+        """
+
+    def _on_clear(self) -> None:
+        """
+        Hook called after the tree is emptied, for the features following
+        the content of the tree. It does nothing by default.
+        """
+
+    def height(self) -> int:
+        """
+        Returns the number of nodes of the longest path from the root to a
+        leaf of the RedBlackTree.
+
+        :return: the height of the tree, 0 if it is empty
+        :rtype: int
+        """
+        height = 0
+        stack = [(self.__root, 1)] if self.__root is not self._NULL else []
+        while stack:
+            node, depth = stack.pop()
+            height = max(height, depth)
+            for child in (node.left, node.right):
+                if child is not self._NULL:
+                    stack.append((child, depth + 1))
+
+        return height
+
+    def black_height(self) -> int:
+        """
+        Returns the number of black nodes of the paths from the root to the
+        leaves of the RedBlackTree, which is the same for every path of a
+        valid tree (the ``None`` leaves are not counted).
+
+        :return: the black height of the leftmost path, 0 if it is empty
+        :rtype: int
+        """
+        black_height = 0
+        node = self.__root
+        while node is not self._NULL:
+            black_height += node.color == self._BLACK
+            node = node.left
+
+        return black_height
+
+    def shape_stats(self) -> Dict[str, Any]:
+        """
+        Returns the shape of the RedBlackTree:
+
+            * ``size``, ``height`` and ``black_height``
+            * ``min_height``: the height of a perfectly balanced tree of the
+              same size
+            * ``depth_histogram``: the number of nodes at every depth (the
+              root is at depth 0)
+            * ``average_path_length``: the average depth of the nodes, i.e. the
+              average number of comparisons of a successful search minus one
+
+        :return: the shape statistics
+        :rtype: Dict[str, Any]
+        """
+        histogram = []
+        stack = [(self.__root, 0)] if self.__root is not self._NULL else []
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(histogram):
+                histogram.append(0)
+            histogram[depth] += 1
+            for child in (node.left, node.right):
+                if child is not self._NULL:
+                    stack.append((child, depth + 1))
+
+        return {
+            "size": self.__size,
+            "height": len(histogram),
+            "black_height": self.black_height(),
+            "min_height": self.__size.bit_length(),
+            "depth_histogram": histogram,
+            "average_path_length": sum(
+                depth * count for depth, count in enumerate(histogram))
+                / self.__size if self.__size else 0.0,
+        }
+
+    def verify(self, paths: int = None) -> bool:
+        """
+        Verifies in a single pass the invariants of the RedBlackTree: values
+        strictly ordered, black root, no red node with a red child, the same
+        number of black nodes in every path, consistent parent pointers,
+        subtree sizes and size.
+
+        The whole tree is checked in *O(n)* time unless a number of paths is
+        given, in which case only that number of random paths from the root to
+        a leaf is checked in *O(paths log n)* time, which is cheap enough to
+        run regularly in production.
+
+        :param paths: the number of random paths to check, or None to check
+            the whole tree
+        :type paths: int
+        :return: True if the tree is valid
+        :rtype: bool
+        :raises IllegalStateException: if some invariant does not hold
+        :raises ValueError: if the number of paths is not positive
+        """
+        if paths is not None and paths < 1:
+            raise ValueError("Number of paths must be positive")
+
+        def fail(message: str, node: TreeNode = None) -> NoReturn:
+            """
+            Raises an IllegalStateException describing a violated invariant.
+
+            :param message: the description of the invariant
+            :type message: str
+            :param node: the node violating it
+            :type node: TreeNode
+            :raises IllegalStateException: always
+            """
+            at = f" at {node.value!r}" if node is not None else ""
+            raise IllegalStateException(f"Invalid RedBlackTree: {message}{at}")
+
+        if self.__root is self._NULL:
+            if self.__size:
+                fail(f"empty tree of size {self.__size}")
+            return True
+
+        if self.__root.parent is not None:
+            fail("root with parent", self.__root)
+        if self.__root.color != self._BLACK:
+            fail("red root", self.__root)
+
+        expected = self.black_height()
+        count = 0
+        stack = [(self.__root, None, None, 1)]
+        while stack:
+            node, low, high, blacks = stack.pop()
+            count += 1
+            if low is not None and not low.value < node.value \
+                    or high is not None and not node.value < high.value:
+                fail("values out of order", node)
+            if node.subtree_size != node.left.subtree_size \
+                    + node.right.subtree_size + 1:
+                fail("wrong subtree size", node)
+
+            children = []
+            for child, child_low, child_high in ((node.left, low, node),
+                                                 (node.right, node, high)):
+                if child is self._NULL:
+                    if blacks != expected:
+                        fail("paths with different black heights", node)
+                    continue
+
+                if child.parent is not node:
+                    fail("inconsistent parent pointer", child)
+                if node.color == self._RED and child.color == self._RED:
+                    fail("red node with a red child", node)
+                children.append((child, child_low, child_high,
+                                 blacks + (child.color == self._BLACK)))
+
+            if paths is None:
+                stack.extend(children)
+            elif children:
+                stack.append(random.choice(children))
+            elif paths > 1:
+                paths -= 1
+                stack.append((self.__root, None, None, 1))
+
+        if paths is None and count != self.__size:
+            fail(f"{count} nodes in a tree of size {self.__size}")
+
+        return True
+
+    def enable_verification(self, rate: float = 1.0,
+                            paths: int = None) -> None:
+        """
+        Starts the debug mode, in which the given fraction of the insertions
+        and deletions that modify the tree is followed by a call to
+        :meth:`verify`. The debug mode is disabled by default and does not slow
+        the tree down until it is enabled.
+
+        :param rate: the fraction of the modifications to verify
+        :type rate: float
+        :param paths: the number of random paths to check, or None to check
+            the whole tree
+        :type paths: int
+        :raises ValueError: if the rate is not between 0 and 1 or the number
+            of paths is not positive
+        """
+        from model.instrumentation.verification import \
+            RedBlackTreeVerification
+        RedBlackTreeVerification.enable(self, rate, paths)
+
+    def disable_verification(self) -> None:
+        """
+        Stops the debug mode.
+        """
+
+    def enable_finger_search(self) -> None:
+        """
+        Starts every search from the node of the previous one (the finger)
+        instead of the root, climbing only as far as needed, so a value at
+        distance *d* of the previous one is found in *O(log d)* time, and
+        values which are not lower than the greatest one, like ascending
+        timestamps, are found or inserted without descending the tree. While
+        the statistics are enabled, these searches are not counted.
+        """
+        from model.finger_search import RedBlackTreeFingerSearch
+        RedBlackTreeFingerSearch.enable(self)
+
+    def disable_finger_search(self) -> None:
+        """
+        Starts the searches from the root again.
+        """
+
+    def _stats_mixin(self) -> Type:
+        """
+        Returns the mixin class implementing the statistics of the tree.
+
+        :return: the statistics mixin class
+        :rtype: Type
+        """
+        from model.instrumentation.tree_stats import RedBlackTreeStats
+        return RedBlackTreeStats
+
+    def enable_stats(self) -> None:
+        """
+        Starts counting the comparisons, node visits, rotations, recolors and
+        node allocations of the tree. Statistics are disabled by default and
+        do not slow the tree down until they are enabled.
+        """
+        self._stats_mixin().enable(self)
+
+    def disable_stats(self) -> None:
+        """
+        Stops counting the operations of the tree and discards the counters.
+        """
+
+    def stats(self, reset: bool = False) -> Dict[str, int]:
+        """
+        Returns a snapshot of the counters of the tree.
+
+        :param reset: if True the counters are reset after the snapshot
+        :type reset: bool
+        :return: the value of every counter
+        :rtype: Dict[str, int]
+        :raises IllegalStateException: if the statistics are not enabled
+        """
+        raise IllegalStateException("Statistics are not enabled")
+
+    def reset_stats(self) -> None:
+        """
+        Sets every counter of the tree to zero.
+
+        :raises IllegalStateException: if the statistics are not enabled
+        """
+        raise IllegalStateException("Statistics are not enabled")
+
+    def _profiling_mixin(self) -> Type:
+        """
+        Returns the mixin class implementing the profiling of the tree.
+
+        :return: the profiling mixin class
+        :rtype: Type
+        """
+        from model.instrumentation.profiling import RedBlackTreeProfiling
+        return RedBlackTreeProfiling
+
+    def enable_profiling(
+            self, callback: Callable[[str, Dict[str, float]], None] = None,
+            report_interval: int = None) -> None:
+        """
+        Starts recording a latency histogram per public method of the tree.
+        Profiling is disabled by default and does not slow the tree down
+        until it is enabled.
+
+        Every ``report_interval`` calls the summary of every histogram
+        (count, min, mean, max, p50, p90, p99 and p99.9, in nanoseconds) is
+        sent to ``callback(method_name, summary)`` and the histograms are
+        reset, so the reports can be forwarded to a metrics collector.
+
+        :param callback: the function receiving the reports
+        :type callback: Callable[[str, Dict[str, float]], None]
+        :param report_interval: the number of calls between reports, or None
+            to only report when :meth:`report_profile` is called
+        :type report_interval: int
+        :raises ValueError: if the report interval is not positive
+        """
+        if report_interval is not None and report_interval < 1:
+            raise ValueError("Report interval must be positive")
+
+        self._profiling_mixin().enable(self, callback, report_interval)
+
+    def disable_profiling(self) -> None:
+        """
+        Stops profiling the tree and discards the histograms.
+        """
+
+    def profile(self, reset: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the summary of the latencies of every called method.
+
+        :param reset: if True the histograms are reset after the snapshot
+        :type reset: bool
+        :return: the summary of the histogram of every method
+        :rtype: Dict[str, Dict[str, float]]
+        :raises IllegalStateException: if the profiling is not enabled
+        """
+        raise IllegalStateException("Profiling is not enabled")
+
+    def report_profile(self, reset: bool = False) -> None:
+        """
+        Sends the summary of the latencies of every called method to the
+        profiling callback.
+
+        :param reset: if True the histograms are reset after the report
+        :type reset: bool
+        :raises IllegalStateException: if the profiling is not enabled
+        """
+        raise IllegalStateException("Profiling is not enabled")
+
+    def add_augmentation(self, name: str, combine: Callable[[Any, Any], Any],
+                         identity: Any,
+                         mapper: Callable[[Any], Any] = None) -> None:
+        """
+        Makes every node keep the aggregate of the values of its subtree for
+        the monoid formed by the associative ``combine`` function and its
+        ``identity``, mapping every value with ``mapper`` first if given. The
+        aggregates are computed in *O(n)* time and then maintained by every
+        modification, so :meth:`aggregate` combines any range in *O(log n)*
+        time. Trees without augmentations are not slowed down.
+
+        :param name: the name of the augmentation
+        :type name: str
+        :param combine: the associative function combining two aggregates
+        :type combine: Callable[[Any, Any], Any]
+        :param identity: the neutral aggregate of ``combine``
+        :type identity: Any
+        :param mapper: the function turning a value into an aggregate, or None
+            to aggregate the values themselves
+        :type mapper: Callable[[Any], Any]
+        """
+        from model.augmentation import RedBlackTreeAugmentation
+        RedBlackTreeAugmentation.enable(self)
+        self.add_augmentation(name, combine, identity, mapper)
+
+    def remove_augmentation(self, name: str) -> None:
+        """
+        Removes an augmentation.
+
+        :param name: the name of the augmentation
+        :type name: str
+        :raises ValueError: if the tree has no augmentation of that name
+        """
+        raise ValueError(f"Unknown augmentation '{name}'")
+
+    def augmentations(self) -> List[str]:
+        """
+        Returns the names of the augmentations of the tree.
+
+        :return: the names of the augmentations, in the order they were added
+        :rtype: List[str]
+        """
+        return []
+
+    def aggregate(self, name: str, low: Any = None, high: Any = None,
+                  inclusive: Union[bool, Tuple[bool, bool]] = True) -> Any:
+        """
+        Returns the aggregate of the values between the given bounds for an
+        augmentation added by :meth:`add_augmentation`.
+
+        :param name: the name of the augmentation
+        :type name: str
+        :param low: the lowest value of the range, or None if unbounded
+        :type low: Any
+        :param high: the greatest value of the range, or None if unbounded
+        :type high: Any
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the aggregate of the range, the identity if it is empty
+        :rtype: Any
+        :raises ValueError: if the tree has no augmentation of that name
+        """
+        raise ValueError(f"Unknown augmentation '{name}'")
+
+    def _count_lower(self, value: Any, inclusive: bool) -> int:
+        """
+        Returns the number of values lower than the given value, adding the
+        size of the left subtree of every node where the search goes right.
+
+        :param value: value to compare
+        :type value: Any
+        :param inclusive: True to also count the value itself
+        :type inclusive: bool
+        :return: the number of values lower (or equal) than the value
+        :rtype: int
+        """
+        current = self.__root
+        count = 0
+
+        while current is not self._NULL:
+            if current.value < value or inclusive and current.value == value:
+                count += current.left.subtree_size + 1
+                current = current.right
+            else:
+                current = current.left
+
+        return count
+
+    def _update_node(self, node: TreeNode) -> None:
+        """
+        Recomputes the data a node keeps about its subtree (the number of its
+        nodes) from the one of its children. It is called on the nodes moved
+        by a rotation, bottom-up.
+
+        :param node: the node to update
+        :type node: TreeNode
+        """
+        node.subtree_size = node.left.subtree_size \
+            + node.right.subtree_size + 1
+
+    def _update_path(self, node: Union[TreeNode, None], delta: int) -> None:
+        """
+        Updates the data kept about their subtree by the given node and its
+        ancestors after a node was inserted below them or deleted from below
+        them, before the tree is rebalanced.
+
+        :param node: the deepest node whose subtree changed, or None
+        :type node: Union[TreeNode, None]
+        :param delta: 1 after an insertion, -1 after a deletion
+        :type delta: int
+        """
+        while node is not None:
+            node.subtree_size += delta
+            node = node.parent
 
     def __fix_after_insertion(self, node: TreeNode) -> None:
         """
@@ -365,6 +993,8 @@ class RedBlackTree:
             node.parent.right = other
         other.left = node
         node.parent = other
+        self._update_node(node)
+        self._update_node(other)
 
     def __right_rotation(self, node: TreeNode) -> None:
         """
@@ -387,6 +1017,8 @@ class RedBlackTree:
             node.parent.left = other
         other.right = node
         node.parent = other
+        self._update_node(node)
+        self._update_node(other)
 
     def __fix_after_deletion(self, node) -> None:
         """
@@ -429,7 +1061,7 @@ class RedBlackTree:
                     sibling = node.parent.left
 
                 if sibling.right.color == self._BLACK \
-                        and sibling.right.color == self._BLACK:
+                        and sibling.left.color == self._BLACK:
                     sibling.color = self._RED
                     node = node.parent
                 else:
@@ -477,6 +1109,338 @@ class RedBlackTree:
             node = node.left
         return node
 
+    def _successor(self, node: TreeNode) -> TreeNode:
+        """
+        Finds the node following the given one in order, going down its
+        right subtree or up to its first ancestor on the right, in amortized
+        *O(1)* time.
+
+        :param node: a node of the tree
+        :type node: TreeNode
+        :return: the next node, or the NULL node if it is the last one
+        :rtype: TreeNode
+        """
+        if node.right is not self._NULL:
+            return self.__symmetrical_successor(node.right)
+
+        while node.parent is not None and node is node.parent.right:
+            node = node.parent
+        return self._NULL if node.parent is None else node.parent
+
+    def _predecessor(self, node: TreeNode) -> TreeNode:
+        """
+        Finds the node preceding the given one in order, going down its left
+        subtree or up to its first ancestor on the left, in amortized *O(1)*
+        time.
+
+        :param node: a node of the tree
+        :type node: TreeNode
+        :return: the previous node, or the NULL node if it is the first one
+        :rtype: TreeNode
+        """
+        if node.left is not self._NULL:
+            node = node.left
+            while node.right is not self._NULL:
+                node = node.right
+            return node
+
+        while node.parent is not None and node is node.parent.left:
+            node = node.parent
+        return self._NULL if node.parent is None else node.parent
+
+    def __black_height(self, node: TreeNode) -> int:
+        """
+        Returns the number of black nodes of the leftmost path of a subtree.
+
+        :param node: the root of the subtree
+        :type node: TreeNode
+        :return: the black height of the subtree
+        :rtype: int
+        """
+        black_height = 0
+        while node is not self._NULL:
+            black_height += node.color == self._BLACK
+            node = node.left
+
+        return black_height
+
+    def __join(self, left: TreeNode, middle: TreeNode,
+               right: TreeNode) -> TreeNode:
+        """
+        Joins two detached subtrees and a detached node greater than the
+        values of the left subtree and lower than the ones of the right
+        subtree. The node is hung from the taller subtree where the black
+        height matches the one of the shorter subtree, and the tree is
+        rebalanced from there, in *O(log n)* time.
+
+        :param left: the root of the left subtree
+        :type left: TreeNode
+        :param middle: the node joining both subtrees
+        :type middle: TreeNode
+        :param right: the root of the right subtree
+        :type right: TreeNode
+        :return: the root of the joined tree
+        :rtype: TreeNode
+        """
+        for root in (left, right):
+            if root is not self._NULL:
+                root.parent = None
+                root.color = self._BLACK
+
+        left_height = self.__black_height(left)
+        right_height = self.__black_height(right)
+        middle.parent = None
+
+        if left_height == right_height:
+            middle.left, middle.right = left, right
+            for child in (left, right):
+                if child is not self._NULL:
+                    child.parent = middle
+            middle.color = self._BLACK
+            self._update_node(middle)
+            return middle
+
+        tall_left = left_height > right_height
+        root, height, target = (left, left_height, right_height) \
+            if tall_left else (right, right_height, left_height)
+        parent, current = None, root
+        while current.color != self._BLACK or height != target:
+            height -= current.color == self._BLACK
+            parent = current
+            current = current.right if tall_left else current.left
+
+        if tall_left:
+            middle.left, middle.right, parent.right = current, right, middle
+        else:
+            middle.left, middle.right, parent.left = left, current, middle
+        middle.parent = parent
+        middle.color = self._RED
+        for child in (middle.left, middle.right):
+            if child is not self._NULL:
+                child.parent = middle
+
+        self._update_node(middle)
+        ancestor = parent
+        while ancestor is not None:
+            self._update_node(ancestor)
+            ancestor = ancestor.parent
+
+        if parent.color == self._RED:
+            self.__root = root
+            self.__fix_after_insertion(middle)
+            root = self.__root
+
+        return root
+
+    def __concatenate(self, left: TreeNode, right: TreeNode) -> TreeNode:
+        """
+        Joins two detached subtrees, the values of the left one being lower
+        than the ones of the right one, using the minimum of the right
+        subtree as the joining node.
+
+        :param left: the root of the left subtree
+        :type left: TreeNode
+        :param right: the root of the right subtree
+        :type right: TreeNode
+        :return: the root of the joined tree
+        :rtype: TreeNode
+        """
+        if left is self._NULL:
+            return right
+        if right is self._NULL:
+            return left
+
+        right.parent = None
+        right.color = self._BLACK
+        self.__root = right
+        minimum = self.__symmetrical_successor(right)
+        self.__delete(minimum)
+
+        minimum.left = minimum.right = self._NULL
+        minimum.subtree_size = 1
+        return self.__join(left, minimum, self.__root)
+
+    def __split(self, node: TreeNode, value: Any,
+                inclusive: bool) -> Tuple[TreeNode, TreeNode]:
+        """
+        Splits a detached subtree into the subtree of the values lower than
+        the given one (or equal, if inclusive) and the subtree of the rest,
+        joining the subtrees hanging from the search path of the value.
+
+        :param node: the root of the subtree
+        :type node: TreeNode
+        :param value: the value to split at
+        :type value: Any
+        :param inclusive: True if the value goes to the lower subtree
+        :type inclusive: bool
+        :return: the roots of the lower and the higher subtrees
+        :rtype: Tuple[TreeNode, TreeNode]
+        """
+        if node is self._NULL:
+            return self._NULL, self._NULL
+
+        left, right = node.left, node.right
+        node.left = node.right = self._NULL
+        if node.value < value or inclusive and node.value == value:
+            lower, higher = self.__split(right, value, inclusive)
+            return self.__join(left, node, lower), higher
+
+        lower, higher = self.__split(left, value, inclusive)
+        return lower, self.__join(higher, node, right)
+
+    def _detach_range(self, low: Any, high: Any, low_inclusive: bool = True,
+                      high_inclusive: bool = True) -> List[Any]:
+        """
+        Removes the values between the given bounds by splitting the tree at
+        both bounds and joining the outer parts, in *O(log² n)* time plus the
+        time to list the *k* removed values.
+
+        :param low: the lowest value of the range, or None if unbounded
+        :type low: Any
+        :param high: the greatest value of the range, or None if unbounded
+        :type high: Any
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: the removed values, in order
+        :rtype: List[Any]
+        """
+        below, rest = (self._NULL, self.__root) if low is None \
+            else self.__split(self.__root, low, not low_inclusive)
+        middle, above = (rest, self._NULL) if high is None \
+            else self.__split(rest, high, high_inclusive)
+
+        removed = [node.value for node in self.__inorder(True, middle)] \
+            if middle is not self._NULL else []
+        self.__root = self.__concatenate(below, above)
+        if self.__root is not self._NULL:
+            self.__root.parent = None
+            self.__root.color = self._BLACK
+
+        self.__size -= len(removed)
+        for value in removed:
+            self._update_fingerprint(value, False)
+            self._on_delete(value)
+
+        return removed
+
+    def __build(self, nodes: List[TreeNode]) -> TreeNode:
+        """
+        Links the given nodes, sorted by value, into a balanced detached
+        subtree in *O(n)* time: every subtree is rooted at the middle node of
+        its slice, so all the leaves are in the two deepest levels, and only
+        the nodes of the deepest level are red.
+
+        :param nodes: the sorted nodes
+        :type nodes: List[TreeNode]
+        :return: the root of the subtree
+        :rtype: TreeNode
+        """
+        deepest = len(nodes).bit_length() - 1
+
+        def build(start: int, end: int, depth: int) -> TreeNode:
+            """
+            Links the nodes of the given slice.
+
+            :param start: the first position of the slice
+            :type start: int
+            :param end: the position after the slice
+            :type end: int
+            :param depth: the depth of the root of the subtree
+            :type depth: int
+            :return: the root of the subtree
+            :rtype: TreeNode
+            """
+            if start >= end:
+                return self._NULL
+
+            middle = (start + end) // 2
+            node = nodes[middle]
+            node.left = build(start, middle, depth + 1)
+            node.right = build(middle + 1, end, depth + 1)
+            node.color = self._RED if depth == deepest and depth \
+                else self._BLACK
+            for child in (node.left, node.right):
+                if child is not self._NULL:
+                    child.parent = node
+            self._update_node(node)
+            return node
+
+        root = build(0, len(nodes), 0)
+        if root is not self._NULL:
+            root.parent = None
+        return root
+
+    def _remove_where(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """
+        Removes the values satisfying the given predicate, which is called
+        once per value in order. When they are at most ``REBUILD_FRACTION``
+        of the tree their nodes are deleted one by one, otherwise the kept
+        nodes are relinked into a balanced tree in *O(n)* time instead of
+        paying a rebalancing deletion per removed value.
+
+        :param predicate: function returning True for the values to remove
+        :type predicate: Callable[[Any], bool]
+        :return: the removed values, in order
+        :rtype: List[Any]
+        """
+        kept, removed = [], []
+        for node in self.__inorder(True):
+            (removed if predicate(node.value) else kept).append(node)
+
+        if len(removed) <= self.REBUILD_FRACTION * self.__size:
+            for node in removed:
+                self.__delete(node)
+        else:
+            self.__root = self.__build(kept)
+
+        self.__size -= len(removed)
+        for node in removed:
+            self._update_fingerprint(node.value, False)
+            self._on_delete(node.value)
+
+        return [node.value for node in removed]
+
+    def _merge(self, values: List[Any]) -> int:
+        """
+        Inserts the given sorted values without duplicates. When they are at
+        most ``REBUILD_FRACTION`` of the tree they are inserted one by one,
+        otherwise they are merged with the nodes of the tree, in order, and
+        all the nodes are relinked into a balanced tree in *O(n + m)* time
+        instead of paying a rebalancing insertion per value.
+
+        :param values: the sorted values without duplicates
+        :type values: List[Any]
+        :return: the number of values which were not in the tree
+        :rtype: int
+        """
+        if len(values) <= self.REBUILD_FRACTION * self.__size:
+            return sum(self._insert(value)[1] for value in values)
+
+        nodes, added = [], []
+        existing = self.__inorder(True)
+        node = next(existing, None)
+        for value in values:
+            while node is not None and node.value < value:
+                nodes.append(node)
+                node = next(existing, None)
+            if node is None or node.value != value:
+                nodes.append(self._node_type(value, self._NULL, self._NULL,
+                                             self._RED))
+                added.append(value)
+        if node is not None:
+            nodes.append(node)
+            nodes.extend(existing)
+
+        self.__root = self.__build(nodes)
+        self.__size += len(added)
+        for value in added:
+            self._update_fingerprint(value, True)
+            self._on_insert(value)
+
+        return len(added)
+
     def __contains(self, value) -> TreeNode:
         """
         Checks if the given value is contained in the current RedBlackTree and
@@ -502,15 +1466,18 @@ class RedBlackTree:
 
         return parent
 
-    def __inorder(self, inorder: bool) -> Any:
+    def __inorder(self, inorder: bool, root: TreeNode = None) -> Any:
         """
         Generator that traverses the RedBlackTree in-order or reversed.
 
         :param inorder: if True the route will be in-order else reversed
         :type inorder: bool
+        :param root: the root of the subtree to traverse, the root of the
+            tree by default
+        :type root: TreeNode
         """
         stack = SimpleStack()
-        current = self.__root
+        current = self.__root if root is None else root
 
         while True:
             if current is not self._NULL:
@@ -541,6 +1508,10 @@ class RedBlackTree:
         Check equality between the current instance and a given object.
         This method is called when using built-in operator '=='.
 
+        Different sizes or fingerprints tell in *O(1)* that both trees are
+        different, and otherwise they are walked in order in lock-step, so the
+        comparison takes *O(n)* time.
+
         :param other: other instance to compare with
         :type other: Any
         :return: True if instances are equal else False
@@ -550,8 +1521,14 @@ class RedBlackTree:
             if self.size() != other.size():
                 return False
 
-            for value in self:
-                if value not in other:
+            fingerprint, other_fingerprint = (self.fingerprint(),
+                                              other.fingerprint())
+            if fingerprint is not None and other_fingerprint is not None \
+                    and fingerprint != other_fingerprint:
+                return False
+
+            for value, other_value in zip(self, other):
+                if not value == other_value:
                     return False
 
             return True
@@ -660,10 +1637,36 @@ class TreeSet(RedBlackTree):
     *O(log n)* time cost for the basic operations.
 
     TreeSet string representation will be provided inorder.
+
+    The elements are stored in a Red-Black Tree unless the ``"blocked"``
+    backend is requested, in which case a :class:`BlockedTreeSet`, storing
+    them in a list of bounded sorted lists, is created instead.
     """
 
+    BACKENDS = ("red_black", "blocked")
+    RANGE_SUM = "range_sum"
+    WRITE_BUFFER_THRESHOLD = 100000
+
+    def __new__(cls, *args, **kwargs) -> 'TreeSet':
+        """
+        Creates a TreeSet instance of the class matching the requested
+        backend.
+
+        :raises ValueError: if the backend does not exist
+        """
+        backend = kwargs.get("backend", args[2] if len(args) > 2 else None)
+        if backend is not None and backend not in cls.BACKENDS:
+            raise ValueError(
+                f"Backend must be one of {cls.BACKENDS} but '{backend}' "
+                f"was given")
+
+        if backend == "blocked" and not issubclass(cls, BlockedTreeSet):
+            cls = BlockedTreeSet
+        return super().__new__(cls)
+
     def __init__(self, generic_type: Type,
-                 sequence: Collection[E] = None) -> None:
+                 sequence: Collection[E] = None,
+                 backend: str = "red_black") -> None:
         """
         Initialize an empty TreeSet if type is given or constructs one with the
         elements contained into the given collection.
@@ -673,6 +1676,10 @@ class TreeSet(RedBlackTree):
         :param: sequence: a collection to take items from and add them to
             the TreeSet
         :type sequence: Collection[E]
+        :param backend: "red_black" (default) to store the elements in a
+            Red-Black Tree, or "blocked" to store them in a list of bounded
+            sorted lists
+        :type backend: str
         :raises TypeError: if the given values does not match the instance type
         :raises NullPointerException: if the given value is None
         :raises ClassCastException: if the given value is not comparable
@@ -689,6 +1696,154 @@ class TreeSet(RedBlackTree):
 
         self.add_all(sequence)
 
+    @property
+    def backend(self) -> str:
+        """
+        Getter method to retrieve the name of the TreeSet backend.
+
+        :return: the name of the backend
+        :rtype: str
+        """
+        return "red_black"
+
+    def _stats_mixin(self) -> Type:
+        """
+        Returns the mixin class implementing the statistics of the TreeSet.
+
+        :return: the statistics mixin class
+        :rtype: Type
+        """
+        from model.instrumentation.tree_stats import TreeSetStats
+        return TreeSetStats
+
+    def _profiling_mixin(self) -> Type:
+        """
+        Returns the mixin class implementing the profiling of the TreeSet.
+
+        :return: the profiling mixin class
+        :rtype: Type
+        """
+        from model.instrumentation.profiling import TreeSetProfiling
+        return TreeSetProfiling
+
+    def enable_write_buffer(self,
+                            threshold: int = WRITE_BUFFER_THRESHOLD) -> None:
+        """
+        Starts collecting the values given to :meth:`add` in an unsorted
+        buffer instead of inserting them one by one. The buffer is sorted and
+        merged into the TreeSet in a single *O(n + m)* pass (see
+        :meth:`flush`) when it holds ``threshold`` values, or before any other
+        method reads or modifies the TreeSet, except :meth:`contains` and the
+        ``in`` operator, which also look the value up in the buffer.
+
+        While the buffer is enabled, :meth:`add` returns True even for a
+        value which is already in the TreeSet, since duplicates are only
+        discarded when the buffer is merged.
+
+        :param threshold: the number of buffered values which triggers a merge
+        :type threshold: int
+        :raises ValueError: if the threshold is not positive
+        """
+        if threshold < 1:
+            raise ValueError("Threshold must be positive")
+
+        from model.write_buffer import TreeSetWriteBuffer
+        TreeSetWriteBuffer.enable(self, threshold)
+
+    def disable_write_buffer(self) -> None:
+        """
+        Merges the buffered values into the TreeSet and stops buffering the
+        insertions.
+        """
+
+    def flush(self) -> int:
+        """
+        Merges the values of the write buffer into the TreeSet.
+
+        :return: the number of buffered values which were not in the TreeSet
+        :rtype: int
+        """
+        return 0
+
+    def buffered(self) -> int:
+        """
+        Returns the number of values waiting in the write buffer, which may
+        include values already in the TreeSet.
+
+        :return: the number of buffered values
+        :rtype: int
+        """
+        return 0
+
+    def enable_bloom_filter(self, false_positive_rate: float = 0.01) -> None:
+        """
+        Puts a counting Bloom filter of the elements in front of
+        :meth:`contains` and the ``in`` operator, so most of the values which
+        are not in the TreeSet are rejected in *O(1)* time, without searching
+        the tree. The filter is updated by every insertion and deletion, and
+        resized as the TreeSet grows.
+
+        :param false_positive_rate: the probability that the filter does not
+            reject a value which is not in the TreeSet
+        :type false_positive_rate: float
+        :raises ValueError: if the rate is not between 0 and 1
+        :raises UnsupportedOperationException: if the type of the TreeSet is
+            not hashable
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1")
+        if self.object_type.__hash__ is None:
+            raise UnsupportedOperationException(
+                f"Bloom filter needs a hashable type: {self.object_type}")
+
+        from model.bloom_filter import TreeSetBloomFilter
+        TreeSetBloomFilter.enable(self, false_positive_rate)
+
+    def disable_bloom_filter(self) -> None:
+        """
+        Removes the Bloom filter and discards its statistics.
+        """
+
+    def bloom_filter_stats(self, reset: bool = False) -> Dict[str, int]:
+        """
+        Returns a snapshot of the counters of the membership tests: the
+        ``lookups``, the ``hits``, the misses rejected by the filter
+        (``negatives``) and the ones it did not reject (``false_positives``).
+
+        :param reset: if True the counters are reset after the snapshot
+        :type reset: bool
+        :return: the value of every counter
+        :rtype: Dict[str, int]
+        :raises IllegalStateException: if the Bloom filter is not enabled
+        """
+        raise IllegalStateException("Bloom filter is not enabled")
+
+    def enable_hash_index(self) -> None:
+        """
+        Starts keeping a dict from every element to the node of the tree
+        holding it, so :meth:`contains`, the ``in`` operator and
+        :meth:`remove` find the node in *O(1)* average time, and
+        :meth:`higher`, :meth:`lower`, :meth:`ceiling` and :meth:`floor` of
+        an element of the TreeSet start from its node instead of descending
+        from the root. It costs a dict entry per element, updated by every
+        insertion and deletion.
+
+        :raises UnsupportedOperationException: if the type of the TreeSet is
+            not hashable
+        :raises TypeError: if some element is not hashable
+        """
+        if self.object_type.__hash__ is None:
+            raise UnsupportedOperationException(
+                f"Hash index needs a hashable type: {self.object_type}")
+
+        from model.hash_index import TreeSetHashIndex
+        TreeSetHashIndex.enable(self)
+
+    def disable_hash_index(self) -> None:
+        """
+        Removes the hash index of the TreeSet.
+        """
+
     def add_all(self, values: Collection[E]) -> bool:
         """
         Inserts the given values into the current TreeSet. If the type of some
@@ -730,7 +1885,16 @@ class TreeSet(RedBlackTree):
         :return: a shallow copy of the current TreeSet instance.
         :rtype: TreeSet
         """
-        return TreeSet(self.object_type, self)
+        return TreeSet(self.object_type, self, self.backend)
+
+    def freeze(self) -> 'FrozenTreeSet':
+        """
+        Returns an immutable and hashable snapshot of the current TreeSet.
+
+        :return: a FrozenTreeSet with the elements of the current TreeSet
+        :rtype: FrozenTreeSet
+        """
+        return FrozenTreeSet(self.object_type, self)
 
     def contains(self, value: E) -> bool:
         """
@@ -873,6 +2037,407 @@ class TreeSet(RedBlackTree):
 
         return result
 
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def _validate(self, value: E) -> None:
+        """
+        Validates a value given to a method taking several values, which
+        cannot use the validation decorators.
+
+        :param value: the value to validate
+        :type value: E
+        :raises TypeError: if the given value does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def rank(self, value: E) -> int:
+        """
+        Returns the number of elements lower than the given value, which is
+        the position it has or would have in the TreeSet, in *O(log n)* time.
+
+        :param value: value to compare
+        :type value: E
+        :return: the number of elements lower than the given value
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self._count_lower(value, False)
+
+    def count_range(self, low: E, high: E,
+                    inclusive: Union[bool, Tuple[bool, bool]] = True) -> int:
+        """
+        Returns the number of elements between the given values in
+        *O(log n)* time, whatever the number of elements in the range, using
+        the subtree sizes kept by the nodes.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the number of elements in the range
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(low)
+        self._validate(high)
+        low_inclusive, high_inclusive = self.__inclusive(inclusive)
+
+        if high < low:
+            return 0
+
+        return max(0, self._count_lower(high, high_inclusive)
+                   - self._count_lower(low, not low_inclusive))
+
+    @staticmethod
+    def __inclusive(inclusive: Union[bool, Tuple[bool, bool]]) \
+            -> Tuple[bool, bool]:
+        """
+        Returns whether the low and the high bound of a range are inclusive.
+
+        :param inclusive: whether both bounds are inclusive, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: whether the low and the high bound are inclusive
+        :rtype: Tuple[bool, bool]
+        """
+        if isinstance(inclusive, bool):
+            return inclusive, inclusive
+
+        low_inclusive, high_inclusive = inclusive
+        return low_inclusive, high_inclusive
+
+    def _sum_range(self, low: E, high: E, low_inclusive: bool,
+                   high_inclusive: bool) -> E:
+        """
+        Returns the sum of the elements between the given values from the
+        sums kept by the nodes, adding the ``RANGE_SUM`` augmentation in
+        *O(n)* time the first time, so later calls take *O(log n)* time.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: the sum of the elements in the range
+        :rtype: E
+        """
+        if self.RANGE_SUM not in self.augmentations():
+            self.add_augmentation(self.RANGE_SUM, operator.add, 0)
+
+        return self.aggregate(self.RANGE_SUM, low, high,
+                              (low_inclusive, high_inclusive))
+
+    def __check_range(self, low: E, high: E) -> None:
+        """
+        Validates the bounds of a range of a numeric TreeSet.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :raises UnsupportedOperationException: if the elements are not numbers
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        if not issubclass(self.object_type, numbers.Number):
+            raise UnsupportedOperationException(
+                f"Range statistics need numeric elements, not "
+                f"'{self.object_type}'")
+
+        self._validate(low)
+        self._validate(high)
+
+    def sum_range(self, low: E, high: E,
+                  inclusive: Union[bool, Tuple[bool, bool]] = True) -> E:
+        """
+        Returns the sum of the numbers between the given values. The nodes
+        keep the sum of their subtree once it has been asked for the first
+        time, so it takes *O(log n)* time whatever the number of elements in
+        the range.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the sum of the elements in the range, 0 if it is empty
+        :rtype: E
+        :raises UnsupportedOperationException: if the elements are not numbers
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__check_range(low, high)
+        if high < low:
+            return 0
+
+        return self._sum_range(low, high, *self.__inclusive(inclusive))
+
+    def mean_range(self, low: E, high: E,
+                   inclusive: Union[bool, Tuple[bool, bool]] = True) \
+            -> Union[float, None]:
+        """
+        Returns the mean of the numbers between the given values, from their
+        sum and count, in *O(log n)* time.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the mean of the elements in the range, or None if it is empty
+        :rtype: Union[float, None]
+        :raises UnsupportedOperationException: if the elements are not numbers
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__check_range(low, high)
+        count = self.count_range(low, high, inclusive)
+        if not count:
+            return None
+
+        return self._sum_range(low, high, *self.__inclusive(inclusive)) / count
+
+    def min_range(self, low: E, high: E,
+                  inclusive: Union[bool, Tuple[bool, bool]] = True) \
+            -> Union[E, None]:
+        """
+        Returns the lowest number between the given values, which is the
+        ceiling of the low bound if it is in the range, in *O(log n)* time.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the lowest element in the range, or None if it is empty
+        :rtype: Union[E, None]
+        :raises UnsupportedOperationException: if the elements are not numbers
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__check_range(low, high)
+        low_inclusive, high_inclusive = self.__inclusive(inclusive)
+        value = self.ceiling(low) if low_inclusive else self.higher(low)
+        if value is None or high < value or not high_inclusive \
+                and value == high:
+            return None
+
+        return value
+
+    def max_range(self, low: E, high: E,
+                  inclusive: Union[bool, Tuple[bool, bool]] = True) \
+            -> Union[E, None]:
+        """
+        Returns the greatest number between the given values, which is the
+        floor of the high bound if it is in the range, in *O(log n)* time.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the greatest element in the range, or None if it is empty
+        :rtype: Union[E, None]
+        :raises UnsupportedOperationException: if the elements are not numbers
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__check_range(low, high)
+        low_inclusive, high_inclusive = self.__inclusive(inclusive)
+        value = self.floor(high) if high_inclusive else self.lower(high)
+        if value is None or value < low or not low_inclusive and value == low:
+            return None
+
+        return value
+
+    def __check_all(self, values: Collection[E]) -> None:
+        """
+        Checks that the given values are a collection of values of the
+        instance type.
+
+        :param values: the values to check
+        :type values: Collection[E]
+        :raises TypeError: if the given values are not a collection or do not
+            match the instance type
+        :raises NullPointerException: if some given value is None
+        """
+        if not isinstance(values, Collection):
+            raise TypeError(
+                f"Argument must be a collection but {type(values)} was given")
+
+        for value in values:
+            if value is None:
+                raise NullPointerException("Value cannot be None")
+
+            if not isinstance(value, self.object_type):
+                raise TypeError(
+                    f"Value type must be '{self.object_type}: {type(value)}'")
+
+    @staticmethod
+    def __merged_membership(values: Collection[E]) -> Callable[[E], bool]:
+        """
+        Returns a predicate telling whether a value is one of the given ones,
+        which must be called with increasing values: it advances through the
+        sorted values as a merge does, so checking the *n* elements of the
+        TreeSet costs *O(n + m log m)* time and no hashing.
+
+        :param values: the values to look for
+        :type values: Collection[E]
+        :return: the membership predicate
+        :rtype: Callable[[E], bool]
+        """
+        others = iter(sorted(values))
+        other = next(others, None)
+
+        def contains(value: E) -> bool:
+            nonlocal other
+            while other is not None and other < value:
+                other = next(others, None)
+            return other is not None and other == value
+
+        return contains
+
+    def remove_all(self, values: Collection[E]) -> bool:
+        """
+        Removes every element contained in the given values. A few values are
+        deleted one by one, while larger batches are merged with the elements
+        in a single pass which, when they are more than ``REBUILD_FRACTION``
+        of the TreeSet, rebuilds the tree in *O(n)* time from the remaining
+        elements.
+
+        :param values: the values to remove
+        :type values: Collection[E]
+        :return: True if the TreeSet changed
+        :rtype: bool
+        :raises TypeError: if the given values are not a collection or do not
+            match the instance type
+        :raises NullPointerException: if some given value is None
+        """
+        self.__check_all(values)
+        if len(values) > self.REBUILD_FRACTION * self.size():
+            return bool(self._remove_where(self.__merged_membership(values)))
+
+        changed = False
+        for value in values:
+            changed = self.remove(value) or changed
+        return changed
+
+    def retain_all(self, values: Collection[E]) -> bool:
+        """
+        Removes every element not contained in the given values, in a single
+        merge pass followed by per-element deletions or a rebuild like
+        :meth:`remove_all`.
+
+        :param values: the values to retain
+        :type values: Collection[E]
+        :return: True if the TreeSet changed
+        :rtype: bool
+        :raises TypeError: if the given values are not a collection or do not
+            match the instance type
+        :raises NullPointerException: if some given value is None
+        """
+        self.__check_all(values)
+        contains = self.__merged_membership(values)
+        return bool(self._remove_where(lambda value: not contains(value)))
+
+    def remove_if(self, predicate: Callable[[E], bool]) -> bool:
+        """
+        Removes every element satisfying the given predicate, which is called
+        once per element in order, deleting them one by one or rebuilding the
+        tree from the remaining elements like :meth:`remove_all`.
+
+        :param predicate: function returning True for the elements to remove
+        :type predicate: Callable[[E], bool]
+        :return: True if the TreeSet changed
+        :rtype: bool
+        """
+        return bool(self._remove_where(predicate))
+
+    def remove_range(self, low: E, high: E,
+                     inclusive: Union[bool, Tuple[bool, bool]] = True) -> int:
+        """
+        Removes every element between the given values at once, splitting
+        the tree at both bounds and joining the outer parts, instead of
+        deleting them one by one.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param inclusive: whether both bounds belong to the range, or a pair
+            telling it for the low and the high bound
+        :type inclusive: Union[bool, Tuple[bool, bool]]
+        :return: the number of removed elements
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        if not self.count_range(low, high, inclusive):
+            return 0
+
+        return len(self._detach_range(low, high, *self.__inclusive(inclusive)))
+
+    def drain_until(self, value: E, inclusive: bool = True) -> List[E]:
+        """
+        Removes and returns, in order, every element lower than or equal to
+        the given value (or only lower, if not inclusive), detaching them at
+        once like :meth:`remove_range`.
+
+        :param value: the greatest value to remove
+        :type value: E
+        :param inclusive: True to also remove the given value
+        :type inclusive: bool
+        :return: the removed elements, in order
+        :rtype: List[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(value)
+        if not self._count_lower(value, inclusive):
+            return []
+
+        return self._detach_range(None, value, True, inclusive)
+
     def first(self) -> E:
         """
         Returns the lowest element contained in the current TreeSet instance.
@@ -949,6 +2514,1079 @@ class TreeSet(RedBlackTree):
         """
         return iter(reversed(self))
 
+    def __as_tree_set(self, other: Iterable[E]) -> 'TreeSet':
+        """
+        Returns the given values as a TreeSet, so they can be walked in order.
+
+        :param other: a TreeSet or an iterable of values
+        :type other: Iterable[E]
+        :return: the given TreeSet, or a TreeSet of the given values
+        :rtype: TreeSet
+        :raises TypeError: if the given values are not iterable or do not
+            match the instance type
+        """
+        if isinstance(other, TreeSet):
+            return other
+
+        if not isinstance(other, Iterable):
+            raise TypeError(
+                f"Argument must be iterable but {type(other)} was given")
+
+        return TreeSet(self.object_type, list(other))
+
+    def issubset(self, other: Iterable[E]) -> bool:
+        """
+        Checks if every element of the current TreeSet is contained in the
+        given set. Both sets are merged in order in *O(n + m)* time, unless
+        their sizes or their bounds already tell the result.
+
+        :param other: a TreeSet or an iterable of values
+        :type other: Iterable[E]
+        :return: True if the current TreeSet is a subset of the other one
+        :rtype: bool
+        :raises TypeError: if the given values are not iterable or do not
+            match the instance type
+        """
+        other = self.__as_tree_set(other)
+        if self.size() > other.size():
+            return False
+        if self.is_empty():
+            return True
+        if self.first() < other.first() or other.last() < self.last():
+            return False
+
+        other_values = iter(other)
+        for value in self:
+            for other_value in other_values:
+                if not other_value < value:
+                    break
+            else:
+                return False
+
+            if not other_value == value:
+                return False
+
+        return True
+
+    def issuperset(self, other: Iterable[E]) -> bool:
+        """
+        Checks if every element of the given set is contained in the current
+        TreeSet, merging both sets in order in *O(n + m)* time.
+
+        :param other: a TreeSet or an iterable of values
+        :type other: Iterable[E]
+        :return: True if the current TreeSet is a superset of the other one
+        :rtype: bool
+        :raises TypeError: if the given values are not iterable or do not
+            match the instance type
+        """
+        return self.__as_tree_set(other).issubset(self)
+
+    def isdisjoint(self, other: Iterable[E]) -> bool:
+        """
+        Checks if the current TreeSet and the given set have no element in
+        common. Both sets are merged in order in *O(n + m)* time, unless their
+        bounds do not overlap.
+
+        :param other: a TreeSet or an iterable of values
+        :type other: Iterable[E]
+        :return: True if both sets have no element in common
+        :rtype: bool
+        :raises TypeError: if the given values are not iterable or do not
+            match the instance type
+        """
+        other = self.__as_tree_set(other)
+        if self.is_empty() or other.is_empty():
+            return True
+        if self.last() < other.first() or other.last() < self.first():
+            return True
+
+        values, other_values = iter(self), iter(other)
+        value, other_value = next(values), next(other_values)
+        try:
+            while True:
+                if value == other_value:
+                    return False
+                elif value < other_value:
+                    value = next(values)
+                else:
+                    other_value = next(other_values)
+        except StopIteration:
+            return True
+
+    def __le__(self, other: Any) -> bool:
+        """
+        Checks if the current TreeSet is a subset of the given one.
+        This method is called when using built-in operator '<='.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if the current TreeSet is a subset of the other one
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.issubset(other)
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        Checks if the current TreeSet is a proper subset of the given one.
+        This method is called when using built-in operator '<'.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if the current TreeSet is a proper subset of the other
+            one
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.size() < other.size() and self.issubset(other)
+
+    def __ge__(self, other: Any) -> bool:
+        """
+        Checks if the current TreeSet is a superset of the given one.
+        This method is called when using built-in operator '>='.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if the current TreeSet is a superset of the other one
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.issuperset(other)
+
+    def __gt__(self, other: Any) -> bool:
+        """
+        Checks if the current TreeSet is a proper superset of the given one.
+        This method is called when using built-in operator '>'.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if the current TreeSet is a proper superset of the other
+            one
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.size() > other.size() and self.issuperset(other)
+
+    def save(self, path: str) -> int:
+        """
+        Saves the current TreeSet into a versioned binary file holding its
+        elements as a sorted array. Only ``int`` (stored as 64 bits integers)
+        and ``float`` TreeSets can be saved. The file can be loaded instantly
+        with :meth:`open_mmap`.
+
+        :param path: destination of the file
+        :type path: str
+        :return: the number of saved elements
+        :rtype: int
+        :raises TypeError: if the TreeSet type cannot be saved
+        :raises OverflowError: if an int element does not fit into 64 bits
+        """
+        from model.storage.sorted_array_file import write_sorted_array
+
+        return write_sorted_array(path, self.object_type, self)
+
+    @staticmethod
+    def open_mmap(path: str) -> 'MappedTreeSet':
+        """
+        Opens a file written by :meth:`save` as a read-only set. The file is
+        memory-mapped, so no element is loaded upfront and the pages are shared
+        between the processes opening the same file.
+
+        :param path: the path of the file
+        :type path: str
+        :return: a read-only set backed by the file
+        :rtype: MappedTreeSet
+        :raises ValueError: if the file is not a valid TreeSet file
+        """
+        from model.storage.sorted_array_file import MappedTreeSet
+
+        return MappedTreeSet(path)
+
+
+class BlockedTreeSet(TreeSet):
+    """
+    Class that represents a TreeSet storing its elements in a list of sorted
+    Python lists (blocks) whose length is bounded, instead of a Red-Black Tree.
+    Searches are two binary searches with :mod:`bisect`, one over the greatest
+    element of every block and one inside a block, and insertions and
+    deletions shift a single block with ``list.insert`` and ``del``.
+
+    It offers the same public API as the Red-Black Tree backend, with fewer
+    Python objects and better locality. It is created with
+    ``TreeSet(generic_type, sequence, backend="blocked")``.
+    """
+
+    __attributes = {
+        "_BlockedTreeSet__blocks", "_BlockedTreeSet__maxes",
+        "_BlockedTreeSet__size", "_BlockedTreeSet__load",
+        "_BlockedTreeSet__offsets"
+    }
+
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, generic_type: Type,
+                 sequence: Collection[E] = None,
+                 backend: str = "blocked",
+                 load: int = DEFAULT_LOAD) -> None:
+        """
+        Initialize an empty BlockedTreeSet if type is given or constructs one
+        with the elements contained into the given collection.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param: sequence: a collection to take items from and add them to
+            the TreeSet
+        :type sequence: Collection[E]
+        :param backend: must be "blocked", present for TreeSet compatibility
+        :type backend: str
+        :param load: the length of the blocks, which are split when they
+            double it and merged when they fall under its half
+        :type load: int
+        :raises TypeError: if the given values does not match the instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        :raises ValueError: if the load is lower than 2
+        """
+        if load < 2:
+            raise ValueError("Load must be at least 2")
+
+        self.__blocks = []
+        self.__maxes = []
+        self.__size = 0
+        self.__load = load
+        self.__offsets = None
+        super().__init__(generic_type, sequence)
+
+    @property
+    def backend(self) -> str:
+        """
+        Getter method to retrieve the name of the TreeSet backend.
+
+        :return: the name of the backend
+        :rtype: str
+        """
+        return "blocked"
+
+    def enable_stats(self) -> None:
+        """
+        Statistics count the internal operations of the Red-Black Tree, so
+        they are not available for the blocked backend.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException(
+            "Statistics are not supported by the blocked backend")
+
+    def add_augmentation(self, name: str, combine: Callable[[E, E], E],
+                         identity: E, mapper: Callable[[E], E] = None) -> None:
+        """
+        Augmentations are kept by the nodes of the Red-Black Tree, so they are
+        not available for the blocked backend.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException(
+            "Augmentations are not supported by the blocked backend")
+
+    def enable_finger_search(self) -> None:
+        """
+        The finger is a node of the Red-Black Tree, so the finger search is
+        not available for the blocked backend.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException(
+            "Finger search is not supported by the blocked backend")
+
+    def enable_hash_index(self) -> None:
+        """
+        The hash index maps the elements to the nodes of the Red-Black Tree,
+        so it is not available for the blocked backend.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException(
+            "Hash index is not supported by the blocked backend")
+
+    def height(self) -> int:
+        """
+        The blocked backend is not a tree, so it has no height.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException(
+            "Height is not supported by the blocked backend")
+
+    def black_height(self) -> int:
+        """
+        The blocked backend is not a tree, so it has no black height.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException(
+            "Black height is not supported by the blocked backend")
+
+    def shape_stats(self) -> Dict[str, Any]:
+        """
+        Returns the shape of the BlockedTreeSet: ``size``, ``blocks`` (their
+        number), ``load`` and ``block_sizes`` (their lengths, in order).
+
+        :return: the shape statistics
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "size": self.__size,
+            "blocks": len(self.__blocks),
+            "load": self.__load,
+            "block_sizes": [len(block) for block in self.__blocks],
+        }
+
+    def verify(self, paths: int = None) -> bool:
+        """
+        Verifies the invariants of the BlockedTreeSet: non-empty blocks no
+        longer than twice the load, values strictly ordered within and across
+        blocks, the greatest value of every block indexed and a consistent
+        size.
+
+        :param paths: the number of random blocks to check, or None to check
+            every block
+        :type paths: int
+        :return: True if the set is valid
+        :rtype: bool
+        :raises IllegalStateException: if some invariant does not hold
+        :raises ValueError: if the number of blocks is not positive
+        """
+        if paths is not None and paths < 1:
+            raise ValueError("Number of paths must be positive")
+
+        def fail(message: str) -> NoReturn:
+            """
+            Raises an IllegalStateException describing a violated invariant.
+
+            :param message: the description of the invariant
+            :type message: str
+            :raises IllegalStateException: always
+            """
+            raise IllegalStateException(f"Invalid BlockedTreeSet: {message}")
+
+        if len(self.__maxes) != len(self.__blocks):
+            fail("the blocks and their maxima do not match")
+
+        indexes = range(len(self.__blocks)) if paths is None \
+            else [random.randrange(len(self.__blocks))
+                  for _ in range(paths if self.__blocks else 0)]
+        for index in indexes:
+            block = self.__blocks[index]
+            if not block or len(block) > 2 * self.__load:
+                fail(f"block {index} of length {len(block)}")
+            if any(not block[i] < block[i + 1]
+                   for i in range(len(block) - 1)):
+                fail(f"values out of order in block {index}")
+            if self.__maxes[index] is not block[-1]:
+                fail(f"wrong maximum of block {index}")
+            if index and not self.__maxes[index - 1] < block[0]:
+                fail(f"blocks {index - 1} and {index} out of order")
+
+        if paths is None and sum(map(len, self.__blocks)) != self.__size:
+            fail(f"size {self.__size} does not match the blocks")
+
+        return True
+
+    def __split(self, index: int) -> None:
+        """
+        Splits the block at the given position if it doubles the load.
+
+        :param index: the position of the block
+        :type index: int
+        """
+        block = self.__blocks[index]
+        if len(block) <= 2 * self.__load:
+            return
+
+        half = block[self.__load:]
+        del block[self.__load:]
+        self.__blocks.insert(index + 1, half)
+        self.__maxes[index] = block[-1]
+        self.__maxes.insert(index + 1, half[-1])
+
+    @RedBlackTree._check_comparable
+    def __check(self, value: E) -> None:
+        """
+        Checks the comparability of a value before sorting it.
+
+        :param value: the value to check
+        :type value: E
+        :raise ClassCastException: if the given value is not comparable
+        """
+
+    def __build(self, values: List[E]) -> None:
+        """
+        Replaces the content of the BlockedTreeSet with the given sorted values
+        without duplicates.
+
+        :param values: the sorted values
+        :type values: List[E]
+        """
+        self.__blocks = [values[start:start + self.__load]
+                         for start in range(0, len(values), self.__load)]
+        self.__maxes = [block[-1] for block in self.__blocks]
+        self.__size = len(values)
+        self.__offsets = None
+        self._reset_fingerprint()
+        self._on_clear()
+        for value in values:
+            self._update_fingerprint(value, True)
+            self._on_insert(value)
+
+    def _remove_where(self, predicate: Callable[[E], bool]) -> List[E]:
+        """
+        Removes the values satisfying the given predicate, which is called
+        once per value in order, rebuilding the blocks from the kept values.
+
+        :param predicate: function returning True for the values to remove
+        :type predicate: Callable[[E], bool]
+        :return: the removed values, in order
+        :rtype: List[E]
+        """
+        kept, removed = [], []
+        for block in self.__blocks:
+            for value in block:
+                (removed if predicate(value) else kept).append(value)
+
+        if removed:
+            self.__build(kept)
+        return removed
+
+    def _merge(self, values: List[E]) -> int:
+        """
+        Inserts the given sorted values without duplicates. When they are at
+        most ``REBUILD_FRACTION`` of the set they are inserted one by one,
+        otherwise they are merged with the values of the blocks, in order, and
+        the blocks are rebuilt in *O(n + m)* time.
+
+        :param values: the sorted values without duplicates
+        :type values: List[E]
+        :return: the number of values which were not in the set
+        :rtype: int
+        """
+        if len(values) <= self.REBUILD_FRACTION * self.__size:
+            return sum(BlockedTreeSet.add(self, value) for value in values)
+
+        merged = []
+        for value in heapq.merge(chain.from_iterable(self.__blocks), values):
+            if not merged or merged[-1] != value:
+                merged.append(value)
+
+        added = len(merged) - self.__size
+        self.__build(merged)
+        return added
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def add(self, value: E) -> bool:
+        """
+        Inserts a new value into the BlockedTreeSet.
+
+        :param value: the value to insert
+        :type value: E
+        :return: False if the value already exists in the set, True otherwise
+        :rtype: bool
+        """
+        if not self.__blocks:
+            self.__blocks.append([value])
+            self.__maxes.append(value)
+            self.__size = 1
+            self.__offsets = None
+            self._update_fingerprint(value, True)
+            self._on_insert(value)
+            return True
+
+        index = bisect_left(self.__maxes, value)
+        if index == len(self.__maxes):
+            index -= 1
+            self.__blocks[index].append(value)
+            self.__maxes[index] = value
+        else:
+            block = self.__blocks[index]
+            position = bisect_left(block, value)
+            if block[position] == value:
+                return False
+            block.insert(position, value)
+
+        self.__size += 1
+        self.__offsets = None
+        self._update_fingerprint(value, True)
+        self._on_insert(value)
+        self.__split(index)
+        return True
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def remove(self, value: E) -> bool:
+        """
+        Deletes a value from the BlockedTreeSet.
+
+        :param value: the value to delete
+        :type value: E
+        :return: False if the value does not exist in the set, True otherwise
+        :rtype: bool
+        """
+        index = bisect_left(self.__maxes, value)
+        if index == len(self.__maxes):
+            return False
+
+        block = self.__blocks[index]
+        position = bisect_left(block, value)
+        if block[position] != value:
+            return False
+
+        self._update_fingerprint(block[position], False)
+        self._on_delete(block[position])
+        del block[position]
+        self.__size -= 1
+        self.__offsets = None
+
+        if not block:
+            del self.__blocks[index]
+            del self.__maxes[index]
+        elif len(block) < self.__load // 2 and len(self.__blocks) > 1:
+            if index == 0:
+                index = 1
+            self.__blocks[index - 1].extend(self.__blocks.pop(index))
+            del self.__maxes[index]
+            self.__maxes[index - 1] = self.__blocks[index - 1][-1]
+            self.__split(index - 1)
+        else:
+            self.__maxes[index] = block[-1]
+
+        return True
+
+    def add_all(self, values: Collection[E]) -> bool:
+        """
+        Inserts the given values into the current BlockedTreeSet. If the type
+        of some value does not match the instance type, an exception will be
+        thrown, and no element will be added. An empty BlockedTreeSet is built
+        directly from the sorted values.
+
+        :param values: values to insert into the TreeSet.
+        :type values: Collection[E]
+        :return: True if all values could be inserted else False
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        if not isinstance(values, Collection):
+            raise TypeError(
+                f"Second argument must be a sequence but {type(values)} was given"
+            )
+
+        for value in values:
+            if value is None:
+                raise NullPointerException("Value cannot be None")
+
+            if not isinstance(value, self.object_type):
+                raise TypeError(
+                    f"Value type must be '{self.object_type}: {type(value)}'")
+
+        if self.__size > 0:
+            old_size = self.__size
+            for value in values:
+                self.add(value)
+            return old_size == self.__size - len(values)
+
+        for value in values:
+            self.__check(value)
+
+        ordered = []
+        for value in sorted(values):
+            if not ordered or ordered[-1] != value:
+                ordered.append(value)
+        self.__build(ordered)
+
+        return len(ordered) == len(values)
+
+    def _count_lower(self, value: E, inclusive: bool) -> int:
+        """
+        Returns the number of elements lower than the given value: the
+        elements of the blocks before the one of the value, taken from a
+        prefix sum of the block lengths (rebuilt after modifications), plus
+        its position inside its block.
+
+        :param value: value to compare
+        :type value: E
+        :param inclusive: True to also count the value itself
+        :type inclusive: bool
+        :return: the number of elements lower (or equal) than the value
+        :rtype: int
+        """
+        search = bisect_right if inclusive else bisect_left
+        index = search(self.__maxes, value)
+        if index == len(self.__maxes):
+            return self.__size
+
+        if self.__offsets is None:
+            self.__offsets = [0, *accumulate(map(len, self.__blocks))]
+        return self.__offsets[index] + search(self.__blocks[index], value)
+
+    def _sum_range(self, low: E, high: E, low_inclusive: bool,
+                   high_inclusive: bool) -> E:
+        """
+        Returns the sum of the elements between the given values, summing the
+        slices of the blocks overlapping the range.
+
+        :param low: the lowest value of the range
+        :type low: E
+        :param high: the greatest value of the range
+        :type high: E
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: the sum of the elements in the range
+        :rtype: E
+        """
+        lower = bisect_left if low_inclusive else bisect_right
+        upper = bisect_right if high_inclusive else bisect_left
+        total = 0
+        for index in range(lower(self.__maxes, low), len(self.__blocks)):
+            block = self.__blocks[index]
+            end = upper(block, high)
+            total += sum(block[lower(block, low):end])
+            if end < len(block):
+                break
+
+        return total
+
+    def _detach_range(self, low: E, high: E, low_inclusive: bool = True,
+                      high_inclusive: bool = True) -> List[E]:
+        """
+        Removes the values between the given bounds by deleting a slice of
+        every block overlapping the range, merging the first remaining block
+        with the next one if it became too small.
+
+        :param low: the lowest value of the range, or None if unbounded
+        :type low: E
+        :param high: the greatest value of the range, or None if unbounded
+        :type high: E
+        :param low_inclusive: True if the low bound belongs to the range
+        :type low_inclusive: bool
+        :param high_inclusive: True if the high bound belongs to the range
+        :type high_inclusive: bool
+        :return: the removed values, in order
+        :rtype: List[E]
+        """
+        low_search = bisect_left if low_inclusive else bisect_right
+        high_search = bisect_right if high_inclusive else bisect_left
+        first = index = 0 if low is None else low_search(self.__maxes, low)
+        removed = []
+
+        while index < len(self.__blocks):
+            block = self.__blocks[index]
+            start = 0 if low is None else low_search(block, low)
+            end = len(block) if high is None else high_search(block, high)
+            if start >= end:
+                break
+
+            removed.extend(block[start:end])
+            partial = end < len(block)
+            del block[start:end]
+            if block:
+                self.__maxes[index] = block[-1]
+                index += 1
+            else:
+                del self.__blocks[index]
+                del self.__maxes[index]
+
+            if partial:
+                break
+
+        if first < len(self.__blocks) - 1 \
+                and len(self.__blocks[first]) < self.__load // 2:
+            self.__blocks[first].extend(self.__blocks.pop(first + 1))
+            del self.__maxes[first + 1]
+            self.__maxes[first] = self.__blocks[first][-1]
+            self.__split(first)
+
+        self.__size -= len(removed)
+        self.__offsets = None
+        for value in removed:
+            self._update_fingerprint(value, False)
+            self._on_delete(value)
+
+        return removed
+
+    def size(self) -> int:
+        """
+        Returns the size of the BlockedTreeSet.
+
+        :return: the size of the BlockedTreeSet
+        :rtype: int
+        """
+        return self.__size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the current BlockedTreeSet is empty or not.
+
+        :return: True if BlockedTreeSet is empty else False
+        :rtype: bool
+        """
+        return self.__size == 0
+
+    def clear(self) -> None:
+        """
+        Clears the BlockedTreeSet.
+        """
+        self.__blocks = []
+        self.__maxes = []
+        self.__size = 0
+        self.__offsets = None
+        self._reset_fingerprint()
+        self._on_clear()
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def higher(self, value: E) -> Union[E, None]:
+        """
+        Returns the next higher value in the set compared to the given value.
+
+        :param value: value to compare
+        :return: the next higher value in the set compared to the given value
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        index = bisect_right(self.__maxes, value)
+        if index == len(self.__maxes):
+            return None
+
+        block = self.__blocks[index]
+        return block[bisect_right(block, value)]
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def lower(self, value: E) -> Union[E, None]:
+        """
+        Returns the greatest element lower than the given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest element lower than the given value. If it was not
+            found, None will be returned.
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        index = bisect_left(self.__maxes, value)
+        if index < len(self.__maxes):
+            block = self.__blocks[index]
+            position = bisect_left(block, value)
+            if position > 0:
+                return block[position - 1]
+
+        return self.__blocks[index - 1][-1] if index > 0 else None
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def ceiling(self, value: E) -> Union[E, None]:
+        """
+        Returns the least element in this set greater than or equal to the
+        given element, or None if there is no such element.
+
+        :param value: value to compare
+        :type value: E
+        :return: the least element in this set greater than or equal
+            to the given element. If it was not found, None will be returned
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        index = bisect_left(self.__maxes, value)
+        if index == len(self.__maxes):
+            return None
+
+        block = self.__blocks[index]
+        return block[bisect_left(block, value)]
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def floor(self, value: E) -> Union[E, None]:
+        """
+        Returns the greatest element in this set less than or equal to the
+        given element, or None if there is no such element.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest element in this set less than or
+            equal to the given element
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        index = bisect_left(self.__maxes, value)
+        if index < len(self.__maxes):
+            block = self.__blocks[index]
+            position = bisect_right(block, value)
+            if position > 0:
+                return block[position - 1]
+
+        return self.__blocks[index - 1][-1] if index > 0 else None
+
+    def first(self) -> E:
+        """
+        Returns the lowest element contained in the current BlockedTreeSet.
+
+        :return: the lowest contained element
+        :rtype: E
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        return self.__blocks[0][0]
+
+    def last(self) -> E:
+        """
+        Return the greatest element contained in the current BlockedTreeSet.
+
+        :return: the greatest contained element
+        :rtype: E
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        return self.__blocks[-1][-1]
+
+    def __iter__(self) -> Any:
+        """
+        Method to iterate over the BlockedTreeSet instance.
+
+        :return: an iterator over the BlockedTreeSet instance
+        :rtype: Any
+        """
+        for block in self.__blocks:
+            yield from block
+
+    def __reversed__(self) -> Any:
+        """
+        Method to iterate reversely over the BlockedTreeSet instance.
+
+        :return: an iterator over the BlockedTreeSet instance
+        :rtype: Any
+        """
+        for block in reversed(self.__blocks):
+            yield from reversed(block)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def __contains__(self, value: E) -> bool:
+        """
+        Check if the given value is contained in the BlockedTreeSet or not.
+        This method is called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: E
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        index = bisect_left(self.__maxes, value)
+        if index == len(self.__maxes):
+            return False
+
+        block = self.__blocks[index]
+        return block[bisect_left(block, value)] == value
+
+    def __len__(self) -> int:
+        """
+        Provides the length of the current BlockedTreeSet. It is used with the
+        built-in method len().
+
+        :return: the length of the BlockedTreeSet
+        :rtype: int
+        """
+        return self.__size
+
+
+class FrozenTreeSet(TreeSet):
+    """
+    Class that represents an immutable TreeSet. Its elements are given when
+    it is created, and every method modifying it raises an
+    UnsupportedOperationException.
+
+    A FrozenTreeSet of hashable elements is hashable, its hash being its
+    fingerprint, so it can be used as a dict key or as an element of a set.
+    """
+
+    def __init__(self, generic_type: Type,
+                 sequence: Collection[E] = None) -> None:
+        """
+        Initialize a FrozenTreeSet with the elements contained into the given
+        collection.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param: sequence: a collection to take items from
+        :type sequence: Collection[E]
+        :raises TypeError: if the given values does not match the instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        super().__init__(generic_type)
+        if sequence:
+            TreeSet.add_all(self, sequence)
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the FrozenTreeSet, which is its fingerprint.
+
+        :return: the hash of the FrozenTreeSet
+        :rtype: int
+        :raises TypeError: if its elements are not hashable
+        """
+        if (fingerprint := self.fingerprint()) is None:
+            raise TypeError(
+                f"unhashable FrozenTreeSet of type '{self.object_type}'")
+        return fingerprint
+
+    def freeze(self) -> 'FrozenTreeSet':
+        """
+        Returns the current FrozenTreeSet, which is already immutable.
+
+        :return: the current FrozenTreeSet
+        :rtype: FrozenTreeSet
+        """
+        return self
+
+    def __immutable(self) -> NoReturn:
+        """
+        Raises the exception of the methods modifying the FrozenTreeSet.
+
+        :raises UnsupportedOperationException: always
+        """
+        raise UnsupportedOperationException("FrozenTreeSet is immutable")
+
+    def add(self, value: E) -> bool:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def add_all(self, values: Collection[E]) -> bool:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def remove(self, value: E) -> bool:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def clear(self) -> None:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def poll_first(self) -> E:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def poll_last(self) -> E:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def remove_range(self, low: E, high: E,
+                     inclusive: Union[bool, Tuple[bool, bool]] = True) -> int:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def drain_until(self, value: E, inclusive: bool = True) -> List[E]:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def remove_all(self, values: Collection[E]) -> bool:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def retain_all(self, values: Collection[E]) -> bool:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def remove_if(self, predicate: Callable[[E], bool]) -> bool:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
+    def enable_write_buffer(self,
+                            threshold: int = TreeSet.WRITE_BUFFER_THRESHOLD) \
+            -> None:
+        """
+        FrozenTreeSet cannot be modified.
+
+        :raises UnsupportedOperationException: always
+        """
+        self.__immutable()
+
 
 if __name__ == "__main__":
     items = list(range(150))
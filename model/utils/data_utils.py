@@ -273,8 +273,8 @@ class Node:
 class TreeNode(Node):
     """
     Class that represents a TreeNode, which is a specialized Node that also
-    includes a color property. This class is used in the RedBlackTree data
-    structure.
+    includes a color property and the number of nodes of the subtree rooted
+    at it. This class is used in the RedBlackTree data structure.
     """
 
     class TreeNodeUtils(Enum):
@@ -306,6 +306,7 @@ class TreeNode(Node):
         """
         super().__init__(value)
         self.parent = None
+        self.subtree_size = 1
         self.color = color
         self.left = left
         self.right = right
@@ -0,0 +1,198 @@
+"""
+write_buffer module.
+
+This module provides the write buffer of a TreeSet, enabled by
+:meth:`TreeSet.enable_write_buffer`. The values given to ``add`` are collected
+in an unsorted buffer, and a burst of insertions is sorted and merged into the
+TreeSet at once (see :meth:`RedBlackTree._merge`), relinking all the nodes in
+*O(n + m)* time instead of paying a rebalancing insertion per value. The merge
+happens when the buffer is full or before any other method reads or modifies
+the TreeSet, except the membership tests, which also look the buffer up.
+
+Like the statistics, the write buffer changes the class of the TreeSet to a
+subclass mixing :class:`TreeSetWriteBuffer` in, so a TreeSet without buffer
+runs the original code.
+"""
+from typing import *
+from model.tree_set import RedBlackTree, TreeSet
+
+E = TypeVar('E')
+
+
+def _flushed(name: str) -> Callable:
+    """
+    Creates a method merging the write buffer before calling the method of
+    the given name of the buffered class.
+
+    :param name: the name of the method
+    :type name: str
+    :return: the merging method
+    :rtype: Callable
+    """
+
+    def method(self, *args, **kwargs):
+        if self._TreeSetWriteBuffer__buffer:
+            self.flush()
+        return getattr(super(TreeSetWriteBuffer, self), name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = f"Merges the write buffer before :meth:`{name}`."
+    return method
+
+
+class TreeSetWriteBuffer:
+    """
+    Mixin collecting the insertions of a TreeSet in a buffer, a set while the
+    values are hashable and a list otherwise, merged into the TreeSet before
+    it is read.
+    """
+
+    __attributes = {
+        "_TreeSetWriteBuffer__buffer",
+        "_TreeSetWriteBuffer__threshold",
+    }
+
+    # Wraps the features reading the tree without calling the TreeSet, like
+    # the statistics, so they see the buffered values
+    _feature_order = -1
+
+    METHODS = ("remove", "size", "is_empty", "fingerprint", "height",
+               "black_height", "shape_stats", "verify", "add_augmentation",
+               "aggregate", "add_all", "clone", "freeze", "higher", "lower",
+               "ceiling", "floor", "rank", "count_range", "sum_range",
+               "mean_range", "min_range", "max_range", "remove_all",
+               "retain_all", "remove_if", "remove_range", "drain_until",
+               "first", "last", "poll_first", "poll_last", "iterator",
+               "descending_iterator", "issubset", "issuperset", "isdisjoint",
+               "save", "__eq__", "__iter__", "__reversed__", "__str__",
+               "__len__", "__le__", "__lt__", "__ge__", "__gt__")
+
+    @classmethod
+    def enable(cls, tree: TreeSet, threshold: int) -> None:
+        """
+        Starts buffering the insertions of the given TreeSet.
+
+        :param tree: the TreeSet to buffer
+        :type tree: TreeSet
+        :param threshold: the number of buffered values which triggers a merge
+        :type threshold: int
+        """
+        tree._set_feature(cls, True)
+        tree._TreeSetWriteBuffer__buffer = set()
+        tree.enable_write_buffer(threshold)
+
+    def enable_write_buffer(self,
+                            threshold: int = TreeSet.WRITE_BUFFER_THRESHOLD) \
+            -> None:
+        """
+        Changes the threshold of the write buffer, which is already enabled,
+        merging the buffer if it is already reached.
+
+        :param threshold: the number of buffered values which triggers a merge
+        :type threshold: int
+        :raises ValueError: if the threshold is not positive
+        """
+        if threshold < 1:
+            raise ValueError("Threshold must be positive")
+
+        self.__threshold = threshold
+        if len(self.__buffer) >= threshold:
+            self.flush()
+
+    def disable_write_buffer(self) -> None:
+        """
+        Merges the buffered values into the TreeSet and stops buffering the
+        insertions.
+        """
+        self.flush()
+        for attribute in self.__attributes:
+            object.__delattr__(self, attribute)
+        self._set_feature(TreeSetWriteBuffer, False)
+
+    def flush(self) -> int:
+        """
+        Sorts the buffered values and merges them into the TreeSet.
+
+        :return: the number of buffered values which were not in the TreeSet
+        :rtype: int
+        """
+        if not self.__buffer:
+            return 0
+
+        values = sorted(self.__buffer)
+        if isinstance(self.__buffer, list):
+            values = [value for index, value in enumerate(values)
+                      if not index or values[index - 1] != value]
+        self.__buffer = set()
+        return self._merge(values)
+
+    def buffered(self) -> int:
+        """
+        Returns the number of values waiting in the write buffer, which may
+        include values already in the TreeSet.
+
+        :return: the number of buffered values
+        :rtype: int
+        """
+        return len(self.__buffer)
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def add(self, value: E) -> bool:
+        """
+        Buffers a new value, merging the buffer if it is full.
+
+        :param value: the value to insert
+        :type value: E
+        :return: True, since the value is only compared with the elements of
+            the TreeSet when the buffer is merged
+        :rtype: bool
+        """
+        if isinstance(self.__buffer, set):
+            try:
+                self.__buffer.add(value)
+            except TypeError:
+                self.__buffer = list(self.__buffer)
+        if isinstance(self.__buffer, list):
+            self.__buffer.append(value)
+
+        if len(self.__buffer) >= self.__threshold:
+            self.flush()
+        return True
+
+    @RedBlackTree._null_validation
+    @RedBlackTree._type_validation
+    @RedBlackTree._check_comparable
+    def __contains__(self, value: E) -> bool:
+        """
+        Check if the given value is buffered or contained in the TreeSet. A
+        buffer holding unhashable values is merged first.
+
+        :param value: the value to check
+        :type value: E
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        if isinstance(self.__buffer, set):
+            try:
+                if value in self.__buffer:
+                    return True
+            except TypeError:
+                pass
+        elif self.__buffer:
+            self.flush()
+
+        return super().__contains__(value)
+
+    def clear(self) -> None:
+        """
+        Removes all the elements of the TreeSet and discards the buffered
+        values.
+        """
+        self.__buffer = set()
+        super().clear()
+
+
+for _name in TreeSetWriteBuffer.METHODS:
+    setattr(TreeSetWriteBuffer, _name, _flushed(_name))
@@ -0,0 +1,109 @@
+"""Module which provides a test class for the blocked TreeSet backend."""
+
+import random
+import unittest
+from model.tree_set import *
+from tests.tests_classes import Person, Professor
+
+
+class TestBlockedTreeSet(unittest.TestCase):
+    """Test the blocked backend against the Red-Black Tree backend."""
+
+    def setUp(self) -> None:
+        """Create both backends with the same random items"""
+        self.items = [random.randint(0, 1000) for _ in range(300)]
+        self.tree = TreeSet(int, self.items)
+        self.blocked = BlockedTreeSet(int, self.items, load=4)
+
+    def test_backend_int(self):
+        """Test the backend is selected by the TreeSet constructor"""
+        blocked = TreeSet(int, [1, 2], backend="blocked")
+        self.assertIsInstance(blocked, BlockedTreeSet)
+        self.assertIsInstance(blocked, TreeSet)
+        self.assertEqual(blocked.backend, "blocked")
+        self.assertEqual(TreeSet(int).backend, "red_black")
+        self.assertEqual(blocked.clone().backend, "blocked")
+        self.assertRaises(ValueError, TreeSet, int, None, "unknown")
+
+    def test_size_int(self):
+        """Test BlockedTreeSet size and duplicated insertions"""
+        self.assertEqual(self.blocked.size(), self.tree.size(), "Wrong size")
+        self.assertEqual(len(self.blocked), len(self.tree), "Wrong size")
+        self.assertFalse(self.blocked.add(self.items[0]))
+        self.assertFalse(self.blocked.is_empty())
+
+    def test_equality_int(self):
+        """Test both backends are equal and iterate in the same order"""
+        self.assertEqual(self.blocked, self.tree)
+        self.assertEqual(self.tree, self.blocked)
+        self.assertEqual(str(self.blocked), str(self.tree))
+        self.assertEqual(list(self.blocked.descending_iterator()),
+                         list(self.tree.descending_iterator()))
+
+    def test_navigation_int(self):
+        """Test BlockedTreeSet higher, lower, ceiling and floor methods"""
+        for value in range(-2, 1003):
+            self.assertEqual(self.blocked.higher(value), self.tree.higher(value),
+                             "Wrong higher value")
+            self.assertEqual(self.blocked.lower(value), self.tree.lower(value),
+                             "Wrong lower value")
+            self.assertEqual(self.blocked.ceiling(value),
+                             self.tree.ceiling(value), "Wrong ceiling value")
+            self.assertEqual(self.blocked.floor(value), self.tree.floor(value),
+                             "Wrong floor value")
+            self.assertEqual(self.blocked.contains(value),
+                             self.tree.contains(value), "Wrong contains value")
+
+    def test_random_operations_int(self):
+        """Test random insertions and removals, splitting and merging blocks"""
+        for _ in range(3000):
+            value = random.randint(0, 1000)
+            if random.random() < 0.5:
+                self.assertEqual(self.blocked.add(value), self.tree.add(value))
+            else:
+                self.assertEqual(self.blocked.remove(value),
+                                 self.tree.remove(value))
+        self.assertEqual(list(self.blocked), list(self.tree))
+        self.assertEqual(self.blocked.size(), self.tree.size())
+
+    def test_poll_int(self):
+        """Test BlockedTreeSet first, last and poll methods"""
+        self.assertEqual(self.blocked.first(), self.tree.first())
+        self.assertEqual(self.blocked.last(), self.tree.last())
+        while not self.tree.is_empty():
+            self.assertEqual(self.blocked.poll_first(), self.tree.poll_first())
+            if not self.tree.is_empty():
+                self.assertEqual(self.blocked.poll_last(), self.tree.poll_last())
+        self.assertTrue(self.blocked.is_empty())
+        self.assertIsNone(self.blocked.poll_first())
+        self.assertRaises(NoSuchElementException, self.blocked.first)
+
+    def test_clear_int(self):
+        """Test BlockedTreeSet clear method"""
+        self.blocked.clear()
+        self.assertTrue(self.blocked.is_empty())
+        self.assertIsNone(self.blocked.floor(10))
+        self.assertTrue(self.blocked.add(10))
+        self.assertEqual(list(self.blocked), [10])
+
+    def test_validation(self):
+        """Test BlockedTreeSet type, None and comparability validation"""
+        self.assertRaises(TypeError, self.blocked.add, "1")
+        self.assertRaises(NullPointerException, self.blocked.remove, None)
+        self.assertRaises(TypeError, self.blocked.add_all, [1, "2"])
+        self.assertRaises(ClassCastException, TreeSet, object, [object()],
+                          "blocked")
+
+    def test_other_items(self):
+        """Test the blocked backend with user defined comparable classes"""
+        people = [Person(f"Person{age}", age) for age in (30, 10, 20, 10)]
+        tree = TreeSet(Person, people, backend="blocked")
+        self.assertEqual([person.age for person in tree], [10, 20, 30])
+        professors = TreeSet(Professor, [Professor("b", "x"),
+                                         Professor("a", "y")],
+                             backend="blocked")
+        self.assertEqual(professors.size(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
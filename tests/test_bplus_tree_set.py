@@ -0,0 +1,119 @@
+"""Module which provides a test class for the disk-resident B+tree set."""
+
+import os
+import random
+import tempfile
+import unittest
+from model.tree_set import *
+from model.storage.bplus_tree import BPlusTreeSet
+
+
+class TestBPlusTreeSet(unittest.TestCase):
+    """Test BPlusTreeSet against a TreeSet holding the same values."""
+
+    def setUp(self) -> None:
+        """Create a B+tree with small pages and a small page cache."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tree.bpt")
+        self.items = {random.randint(-5000, 5000) for _ in range(1500)}
+        self.tree = TreeSet(int, self.items)
+        self.bplus = BPlusTreeSet(self.path, int, page_size=64, cache_pages=4)
+        for item in self.items:
+            self.bplus.add(item)
+
+    def tearDown(self) -> None:
+        """Close the B+tree and remove the temporary directory."""
+        self.bplus.close()
+        self.directory.cleanup()
+
+    def test_size_int(self):
+        """Test BPlusTreeSet size and duplicated insertions"""
+        self.assertEqual(self.bplus.size(), len(self.items), "Wrong size")
+        self.assertFalse(self.bplus.add(next(iter(self.items))))
+        self.assertEqual(len(self.bplus), len(self.items), "Wrong size")
+
+    def test_iterator_int(self):
+        """Test BPlusTreeSet iteration in both directions"""
+        self.assertEqual(list(self.bplus), list(self.tree), "Wrong iteration")
+        self.assertEqual(list(self.bplus.descending_iterator()),
+                         list(self.tree.descending_iterator()),
+                         "Wrong descending iteration")
+
+    def test_navigation_int(self):
+        """Test BPlusTreeSet higher, lower, ceiling and floor methods"""
+        for value in range(-5010, 5010, 3):
+            self.assertEqual(self.bplus.higher(value), self.tree.higher(value),
+                             "Wrong higher value")
+            self.assertEqual(self.bplus.lower(value), self.tree.lower(value),
+                             "Wrong lower value")
+            self.assertEqual(self.bplus.ceiling(value),
+                             self.tree.ceiling(value), "Wrong ceiling value")
+            self.assertEqual(self.bplus.floor(value), self.tree.floor(value),
+                             "Wrong floor value")
+            self.assertEqual(self.bplus.contains(value), value in self.tree,
+                             "Wrong contains value")
+
+    def test_remove_int(self):
+        """Test BPlusTreeSet removals, leaving empty leaves behind"""
+        ordered = sorted(self.items)
+        for item in ordered[:len(ordered) // 2] + ordered[-10:]:
+            self.assertTrue(self.bplus.remove(item), "Wrong removed value")
+            self.tree.remove(item)
+        self.assertFalse(self.bplus.remove(ordered[0]))
+
+        self.assertEqual(list(self.bplus), list(self.tree))
+        self.assertEqual(list(reversed(self.bplus)), list(reversed(self.tree)))
+        self.assertEqual(self.bplus.first(), self.tree.first())
+        self.assertEqual(self.bplus.last(), self.tree.last())
+        self.assertEqual(self.bplus.higher(-6000), self.tree.first())
+        self.assertEqual(self.bplus.lower(6000), self.tree.last())
+
+        for item in list(self.tree):
+            self.bplus.remove(item)
+        self.assertTrue(self.bplus.is_empty())
+        self.assertEqual(list(self.bplus), [])
+        self.assertIsNone(self.bplus.floor(0))
+        self.assertRaises(NoSuchElementException, self.bplus.first)
+
+    def test_range_int(self):
+        """Test BPlusTreeSet range scans"""
+        self.assertEqual(list(self.bplus.range(-1000, 1000)),
+                         [item for item in self.tree if -1000 <= item <= 1000])
+        self.assertEqual(list(self.bplus.range(6000, 7000)), [])
+
+    def test_reopen_int(self):
+        """Test BPlusTreeSet content persists after closing it"""
+        self.bplus.close()
+        self.bplus = BPlusTreeSet(self.path, cache_pages=8)
+        self.assertEqual(self.bplus.object_type, int)
+        self.assertEqual(self.bplus.page_size, 64)
+        self.assertEqual(self.bplus.size(), len(self.items))
+        self.assertEqual(list(self.bplus), list(self.tree))
+        self.assertRaises(ValueError, BPlusTreeSet, self.path, float)
+
+    def test_cache_int(self):
+        """Test the page cache is bounded"""
+        info = self.bplus.cache_info()
+        self.assertLessEqual(info["pages"], 4)
+        self.assertGreater(info["misses"], 0)
+
+    def test_validation_int(self):
+        """Test BPlusTreeSet type and None validation"""
+        self.assertRaises(TypeError, self.bplus.add, "1")
+        self.assertRaises(NullPointerException, self.bplus.ceiling, None)
+        self.assertRaises(TypeError, BPlusTreeSet,
+                          os.path.join(self.directory.name, "str.bpt"), str)
+
+    def test_float(self):
+        """Test BPlusTreeSet with float values"""
+        path = os.path.join(self.directory.name, "float.bpt")
+        values = [random.uniform(-1, 1) for _ in range(300)]
+        with BPlusTreeSet(path, float, page_size=128) as bplus:
+            for value in values:
+                bplus.add(value)
+            self.assertEqual(list(bplus), sorted(set(values)))
+            self.assertEqual(bplus.floor(2.0), max(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Module which provides a test class for the write-ahead logged TreeSet."""
+
+import os
+import tempfile
+import unittest
+from model.tree_set import *
+from model.storage.write_ahead_log import DurableTreeSet, LOG_FILE, SNAPSHOT_FILE
+
+
+class TestDurableTreeSet(unittest.TestCase):
+    """Test DurableTreeSet recovery, group commit and checkpoints."""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for the set."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_reopen_int(self):
+        """Test modifications are recovered after closing the set"""
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertTrue(tree.add_all([5, 1, 9, 3]))
+            self.assertFalse(tree.add(5))
+            self.assertTrue(tree.remove(1))
+            self.assertFalse(tree.remove(100))
+            self.assertEqual(tree.poll_last(), 9)
+
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [3, 5], "Wrong recovered values")
+            self.assertEqual(tree.floor(4), 3)
+
+    def test_crash_without_close_int(self):
+        """Test synced modifications survive a crash"""
+        tree = DurableTreeSet(self.path, int)
+        tree.add_all(range(10))
+        tree.remove(4)
+        del tree
+
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [0, 1, 2, 3, 5, 6, 7, 8, 9])
+
+    def test_group_commit_int(self):
+        """Test records are only synced when the batch is complete"""
+        tree = DurableTreeSet(self.path, int, sync_batch_size=4)
+        tree.add_all([1, 2, 3, 4, 5, 6])
+        del tree
+
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [1, 2, 3, 4],
+                             "Only the complete batch must be durable")
+
+    def test_sync_int(self):
+        """Test sync forces the pending records to disk"""
+        tree = DurableTreeSet(self.path, int, sync_batch_size=100)
+        tree.add_all([1, 2, 3])
+        tree.sync()
+        del tree
+
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [1, 2, 3])
+
+    def test_torn_record_int(self):
+        """Test a torn record at the end of the log is discarded"""
+        with DurableTreeSet(self.path, int) as tree:
+            tree.add_all([1, 2, 3])
+
+        log = os.path.join(self.path, LOG_FILE)
+        valid_size = os.path.getsize(log)
+        with open(log, "ab") as file:
+            file.write(b"\x20\x00\x00\x00garbage")
+
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [1, 2, 3])
+            tree.add(4)
+
+        self.assertGreater(os.path.getsize(log), valid_size)
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [1, 2, 3, 4])
+
+    def test_checkpoint_int(self):
+        """Test checkpoints write a snapshot and empty the log"""
+        with DurableTreeSet(self.path, int, checkpoint_interval=5) as tree:
+            tree.add_all(range(7))
+            tree.clear()
+            tree.add_all([10, 20])
+
+        self.assertTrue(os.path.exists(os.path.join(self.path, SNAPSHOT_FILE)))
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [10, 20])
+            tree.checkpoint()
+
+        self.assertEqual(os.path.getsize(os.path.join(self.path, LOG_FILE)), 0)
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertEqual(list(tree), [10, 20])
+
+    def test_str(self):
+        """Test DurableTreeSet with str values"""
+        with DurableTreeSet(self.path, str) as tree:
+            tree.add_all(["b", "a", "c"])
+            tree.checkpoint()
+            tree.remove("b")
+
+        with DurableTreeSet(self.path, str) as tree:
+            self.assertEqual(list(tree), ["a", "c"])
+
+    def test_validation(self):
+        """Test invalid values are neither inserted nor logged"""
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertRaises(TypeError, tree.add, "1")
+            self.assertRaises(NullPointerException, tree.add, None)
+
+        with DurableTreeSet(self.path, int) as tree:
+            self.assertTrue(tree.is_empty())
+
+    def test_wrong_type(self):
+        """Test opening a stored set with a different type"""
+        with DurableTreeSet(self.path, int) as tree:
+            tree.add(1)
+            tree.checkpoint()
+
+        self.assertRaises(ValueError, DurableTreeSet, self.path, str)
+        self.assertRaises(ValueError, DurableTreeSet, self.path, int, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
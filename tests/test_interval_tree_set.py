@@ -0,0 +1,88 @@
+"""Module which provides a test class for the IntervalTreeSet."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.interval_tree_set import Interval, IntervalTreeSet
+
+
+class TestIntervalTreeSet(unittest.TestCase):
+    """Test the overlapping queries of the IntervalTreeSet."""
+
+    def setUp(self):
+        """Set up an IntervalTreeSet with a few intervals"""
+        self.intervals = [Interval(1, 3), Interval(2, 8), Interval(5, 6),
+                          Interval(7, 7), Interval(10, 20), Interval(12, 13)]
+        self.tree_set = IntervalTreeSet(self.intervals)
+
+    def test_overlapping_point(self):
+        """Test the intervals containing a point"""
+        self.assertEqual(self.tree_set.overlapping(2),
+                         [Interval(1, 3), Interval(2, 8)])
+        self.assertEqual(self.tree_set.overlapping(7),
+                         [Interval(2, 8), Interval(7, 7)])
+        self.assertEqual(self.tree_set.overlapping(9), [])
+        self.assertEqual(self.tree_set.overlapping(20), [Interval(10, 20)])
+        self.assertEqual(self.tree_set.overlapping(0), [])
+
+    def test_overlapping_interval(self):
+        """Test the intervals overlapping a closed interval"""
+        self.assertEqual(self.tree_set.overlapping(3, 5),
+                         [Interval(1, 3), Interval(2, 8), Interval(5, 6)])
+        self.assertEqual(self.tree_set.overlapping(9, 11), [Interval(10, 20)])
+        self.assertEqual(self.tree_set.overlapping(-5, 100), self.intervals)
+        self.assertRaises(ValueError, self.tree_set.overlapping, 5, 3)
+        self.assertRaises(NullPointerException, self.tree_set.overlapping,
+                          None)
+
+    def test_invalid_intervals(self):
+        """Test adding values which are not valid intervals"""
+        self.assertRaises(ValueError, self.tree_set.add, Interval(5, 1))
+        self.assertRaises(ValueError, self.tree_set.add_all,
+                          [Interval(30, 40), Interval(5, 1)])
+        self.assertRaises(TypeError, self.tree_set.add, (30, 40))
+        self.assertRaises(NullPointerException, self.tree_set.add, None)
+        self.assertEqual(list(self.tree_set), self.intervals)
+        self.assertRaises(ValueError, IntervalTreeSet, backend="blocked")
+
+    def test_modifications(self):
+        """Test the queries after removals and clones"""
+        self.assertTrue(self.tree_set.remove(Interval(2, 8)))
+        self.assertEqual(self.tree_set.overlapping(7), [Interval(7, 7)])
+        self.assertEqual(self.tree_set.remove_range(Interval(10, 0),
+                                                    Interval(11, 0)), 1)
+        self.assertEqual(self.tree_set.overlapping(15), [])
+        self.assertTrue(self.tree_set.remove_if(
+            lambda interval: interval.low == interval.high))
+        clone = self.tree_set.clone()
+        self.assertIsInstance(clone, IntervalTreeSet)
+        self.assertEqual(clone.overlapping(0, 100),
+                         [Interval(1, 3), Interval(5, 6), Interval(12, 13)])
+        self.assertTrue(clone.verify())
+
+    def test_random_intervals(self):
+        """Test random modifications against a brute-force scan"""
+        rng = random.Random(41)
+        for _ in range(50):
+            tree_set = IntervalTreeSet()
+            tree_set.enable_verification()
+            expected = set()
+            for _ in range(rng.randrange(200)):
+                low = rng.randrange(1000)
+                interval = Interval(low, low + rng.randrange(100))
+                tree_set.add(interval)
+                expected.add(interval)
+            for interval in rng.sample(sorted(expected), len(expected) // 3):
+                tree_set.remove(interval)
+                expected.discard(interval)
+
+            for _ in range(20):
+                low = rng.randrange(-10, 1110)
+                high = low + rng.randrange(50)
+                self.assertEqual(tree_set.overlapping(low, high), sorted(
+                    interval for interval in expected
+                    if interval.low <= high and interval.high >= low))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Module which provides a test class for the log-structured merge tree set."""
+
+import os
+import random
+import tempfile
+import unittest
+from model.tree_set import *
+from model.storage.lsm_tree_set import LSMTreeSet
+
+
+class TestLSMTreeSet(unittest.TestCase):
+    """Test LSMTreeSet against a TreeSet receiving the same operations."""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for the set."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def __random_operations(self, lsm, tree, count):
+        """Apply the same random insertions and removals to both sets."""
+        for _ in range(count):
+            value = random.randint(0, 400)
+            if random.random() < 0.6:
+                lsm.add(value)
+                tree.add(value)
+            else:
+                lsm.remove(value)
+                tree.remove(value)
+
+    def __assert_same(self, lsm, tree):
+        """Check both sets hold the same values."""
+        self.assertEqual(lsm.size(), tree.size(), "Wrong size")
+        self.assertEqual(list(lsm), list(tree), "Wrong iteration")
+        self.assertEqual(list(reversed(lsm)), list(reversed(tree)),
+                         "Wrong descending iteration")
+        for value in range(-2, 403):
+            self.assertEqual(lsm.contains(value), tree.contains(value))
+            self.assertEqual(lsm.higher(value), tree.higher(value))
+            self.assertEqual(lsm.lower(value), tree.lower(value))
+            self.assertEqual(lsm.ceiling(value), tree.ceiling(value))
+            self.assertEqual(lsm.floor(value), tree.floor(value))
+
+    def test_operations_int(self):
+        """Test random operations across memtable flushes"""
+        tree = TreeSet(int)
+        with LSMTreeSet(self.path, int, memtable_limit=16, max_runs=100,
+                        background_compaction=False) as lsm:
+            for _ in range(6):
+                self.__random_operations(lsm, tree, 100)
+                self.assertEqual(lsm.size(), tree.size(), "Wrong size")
+            self.assertGreater(lsm.run_count(), 1)
+            self.__assert_same(lsm, tree)
+
+    def test_compaction_int(self):
+        """Test synchronous compactions keep the content"""
+        tree = TreeSet(int)
+        with LSMTreeSet(self.path, int, memtable_limit=16, max_runs=3,
+                        background_compaction=False) as lsm:
+            self.__random_operations(lsm, tree, 600)
+            self.assertLessEqual(lsm.run_count(), 4)
+            self.__assert_same(lsm, tree)
+            lsm.compact()
+            self.assertEqual(lsm.run_count(), 1)
+            self.__assert_same(lsm, tree)
+
+    def test_background_compaction_int(self):
+        """Test background compactions keep the content"""
+        tree = TreeSet(int)
+        with LSMTreeSet(self.path, int, memtable_limit=8, max_runs=2) as lsm:
+            self.__random_operations(lsm, tree, 800)
+            self.__assert_same(lsm, tree)
+            lsm.wait_for_compaction()
+            self.__assert_same(lsm, tree)
+
+    def test_reopen_int(self):
+        """Test the content persists after closing the set"""
+        tree = TreeSet(int)
+        with LSMTreeSet(self.path, int, memtable_limit=32) as lsm:
+            self.__random_operations(lsm, tree, 300)
+
+        with LSMTreeSet(self.path, int) as lsm:
+            self.__assert_same(lsm, tree)
+        self.assertRaises(ValueError, LSMTreeSet, self.path, float)
+
+    def test_reopen_after_compaction_int(self):
+        """Test a compaction does not persist the unflushed size"""
+        lsm = LSMTreeSet(self.path, int, memtable_limit=200, max_runs=100,
+                         background_compaction=False)
+        for value in range(2030):
+            lsm.add(value)
+        lsm.remove(0)
+        self.assertEqual(lsm.run_count(), 10)
+        lsm._LSMTreeSet__compact()
+
+        with LSMTreeSet(self.path, int) as reopened:
+            self.assertEqual(reopened.size(), 2000)
+            self.assertEqual(list(reopened), list(range(2000)))
+
+    def test_tombstones_int(self):
+        """Test tombstones hide values of older runs"""
+        with LSMTreeSet(self.path, int, background_compaction=False) as lsm:
+            for value in (1, 2, 3):
+                lsm.add(value)
+            lsm.flush()
+            lsm.remove(2)
+            lsm.remove(2)
+            lsm.flush()
+            self.assertEqual(list(lsm), [1, 3])
+            self.assertEqual(lsm.size(), 2)
+            self.assertEqual(lsm.higher(1), 3)
+            self.assertEqual(lsm.lower(3), 1)
+            lsm.add(2)
+            self.assertEqual(list(lsm.range(2, 3)), [2, 3])
+            lsm.compact()
+            self.assertEqual(list(lsm), [1, 2, 3])
+            self.assertEqual(len(os.listdir(self.path)), 3)
+
+    def test_blind_writes_int(self):
+        """Test repeated and useless writes do not change the size"""
+        with LSMTreeSet(self.path, int, memtable_limit=4,
+                        background_compaction=False) as lsm:
+            for value in (1, 2, 3, 1, 2):
+                lsm.add(value)
+            self.assertEqual(lsm.size(), 3)
+            lsm.flush()
+            for value in (2, 3, 4, 5):
+                lsm.add(value)
+            lsm.remove(6)
+            lsm.remove(1)
+            self.assertEqual(lsm.size(), 4)
+            self.assertEqual(list(lsm), [2, 3, 4, 5])
+            self.assertIsNone(lsm.add(2))
+            self.assertIsNone(lsm.remove(7))
+
+        with LSMTreeSet(self.path, int) as lsm:
+            self.assertEqual(lsm.size(), 4)
+            self.assertEqual(list(lsm), [2, 3, 4, 5])
+
+    def test_empty_int(self):
+        """Test an empty LSMTreeSet"""
+        with LSMTreeSet(self.path, int) as lsm:
+            self.assertTrue(lsm.is_empty())
+            self.assertIsNone(lsm.floor(1))
+            self.assertEqual(list(reversed(lsm)), [])
+            self.assertRaises(NoSuchElementException, lsm.first)
+            self.assertRaises(TypeError, lsm.add, "1")
+            self.assertRaises(NullPointerException, lsm.contains, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Module which provides a test class for saved and memory-mapped TreeSets."""
+
+import os
+import random
+import tempfile
+import unittest
+from model.tree_set import *
+from model.storage.sorted_array_file import MappedTreeSet
+
+
+class TestMappedTreeSet(unittest.TestCase):
+    """Test TreeSet save and open_mmap methods."""
+
+    def setUp(self) -> None:
+        """Create a TreeSet with random items and save it."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tree.tset")
+        self.items = sorted({random.randint(-10000, 10000) for _ in range(500)})
+        self.tree = TreeSet(int, self.items)
+        self.tree.save(self.path)
+        self.mapped = TreeSet.open_mmap(self.path)
+
+    def tearDown(self) -> None:
+        """Unmap the file and remove the temporary directory."""
+        self.mapped.close()
+        self.directory.cleanup()
+
+    def test_size_int(self):
+        """Test MappedTreeSet size"""
+        self.assertIsInstance(self.mapped, MappedTreeSet)
+        self.assertEqual(self.mapped.size(), len(self.items), "Wrong size")
+        self.assertEqual(self.mapped.object_type, int, "Wrong object type")
+
+    def test_iterator_int(self):
+        """Test MappedTreeSet iteration in both directions"""
+        self.assertEqual(list(self.mapped), self.items, "Wrong iteration")
+        self.assertEqual(list(self.mapped.descending_iterator()),
+                         self.items[::-1], "Wrong descending iteration")
+
+    def test_contains_int(self):
+        """Test MappedTreeSet contains method"""
+        for value in range(-10001, 10002, 7):
+            self.assertEqual(self.mapped.contains(value), value in self.tree,
+                             "Wrong contains value")
+
+    def test_navigation_int(self):
+        """Test MappedTreeSet higher, lower, ceiling and floor methods"""
+        for value in range(-10002, 10003, 11):
+            self.assertEqual(self.mapped.higher(value), self.tree.higher(value),
+                             "Wrong higher value")
+            self.assertEqual(self.mapped.lower(value), self.tree.lower(value),
+                             "Wrong lower value")
+            self.assertEqual(self.mapped.ceiling(value),
+                             self.tree.ceiling(value), "Wrong ceiling value")
+            self.assertEqual(self.mapped.floor(value), self.tree.floor(value),
+                             "Wrong floor value")
+
+    def test_rank_int(self):
+        """Test MappedTreeSet rank method"""
+        for index, item in enumerate(self.items):
+            self.assertEqual(self.mapped.rank(item), index, "Wrong rank value")
+        self.assertEqual(self.mapped.rank(10001), len(self.items))
+
+    def test_first_last_int(self):
+        """Test MappedTreeSet first and last methods"""
+        self.assertEqual(self.mapped.first(), self.items[0])
+        self.assertEqual(self.mapped.last(), self.items[-1])
+
+    def test_read_only_int(self):
+        """Test MappedTreeSet cannot be modified"""
+        self.assertRaises(UnsupportedOperationException, self.mapped.add, 1)
+        self.assertRaises(UnsupportedOperationException, self.mapped.remove, 1)
+        self.assertRaises(UnsupportedOperationException, self.mapped.clear)
+
+    def test_validation_int(self):
+        """Test MappedTreeSet type and None validation"""
+        self.assertRaises(TypeError, self.mapped.contains, "1")
+        self.assertRaises(NullPointerException, self.mapped.floor, None)
+
+    def test_to_tree_set_int(self):
+        """Test MappedTreeSet conversion into a TreeSet"""
+        self.assertEqual(self.mapped.to_tree_set(), self.tree)
+
+    def test_float(self):
+        """Test saving and mapping a float TreeSet"""
+        path = os.path.join(self.directory.name, "float.tset")
+        TreeSet(float, [2.5, -1.0, 3.25]).save(path)
+        with TreeSet.open_mmap(path) as mapped:
+            self.assertEqual(mapped.object_type, float)
+            self.assertEqual(list(mapped), [-1.0, 2.5, 3.25])
+            self.assertEqual(mapped.floor(3.0), 2.5)
+
+    def test_empty(self):
+        """Test saving and mapping an empty TreeSet"""
+        path = os.path.join(self.directory.name, "empty.tset")
+        TreeSet(int).save(path)
+        with TreeSet.open_mmap(path) as mapped:
+            self.assertTrue(mapped.is_empty())
+            self.assertIsNone(mapped.ceiling(0))
+            self.assertRaises(NoSuchElementException, mapped.first)
+
+    def test_unsupported_type(self):
+        """Test only int and float TreeSets can be saved"""
+        path = os.path.join(self.directory.name, "str.tset")
+        self.assertRaises(TypeError, TreeSet(str, ["a"]).save, path)
+
+    def test_invalid_file(self):
+        """Test opening a file which is not a TreeSet file"""
+        path = os.path.join(self.directory.name, "invalid.tset")
+        with open(path, "wb") as file:
+            file.write(b"not a tree set file")
+        self.assertRaises(ValueError, TreeSet.open_mmap, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
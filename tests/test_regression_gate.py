@@ -0,0 +1,52 @@
+"""Module which provides a test class for the performance regression gate."""
+
+import copy
+import unittest
+from benchmarks.regression import CountingInt, compare, run
+
+
+class TestRegressionGate(unittest.TestCase):
+    """Test the regression gate metrics and their comparison."""
+
+    def setUp(self):
+        """Set up a small run of the workload"""
+        self.baseline = run(size=300)
+
+    def test_counting_int(self):
+        """Test the counting integer counts and behaves as an int"""
+        CountingInt.comparisons = 0
+        self.assertTrue(CountingInt(1) < CountingInt(2))
+        self.assertTrue(CountingInt(1) == 1)
+        self.assertEqual(CountingInt.comparisons, 2)
+        self.assertEqual(hash(CountingInt(5)), hash(5))
+
+    def test_deterministic_counts(self):
+        """Test the comparison counts do not change between runs"""
+        current = run(size=300)
+        for backend, operations in current["backends"].items():
+            for operation, metrics in operations.items():
+                self.assertEqual(
+                    metrics["comparisons_per_op"],
+                    self.baseline["backends"][backend][operation][
+                        "comparisons_per_op"])
+        self.assertEqual(compare(self.baseline, current, 0.1, None), [])
+
+    def test_regressions(self):
+        """Test the regressed metrics are reported"""
+        current = copy.deepcopy(self.baseline)
+        add = current["backends"]["red_black"]["add"]
+        add["comparisons_per_op"] *= 1.2
+        add["ops_per_second"] = 0
+        regressions = compare(self.baseline, current, 0.1, 0.5)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(all(r.startswith("red_black.add") for r in regressions))
+        self.assertEqual(len(compare(self.baseline, current, 0.1, None)), 1)
+        self.assertEqual(compare(self.baseline, current, 0.25, None), [])
+
+    def test_other_workload(self):
+        """Test comparing different workloads raises ValueError"""
+        self.assertRaises(ValueError, compare, self.baseline, run(size=200))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Module which provides a test class for the SlidingWindowTreeSet."""
+
+import random
+import statistics
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.sliding_window_tree_set import SlidingWindowTreeSet
+
+
+class TestSlidingWindowTreeSet(unittest.TestCase):
+    """Test the count- and time-based eviction and the order statistics."""
+
+    def setUp(self):
+        """Set up a window of the last 5 events"""
+        self.window = SlidingWindowTreeSet(int, max_size=5)
+
+    def test_count_eviction(self):
+        """Test the oldest events are evicted past the maximum size"""
+        for value in (5, 1, 5, 3, 2):
+            self.assertEqual(self.window.add(value, 0), [])
+        self.assertEqual(self.window.add(4, 0), [5])
+        self.assertEqual(self.window.add(6, 0), [1])
+        self.assertEqual(list(self.window), [2, 3, 4, 5, 6])
+        self.assertEqual([value for _, value in self.window.events()],
+                         [5, 3, 2, 4, 6])
+        self.assertEqual(len(self.window), 5)
+        self.assertEqual(self.window.count(5), 1)
+        self.assertNotIn(1, self.window)
+
+    def test_time_eviction(self):
+        """Test the events older than the maximum age are evicted"""
+        now = [0.0]
+        window = SlidingWindowTreeSet(int, max_age=10, clock=lambda: now[0])
+        window.add(3)
+        now[0] = 5
+        window.add(1)
+        window.add(2, 8)
+        self.assertEqual(window.add(4, 10), [])
+        self.assertEqual(window.add(5, 15.5), [3, 1])
+        self.assertEqual(list(window), [2, 4, 5])
+        now[0] = 30
+        self.assertEqual(window.evict_expired(), [2, 4, 5])
+        self.assertTrue(window.is_empty())
+        self.assertRaises(ValueError, window.add, 1, 15)
+
+    def test_both_bounds(self):
+        """Test a window bounded by its size and the age of its events"""
+        window = SlidingWindowTreeSet(float, max_size=3, max_age=1)
+        self.assertEqual(window.add(1.0, 0), [])
+        self.assertEqual(window.add(2.0, 0.5), [])
+        self.assertEqual(window.add(3.0, 0.6), [])
+        self.assertEqual(window.add(4.0, 0.7), [1.0])
+        self.assertEqual(window.add(5.0, 1.55), [2.0])
+        self.assertEqual(window.size(), 3)
+
+    def test_quantiles(self):
+        """Test the median and the quantiles of numbers and strings"""
+        for value in (7, 1, 3, 9):
+            self.window.add(value, 0)
+        self.assertEqual(self.window.median(), 5)
+        self.assertEqual(self.window.quantile(0), 1)
+        self.assertEqual(self.window.quantile(1), 9)
+        self.assertEqual(self.window.quantile(0.25), 2.5)
+        self.assertEqual(self.window.rank(7), 2)
+        self.assertEqual((self.window.first(), self.window.last()), (1, 9))
+
+        words = SlidingWindowTreeSet(str, max_size=3)
+        for word in ("b", "d", "a", "c"):
+            words.add(word, 0)
+        self.assertEqual(words.median(), "c")
+        self.assertEqual(words.quantile(0.4), "a")
+
+    def test_errors(self):
+        """Test invalid bounds, fractions, values and empty windows"""
+        self.assertRaises(ValueError, SlidingWindowTreeSet, int)
+        self.assertRaises(ValueError, SlidingWindowTreeSet, int, max_size=0)
+        self.assertRaises(ValueError, SlidingWindowTreeSet, int, max_age=0)
+        self.assertRaises(NoSuchElementException, self.window.median)
+        self.assertRaises(NoSuchElementException, self.window.first)
+        self.window.add(1, 0)
+        self.assertRaises(ValueError, self.window.quantile, 1.5)
+        self.assertRaises(NullPointerException, self.window.add, None, 0)
+        self.assertRaises(TypeError, self.window.add, "1", 0)
+        self.assertEqual(self.window.size(), 1)
+        self.window.clear()
+        self.assertEqual(str(self.window), "[]")
+
+    def test_random(self):
+        """Test rolling medians and quantiles against the statistics module"""
+        random.seed(50)
+        window = SlidingWindowTreeSet(int, max_size=50, max_age=100)
+        events = []
+        timestamp = 0
+        for _ in range(2000):
+            timestamp += random.randint(0, 5)
+            value = random.randint(0, 100)
+            window.add(value, timestamp)
+            events.append((timestamp, value))
+            events = [event for event in events[-50:]
+                      if timestamp - event[0] <= 100]
+            values = [value for _, value in events]
+            self.assertEqual(list(window), sorted(values))
+            self.assertEqual(window.median(), statistics.median(values))
+            if len(values) > 1:
+                self.assertAlmostEqual(
+                    window.quantile(0.9),
+                    statistics.quantiles(values, n=10,
+                                         method="inclusive")[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
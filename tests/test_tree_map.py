@@ -0,0 +1,129 @@
+"""Module which provides a test class for the TreeMap."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_map import TreeMap
+
+
+class TestTreeMap(unittest.TestCase):
+    """Test the TreeMap and its range views."""
+
+    def setUp(self):
+        """Set up a TreeMap mapping some numbers to their names"""
+        self.tree_map = TreeMap(int, {5: "five", 1: "one", 9: "nine",
+                                      3: "three"})
+
+    def test_put_get_pop(self):
+        """Test mapping, reading and removing keys"""
+        self.assertIsNone(self.tree_map.put(7, "seven"))
+        self.assertEqual(self.tree_map.put(5, "FIVE"), "five")
+        self.assertEqual(self.tree_map.get(5), "FIVE")
+        self.assertIsNone(self.tree_map.get(4))
+        self.assertEqual(self.tree_map.get(4, "none"), "none")
+        self.assertEqual(self.tree_map.pop(9), "nine")
+        self.assertIsNone(self.tree_map.pop(9))
+        self.assertEqual(self.tree_map.pop(9, "gone"), "gone")
+        self.assertTrue(self.tree_map.contains_key(7))
+        self.assertFalse(self.tree_map.contains_key(9))
+        self.assertEqual(list(self.tree_map), [1, 3, 5, 7])
+        self.assertEqual(list(self.tree_map.values()),
+                         ["one", "three", "FIVE", "seven"])
+        self.assertEqual(self.tree_map.size(), 4)
+        self.assertTrue(self.tree_map.verify())
+
+    def test_mapping_protocol(self):
+        """Test the item access operators"""
+        self.tree_map[2] = "two"
+        self.assertEqual(self.tree_map[2], "two")
+        del self.tree_map[2]
+        self.assertRaises(KeyError, self.tree_map.__getitem__, 2)
+        self.assertRaises(KeyError, self.tree_map.__delitem__, 2)
+        self.assertEqual(str(self.tree_map),
+                         "{1: 'one', 3: 'three', 5: 'five', 9: 'nine'}")
+        self.assertEqual(self.tree_map, TreeMap(int, list(
+            self.tree_map.items())))
+        self.assertNotEqual(self.tree_map, TreeMap(int, {1: "one"}))
+        clone = self.tree_map.clone()
+        clone[1] = "ONE"
+        self.assertNotEqual(self.tree_map, clone)
+
+    def test_navigation(self):
+        """Test the navigation entries"""
+        self.assertEqual(self.tree_map.floor_entry(4), (3, "three"))
+        self.assertEqual(self.tree_map.floor_entry(5), (5, "five"))
+        self.assertEqual(self.tree_map.ceiling_entry(6), (9, "nine"))
+        self.assertEqual(self.tree_map.higher_entry(5), (9, "nine"))
+        self.assertEqual(self.tree_map.lower_entry(5), (3, "three"))
+        self.assertIsNone(self.tree_map.lower_entry(1))
+        self.assertIsNone(self.tree_map.higher_entry(9))
+        self.assertEqual(self.tree_map.first_entry(), (1, "one"))
+        self.assertEqual(self.tree_map.last_entry(), (9, "nine"))
+        self.assertEqual(self.tree_map.poll_first_entry(), (1, "one"))
+        self.assertEqual(self.tree_map.poll_last_entry(), (9, "nine"))
+        self.assertEqual(list(self.tree_map.items()),
+                         [(3, "three"), (5, "five")])
+        self.assertRaises(NoSuchElementException,
+                          TreeMap(int).poll_first_entry)
+        self.assertRaises(NoSuchElementException, TreeMap(int).last_entry)
+
+    def test_invalid_keys(self):
+        """Test keys of a wrong type"""
+        self.assertRaises(TypeError, self.tree_map.put, "a", 1)
+        self.assertRaises(NullPointerException, self.tree_map.get, None)
+        self.assertRaises(TypeError, self.tree_map.floor_entry, 1.5)
+        self.assertRaises(TypeError, self.tree_map.sub_map, 1, "a")
+        self.assertRaises(TypeError, TreeMap, int, {"a": 1})
+
+    def test_range_views(self):
+        """Test the live range views"""
+        view = self.tree_map.sub_map(3, 9)
+        self.assertEqual(list(view.items()), [(3, "three"), (5, "five")])
+        self.assertEqual(len(view), 2)
+        self.tree_map.put(4, "four")
+        self.tree_map.put(10, "ten")
+        self.assertEqual(list(view), [3, 4, 5])
+        self.assertEqual(len(view), 3)
+        self.assertIn(4, view)
+        self.assertNotIn(9, view)
+        self.assertEqual(view[4], "four")
+        self.assertRaises(KeyError, view.__getitem__, 9)
+        self.assertIsNone(view.get(10))
+        self.assertEqual(list(self.tree_map.sub_map(3, 9, False)), [4, 5])
+        self.assertEqual(list(self.tree_map.head_map(4)), [1, 3])
+        self.assertEqual(list(self.tree_map.head_map(4, True)), [1, 3, 4])
+        self.assertEqual(list(self.tree_map.tail_map(9).values()),
+                         ["nine", "ten"])
+        self.assertEqual(len(self.tree_map.tail_map(9, False)), 1)
+        self.assertEqual(len(self.tree_map.sub_map(8, 2)), 0)
+        self.assertEqual(str(self.tree_map.sub_map(9)),
+                         "{9: 'nine', 10: 'ten'}")
+
+    def test_random_operations(self):
+        """Test random operations against a dict"""
+        rng = random.Random(44)
+        for _ in range(50):
+            tree_map = TreeMap(int)
+            tree_map.enable_verification()
+            expected = {}
+            for _ in range(rng.randrange(300)):
+                key = rng.randrange(200)
+                if rng.random() < 0.6:
+                    self.assertEqual(tree_map.put(key, -key),
+                                     expected.get(key))
+                    expected[key] = -key
+                else:
+                    self.assertEqual(tree_map.pop(key),
+                                     expected.pop(key, None))
+            self.assertEqual(list(tree_map.items()), sorted(expected.items()))
+
+            for _ in range(20):
+                low, high = sorted(rng.sample(range(-5, 205), 2))
+                keys = [key for key in sorted(expected) if low <= key < high]
+                view = tree_map.sub_map(low, high)
+                self.assertEqual(list(view), keys)
+                self.assertEqual(len(view), len(keys))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Module which provides a test class for the TreeMultiset."""
+
+import random
+import unittest
+from collections import Counter
+from model.exceptions.tree_set_exceptions import *
+from model.tree_multiset import TreeMultiset
+
+
+class TestTreeMultiset(unittest.TestCase):
+    """Test the occurrences, ranks and selections of the TreeMultiset."""
+
+    def setUp(self):
+        """Set up a TreeMultiset with repeated numbers"""
+        self.multiset = TreeMultiset(int, [3, 1, 3, 2, 3, 5, 5])
+
+    def test_add_remove(self):
+        """Test adding and removing occurrences"""
+        self.assertEqual(self.multiset.add(3, 2), 3)
+        self.assertEqual(self.multiset.count(3), 5)
+        self.assertEqual(self.multiset.add(4), 0)
+        self.assertEqual(self.multiset.add(4, 0), 1)
+        self.assertEqual(self.multiset.remove(3, 4), 5)
+        self.assertEqual(self.multiset.count(3), 1)
+        self.assertEqual(self.multiset.remove(5, 10), 2)
+        self.assertEqual(self.multiset.count(5), 0)
+        self.assertEqual(self.multiset.remove(5), 0)
+        self.assertEqual(self.multiset.remove(1, 0), 1)
+        self.assertEqual(list(self.multiset), [1, 2, 3, 4])
+        self.assertTrue(self.multiset.verify())
+        self.assertRaises(ValueError, self.multiset.add, 1, -1)
+        self.assertRaises(ValueError, self.multiset.remove, 1, -1)
+        self.assertRaises(TypeError, self.multiset.add, "a")
+        self.assertRaises(NullPointerException, self.multiset.count, None)
+
+    def test_sizes(self):
+        """Test the total and distinct sizes"""
+        self.assertEqual(self.multiset.size(), 7)
+        self.assertEqual(len(self.multiset), 7)
+        self.assertEqual(self.multiset.distinct_size(), 4)
+        self.assertEqual(list(self.multiset.items()),
+                         [(1, 1), (2, 1), (3, 3), (5, 2)])
+        self.assertEqual(list(reversed(self.multiset)),
+                         [5, 5, 3, 3, 3, 2, 1])
+        self.multiset.clear()
+        self.assertEqual(self.multiset.size(), 0)
+        self.assertTrue(self.multiset.is_empty())
+
+    def test_rank_select(self):
+        """Test the ranks and selections weighted by the occurrences"""
+        self.assertEqual(self.multiset.rank(3), 2)
+        self.assertEqual(self.multiset.rank(4), 5)
+        self.assertEqual(self.multiset.rank(0), 0)
+        self.assertEqual(self.multiset.rank(9), 7)
+        self.assertEqual([self.multiset.select(index) for index in range(7)],
+                         [1, 2, 3, 3, 3, 5, 5])
+        self.assertEqual(self.multiset.select(-3), 3)
+        self.assertRaises(IndexError, self.multiset.select, 7)
+        self.assertRaises(IndexError, self.multiset.select, -8)
+
+    def test_equality(self):
+        """Test the equality and the clones"""
+        clone = self.multiset.clone()
+        self.assertEqual(clone, self.multiset)
+        clone.add(1)
+        self.assertNotEqual(clone, self.multiset)
+        clone.remove(1)
+        clone.remove(2)
+        clone.add(3)
+        self.assertNotEqual(clone, self.multiset)
+
+    def test_random_operations(self):
+        """Test random operations against a Counter"""
+        rng = random.Random(45)
+        for _ in range(50):
+            multiset = TreeMultiset(int)
+            multiset.enable_verification()
+            expected = Counter()
+            for _ in range(rng.randrange(300)):
+                value, occurrences = rng.randrange(50), rng.randrange(4)
+                if rng.random() < 0.6:
+                    self.assertEqual(multiset.add(value, occurrences),
+                                     expected[value])
+                    expected[value] += occurrences
+                else:
+                    self.assertEqual(multiset.remove(value, occurrences),
+                                     expected[value])
+                    expected[value] = max(0, expected[value] - occurrences)
+
+            elements = sorted(expected.elements())
+            self.assertEqual(list(multiset), elements)
+            self.assertEqual(multiset.distinct_size(), len(+expected))
+            for index in rng.sample(range(len(elements)),
+                                    min(20, len(elements))):
+                self.assertEqual(multiset.select(index), elements[index])
+                self.assertEqual(multiset.rank(elements[index]),
+                                 elements.index(elements[index]))
+
+
+if __name__ == '__main__':
+    unittest.main()
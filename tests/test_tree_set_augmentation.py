@@ -0,0 +1,105 @@
+"""Module which provides a test class for the RedBlackTree augmentations."""
+
+import operator
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import BlockedTreeSet, RedBlackTree, TreeSet
+
+
+class TestTreeSetAugmentation(unittest.TestCase):
+    """Test the subtree aggregates and the range aggregate queries."""
+
+    def setUp(self):
+        """Set up a TreeSet with the numbers lower than 100 and its sum"""
+        self.tree_set = TreeSet(int, list(range(100)))
+        self.tree_set.add_augmentation("sum", operator.add, 0)
+
+    def test_aggregate(self):
+        """Test range aggregates with inclusive and exclusive bounds"""
+        self.assertEqual(self.tree_set.aggregate("sum"), 4950)
+        self.assertEqual(self.tree_set.aggregate("sum", 10, 20), 165)
+        self.assertEqual(self.tree_set.aggregate("sum", 10, 20, False), 135)
+        self.assertEqual(
+            self.tree_set.aggregate("sum", 10, 20, (True, False)), 145)
+        self.assertEqual(self.tree_set.aggregate("sum", high=4), 10)
+        self.assertEqual(self.tree_set.aggregate("sum", low=98), 197)
+        self.assertEqual(self.tree_set.aggregate("sum", 20, 10), 0)
+        self.assertEqual(self.tree_set.aggregate("sum", 200, 300), 0)
+
+    def test_modifications(self):
+        """Test the aggregates are maintained by every modification"""
+        self.assertTrue(self.tree_set.add(1000))
+        self.assertTrue(self.tree_set.remove(50))
+        self.assertEqual(self.tree_set.remove_range(0, 9), 10)
+        self.assertTrue(self.tree_set.remove_if(lambda value: value % 2))
+        self.assertEqual(self.tree_set.aggregate("sum"),
+                         sum(range(10, 100, 2)) - 50 + 1000)
+        self.assertEqual(self.tree_set.aggregate("sum", 40, 60), 500)
+        self.assertTrue(self.tree_set.verify())
+
+    def test_custom_monoids(self):
+        """Test non commutative and mapped augmentations"""
+        self.tree_set.add_augmentation("values", operator.add, (),
+                                       lambda value: (value,))
+        self.tree_set.add_augmentation("max", max, float("-inf"))
+        self.assertEqual(self.tree_set.augmentations(),
+                         ["sum", "values", "max"])
+        self.assertEqual(self.tree_set.aggregate("values", 95),
+                         (95, 96, 97, 98, 99))
+        self.assertEqual(self.tree_set.aggregate("max", 10, 20, False), 19)
+        self.assertEqual(self.tree_set.aggregate("max", 200), float("-inf"))
+        self.assertRaises(ValueError, self.tree_set.add_augmentation, "max",
+                          min, float("inf"))
+
+    def test_remove_augmentation(self):
+        """Test removing the augmentations restores the original class"""
+        self.tree_set.add_augmentation("count", operator.add, 0,
+                                       lambda value: 1)
+        self.tree_set.remove_augmentation("sum")
+        self.assertEqual(self.tree_set.aggregate("count", 10, 19), 10)
+        self.assertRaises(ValueError, self.tree_set.aggregate, "sum")
+        self.tree_set.remove_augmentation("count")
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertEqual(self.tree_set.augmentations(), [])
+        self.assertRaises(ValueError, self.tree_set.aggregate, "count")
+        self.assertRaises(ValueError, self.tree_set.remove_augmentation,
+                          "count")
+        self.assertTrue(self.tree_set.add(100))
+
+    def test_unsupported_backend(self):
+        """Test the blocked backend has no augmentations"""
+        blocked = BlockedTreeSet(int, [1, 2, 3])
+        self.assertRaises(UnsupportedOperationException,
+                          blocked.add_augmentation, "sum", operator.add, 0)
+        self.assertRaises(ValueError, blocked.aggregate, "sum")
+
+    def test_random_aggregates(self):
+        """Test random modifications against brute-force aggregates"""
+        rng = random.Random(42)
+        for _ in range(50):
+            expected = set(rng.sample(range(1000), rng.randrange(200)))
+            tree = RedBlackTree(int)
+            for value in expected:
+                tree.add(value)
+            tree.add_augmentation("values", operator.add, (),
+                                  lambda value: (value,))
+            tree.enable_verification()
+            for _ in range(100):
+                value = rng.randrange(1000)
+                if rng.random() < 0.5:
+                    tree.add(value)
+                    expected.add(value)
+                else:
+                    tree.remove(value)
+                    expected.discard(value)
+
+            for _ in range(20):
+                low, high = sorted(rng.sample(range(-5, 1005), 2))
+                self.assertEqual(tree.aggregate("values", low, high), tuple(
+                    value for value in sorted(expected)
+                    if low <= value <= high))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Module which provides a test class for the TreeSet batch removals."""
+
+import random
+import unittest
+from unittest import mock
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import BlockedTreeSet, RedBlackTree, TreeSet
+
+
+class TestTreeSetBatchRemoval(unittest.TestCase):
+    """Test remove_all, retain_all and remove_if on both backends."""
+
+    def setUp(self):
+        """Set up TreeSets with the numbers lower than 100"""
+        self.tree_sets = [TreeSet(int, list(range(100))),
+                          BlockedTreeSet(int, list(range(100)), load=4)]
+
+    def test_remove_all(self):
+        """Test removing small and large batches of values"""
+        for tree_set in self.tree_sets:
+            self.assertTrue(tree_set.remove_all([3, 5, 500]))
+            self.assertFalse(tree_set.remove_all([3, 5]))
+            self.assertTrue(tree_set.remove_all(set(range(0, 100, 2))))
+            self.assertEqual(list(tree_set),
+                             [value for value in range(1, 100, 2)
+                              if value != 3 and value != 5])
+            self.assertTrue(tree_set.verify())
+            self.assertFalse(tree_set.remove_all([]))
+            self.assertRaises(TypeError, tree_set.remove_all, 5)
+            self.assertRaises(TypeError, tree_set.remove_all, [1, "a"])
+            self.assertRaises(NullPointerException, tree_set.remove_all,
+                              [1, None])
+            self.assertEqual(tree_set.size(), 48)
+
+    def test_retain_all(self):
+        """Test retaining the values of a collection"""
+        for tree_set in self.tree_sets:
+            self.assertFalse(tree_set.retain_all(range(-5, 105)))
+            self.assertTrue(tree_set.retain_all([90, 10, 50, 10, 200]))
+            self.assertEqual(list(tree_set), [10, 50, 90])
+            self.assertTrue(tree_set.verify())
+            self.assertTrue(tree_set.retain_all([]))
+            self.assertTrue(tree_set.is_empty())
+            self.assertRaises(TypeError, tree_set.retain_all, [1.5])
+
+    def test_remove_if(self):
+        """Test removing the values satisfying a predicate"""
+        for tree_set in self.tree_sets:
+            self.assertFalse(tree_set.remove_if(lambda value: value > 100))
+            self.assertTrue(tree_set.remove_if(lambda value: value % 3 == 0))
+            self.assertEqual(list(tree_set),
+                             [value for value in range(100) if value % 3])
+            self.assertEqual(tree_set.rank(50), 33)
+            self.assertEqual(tree_set.fingerprint(), TreeSet(
+                int, [value for value in range(100) if value % 3]
+            ).fingerprint())
+            self.assertTrue(tree_set.remove_if(lambda value: True))
+            self.assertTrue(tree_set.is_empty())
+            self.assertTrue(tree_set.verify())
+
+    def test_strategies(self):
+        """Test both the deletion and the rebuilding strategies"""
+        for fraction in (0.0, 1.0):
+            tree_set = TreeSet(int, list(range(1000)))
+            tree_set.enable_stats()
+            with mock.patch.object(RedBlackTree, "REBUILD_FRACTION", fraction):
+                self.assertTrue(
+                    tree_set.remove_if(lambda value: value % 10 == 0))
+            self.assertEqual(tree_set.size(), 900)
+            self.assertTrue(tree_set.verify())
+            self.assertEqual(tree_set.stats()["allocations"], 0)
+            rotations = tree_set.stats()["left_rotations"] \
+                + tree_set.stats()["right_rotations"]
+            if fraction:
+                self.assertGreater(rotations, 0)
+            else:
+                self.assertEqual(rotations, 0)
+                self.assertEqual(tree_set.height(), 10)
+
+    def test_random_batches(self):
+        """Test random batch removals keep the sets valid"""
+        rng = random.Random(40)
+        for _ in range(100):
+            values = rng.sample(range(1000), rng.randrange(300))
+            others = rng.sample(range(1000), rng.randrange(300))
+            for tree_set in (TreeSet(int, values),
+                             BlockedTreeSet(int, values, load=4)):
+                tree_set.enable_verification()
+                if rng.random() < 0.5:
+                    tree_set.remove_all(others)
+                    expected = sorted(set(values) - set(others))
+                else:
+                    tree_set.retain_all(others)
+                    expected = sorted(set(values) & set(others))
+                self.assertEqual(list(tree_set), expected)
+                self.assertEqual(tree_set.size(), len(expected))
+                self.assertEqual(tree_set.fingerprint(),
+                                 TreeSet(int, expected).fingerprint())
+
+    def test_frozen(self):
+        """Test a FrozenTreeSet cannot remove batches"""
+        frozen = self.tree_sets[0].freeze()
+        self.assertRaises(UnsupportedOperationException, frozen.remove_all,
+                          [1])
+        self.assertRaises(UnsupportedOperationException, frozen.retain_all,
+                          [1])
+        self.assertRaises(UnsupportedOperationException, frozen.remove_if,
+                          bool)
+        self.assertEqual(frozen.size(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Module which provides a test class for the TreeSet benchmark suite."""
+
+import json
+import random
+import unittest
+from benchmarks import finger_search_benchmark, lsm_benchmark
+from benchmarks.tree_set_benchmark import DISTRIBUTIONS, SWAP_DISTANCE, \
+    generate, run
+
+
+class TestTreeSetBenchmark(unittest.TestCase):
+    """Test the benchmark inputs and results."""
+
+    def test_distributions(self):
+        """Test every distribution generates distinct values"""
+        for distribution in DISTRIBUTIONS:
+            values = generate(distribution, 250, random.Random(0))
+            self.assertEqual(len(values), 250, distribution)
+            self.assertEqual(len(set(values)), 250, distribution)
+        self.assertEqual(generate("sorted", 3, random.Random(0)), [0, 10, 20])
+        self.assertEqual(generate("reverse", 3, random.Random(0)), [20, 10, 0])
+        self.assertRaises(ValueError, generate, "unknown", 3, random.Random(0))
+
+    def test_nearly_sorted(self):
+        """Test nearly sorted values are moved by a bounded distance"""
+        values = generate("nearly_sorted", 1000, random.Random(0))
+        self.assertNotEqual(values, sorted(values))
+        for position, value in enumerate(values):
+            self.assertLessEqual(abs(value // 10 - position), SWAP_DISTANCE)
+
+    def test_results(self):
+        """Test a small run produces a JSON result per operation"""
+        results = run(sizes=(50,), distributions=("random",),
+                      types=("int", "Person"), operations=("add", "floor"),
+                      max_queries=10)
+        json.dumps(results)
+        self.assertEqual(len(results["results"]), 8)
+        for result in results["results"]:
+            self.assertEqual(result["size"], 50)
+            self.assertIn(result["operation"], ("add", "floor"))
+            self.assertEqual(result["operations"],
+                             50 if result["operation"] == "add" else 10)
+
+    def test_finger_search_results(self):
+        """Test a small finger search run gives every mode and operation"""
+        results = finger_search_benchmark.run(sizes=(50,), repeat=1)
+        json.dumps(results)
+        self.assertEqual(len(results), 12)
+        self.assertEqual({result["finger_search"] for result in results},
+                         {False, True})
+
+    def test_lsm_results(self):
+        """Test a small LSM run gives both structures"""
+        results = lsm_benchmark.run(sizes=(50,), repeat=1)
+        json.dumps(results)
+        self.assertEqual([result["structure"] for result in results],
+                         ["tree_set", "lsm_tree_set"])
+
+
+if __name__ == '__main__':
+    unittest.main()
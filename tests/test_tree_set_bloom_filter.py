@@ -0,0 +1,139 @@
+"""Module which provides a test class for the TreeSet Bloom filter front."""
+
+import random
+import unittest
+from model.bloom_filter import CountingBloomFilter
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import TreeSet
+
+
+class TestTreeSetBloomFilter(unittest.TestCase):
+    """Test the counting Bloom filter and the membership tests it filters."""
+
+    def setUp(self):
+        """Set up a filtered TreeSet with some words"""
+        self.tree_set = TreeSet(str, ["apple", "banana", "cherry"])
+        self.tree_set.enable_bloom_filter()
+
+    def test_counting_bloom_filter(self):
+        """Test a filter has no false negatives and forgets removed values"""
+        bloom_filter = CountingBloomFilter(1000, 0.01)
+        self.assertEqual(bloom_filter.hashes, 7)
+        for value in range(1000):
+            bloom_filter.add(value)
+        self.assertTrue(all(value in bloom_filter for value in range(1000)))
+        false_positives = sum(value in bloom_filter
+                              for value in range(1000, 11000))
+        self.assertLess(false_positives, 300)
+        for value in range(1000):
+            bloom_filter.remove(value)
+        self.assertEqual(len(bloom_filter), 0)
+        self.assertFalse(any(value in bloom_filter for value in range(1000)))
+        self.assertRaises(ValueError, CountingBloomFilter, 0, 0.01)
+        self.assertRaises(ValueError, CountingBloomFilter, 10, 1)
+
+    def test_contains(self):
+        """Test membership tests and their statistics"""
+        self.assertIn("apple", self.tree_set)
+        self.assertTrue(self.tree_set.contains("cherry"))
+        self.assertNotIn("durian", self.tree_set)
+        self.assertRaises(NullPointerException, self.tree_set.contains, None)
+        self.assertRaises(TypeError, self.tree_set.contains, 1)
+        stats = self.tree_set.bloom_filter_stats(reset=True)
+        self.assertEqual(stats["lookups"], 3)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["negatives"] + stats["false_positives"], 1)
+        self.assertEqual(self.tree_set.bloom_filter_stats()["lookups"], 0)
+
+    def test_modifications(self):
+        """Test the filter follows insertions, deletions and clear"""
+        self.tree_set.add("durian")
+        self.assertIn("durian", self.tree_set)
+        self.tree_set.remove("apple")
+        self.tree_set.remove_range("b", "c")
+        self.assertNotIn("apple", self.tree_set)
+        self.assertNotIn("banana", self.tree_set)
+        self.assertEqual(list(self.tree_set), ["cherry", "durian"])
+        self.tree_set.clear()
+        self.assertNotIn("cherry", self.tree_set)
+        self.tree_set.add("elderberry")
+        self.assertIn("elderberry", self.tree_set)
+
+    def test_independent_of_fingerprint(self):
+        """Test the filter follows the content without the fingerprint"""
+        object.__setattr__(self.tree_set, "_reset_fingerprint",
+                           lambda: None)
+        object.__setattr__(self.tree_set, "_update_fingerprint",
+                           lambda value, added: None)
+        self.tree_set.add("durian")
+        self.tree_set.remove("apple")
+        self.assertIn("durian", self.tree_set)
+        self.assertNotIn("apple", self.tree_set)
+        self.tree_set.clear()
+        self.tree_set.add("fig")
+        self.assertEqual(list(self.tree_set), ["fig"])
+        self.assertIn("fig", self.tree_set)
+        self.assertNotIn("durian", self.tree_set)
+
+    def test_growth(self):
+        """Test the filter is resized as the TreeSet grows"""
+        tree_set = TreeSet(int)
+        tree_set.enable_bloom_filter()
+        tree_set.add_all(list(range(0, 20000, 2)))
+        self.assertTrue(all(value in tree_set
+                            for value in range(0, 20000, 2)))
+        self.assertFalse(any(value in tree_set
+                             for value in range(1, 20000, 2)))
+        stats = tree_set.bloom_filter_stats()
+        self.assertLess(stats["false_positives"], 300)
+
+    def test_disable(self):
+        """Test disabling the filter restores the class"""
+        self.tree_set.disable_bloom_filter()
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertIn("apple", self.tree_set)
+        self.assertRaises(IllegalStateException,
+                          self.tree_set.bloom_filter_stats)
+
+    def test_validation(self):
+        """Test the filter needs a valid rate and a hashable type"""
+        self.assertRaises(ValueError, self.tree_set.enable_bloom_filter, 0)
+        self.assertRaises(UnsupportedOperationException,
+                          TreeSet(list).enable_bloom_filter)
+
+    def test_frozen(self):
+        """Test frozen sets can be filtered and stay hashable"""
+        frozen = self.tree_set.freeze()
+        frozen.enable_bloom_filter()
+        self.assertIn("banana", frozen)
+        self.assertNotIn("durian", frozen)
+        self.assertEqual(hash(frozen), hash(self.tree_set.freeze()))
+
+    def test_random(self):
+        """Test random operations against a set on both backends"""
+        random.seed(47)
+        for backend in TreeSet.BACKENDS:
+            tree_set = TreeSet(int, backend=backend)
+            tree_set.enable_bloom_filter(0.1)
+            tree_set.enable_write_buffer(16)
+            expected = set()
+            for _ in range(3000):
+                value = random.randint(0, 1000)
+                operation = random.random()
+                if operation < 0.4:
+                    tree_set.add(value)
+                    expected.add(value)
+                elif operation < 0.8:
+                    self.assertEqual(value in tree_set, value in expected)
+                elif operation < 0.95:
+                    self.assertEqual(tree_set.remove(value),
+                                     value in expected)
+                    expected.discard(value)
+                else:
+                    tree_set.remove_if(lambda item: item % 5 == 0)
+                    expected = {item for item in expected if item % 5}
+            self.assertEqual(list(tree_set), sorted(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Module which provides a test class for the TreeSet set comparisons."""
+
+import unittest
+from model.tree_set import RedBlackTree, TreeSet
+from tests.tests_classes import Person
+
+
+class TestTreeSetComparison(unittest.TestCase):
+    """Test the equality and the subset, superset and disjoint checks."""
+
+    def setUp(self):
+        """Set up TreeSets of both backends"""
+        self.tree_set = TreeSet(int, [1, 3, 5, 7, 9])
+        self.blocked = TreeSet(int, [1, 3, 5, 7, 9], backend="blocked")
+
+    def test_equality(self):
+        """Test the equality of TreeSets"""
+        self.assertEqual(self.tree_set, self.blocked)
+        self.assertEqual(self.tree_set, TreeSet(int, [9, 7, 5, 3, 1]))
+        self.assertNotEqual(self.tree_set, TreeSet(int, [1, 3, 5, 7, 8]))
+        self.assertNotEqual(self.tree_set, TreeSet(int, [1, 3, 5, 7]))
+        self.assertNotEqual(self.tree_set, [1, 3, 5, 7, 9])
+        self.assertEqual(TreeSet(int), TreeSet(int, backend="blocked"))
+
+        tree = RedBlackTree(int)
+        for value in (5, 1, 9, 7, 3):
+            tree.add(value)
+        self.assertEqual(self.tree_set, tree)
+
+    def test_subset(self):
+        """Test the subset checks"""
+        for tree_set in (self.tree_set, self.blocked):
+            self.assertTrue(TreeSet(int).issubset(tree_set))
+            self.assertTrue(TreeSet(int, [3, 7]).issubset(tree_set))
+            self.assertTrue(tree_set.issubset(tree_set))
+            self.assertFalse(TreeSet(int, [3, 4]).issubset(tree_set))
+            self.assertFalse(TreeSet(int, [0, 3]).issubset(tree_set))
+            self.assertFalse(TreeSet(int, [3, 10]).issubset(tree_set))
+            self.assertFalse(tree_set.issubset(TreeSet(int, [1, 3])))
+            self.assertTrue(TreeSet(int, [1, 9]).issubset([9, 1, 2, 1]))
+            self.assertTrue(TreeSet(int, [1, 9]) <= tree_set)
+            self.assertTrue(TreeSet(int, [1, 9]) < tree_set)
+            self.assertFalse(tree_set < tree_set)
+        self.assertRaises(TypeError, self.tree_set.issubset, 5)
+        self.assertRaises(TypeError, self.tree_set.issubset, ["a"])
+
+    def test_superset(self):
+        """Test the superset checks"""
+        self.assertTrue(self.tree_set.issuperset([1, 5]))
+        self.assertTrue(self.tree_set.issuperset(self.blocked))
+        self.assertFalse(self.tree_set.issuperset([1, 2]))
+        self.assertTrue(self.tree_set >= self.blocked)
+        self.assertFalse(self.tree_set > self.blocked)
+        self.assertTrue(self.blocked > TreeSet(int, [5]))
+        with self.assertRaises(TypeError):
+            self.tree_set > [1]
+
+    def test_disjoint(self):
+        """Test the disjoint checks"""
+        self.assertTrue(self.tree_set.isdisjoint(TreeSet(int, [2, 4, 6])))
+        self.assertTrue(self.tree_set.isdisjoint([10, 11]))
+        self.assertTrue(self.tree_set.isdisjoint([]))
+        self.assertTrue(TreeSet(int).isdisjoint(self.tree_set))
+        self.assertFalse(self.tree_set.isdisjoint([0, 9]))
+        self.assertFalse(self.blocked.isdisjoint(TreeSet(int, [2, 4, 5])))
+
+    def test_custom_class(self):
+        """Test the comparisons of a TreeSet of Person objects"""
+        people = [Person("Ana", 20), Person("Bob", 30), Person("Eve", 40)]
+        tree_set = TreeSet(Person, people)
+        self.assertEqual(tree_set, TreeSet(Person, people[::-1]))
+        self.assertTrue(TreeSet(Person, people[:2]).issubset(tree_set))
+        self.assertFalse(tree_set.isdisjoint(people[2:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Module which provides a test class for the TreeSet range counting."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import BlockedTreeSet, TreeSet
+
+
+class TestTreeSetCountRange(unittest.TestCase):
+    """Test the rank and range counting of both backends."""
+
+    def setUp(self):
+        """Set up TreeSets with the even numbers lower than 100"""
+        self.tree_sets = [TreeSet(int, list(range(0, 100, 2))),
+                          BlockedTreeSet(int, list(range(0, 100, 2)), load=4)]
+
+    def test_rank(self):
+        """Test the rank of present and absent values"""
+        for tree_set in self.tree_sets:
+            self.assertEqual(tree_set.rank(0), 0)
+            self.assertEqual(tree_set.rank(10), 5)
+            self.assertEqual(tree_set.rank(11), 6)
+            self.assertEqual(tree_set.rank(-5), 0)
+            self.assertEqual(tree_set.rank(500), 50)
+            self.assertRaises(TypeError, tree_set.rank, "a")
+            self.assertRaises(NullPointerException, tree_set.rank, None)
+
+    def test_count_range(self):
+        """Test the inclusive and exclusive bounds"""
+        for tree_set in self.tree_sets:
+            self.assertEqual(tree_set.count_range(10, 20), 6)
+            self.assertEqual(tree_set.count_range(10, 20, False), 4)
+            self.assertEqual(tree_set.count_range(10, 20, (True, False)), 5)
+            self.assertEqual(tree_set.count_range(10, 20, (False, True)), 5)
+            self.assertEqual(tree_set.count_range(11, 19), 4)
+            self.assertEqual(tree_set.count_range(-100, 1000), 50)
+            self.assertEqual(tree_set.count_range(10, 10), 1)
+            self.assertEqual(tree_set.count_range(10, 10, False), 0)
+            self.assertEqual(tree_set.count_range(20, 10), 0)
+            self.assertEqual(TreeSet(int).count_range(1, 5), 0)
+            self.assertRaises(TypeError, tree_set.count_range, 1, "a")
+            self.assertRaises(NullPointerException, tree_set.count_range,
+                              None, 5)
+
+    def test_random_operations(self):
+        """Test the counts stay exact while the sets change"""
+        rng = random.Random(11)
+        for tree_set in self.tree_sets:
+            for _ in range(1500):
+                value = rng.randrange(300)
+                if rng.random() < 0.55:
+                    tree_set.add(value)
+                else:
+                    tree_set.remove(value)
+
+                low, high = sorted(rng.sample(range(-5, 305), 2))
+                values = list(tree_set)
+                self.assertEqual(tree_set.count_range(low, high),
+                                 sum(low <= item <= high for item in values))
+                self.assertEqual(tree_set.rank(value),
+                                 sum(item < value for item in values))
+            self.assertTrue(tree_set.verify())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Module which provides a test class for the RedBlackTree finger search."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_map import TreeMap
+from model.tree_multiset import TreeMultiset
+from model.tree_set import RedBlackTree, TreeSet
+
+
+class TestTreeSetFingerSearch(unittest.TestCase):
+    """Test the searches starting from the finger and the greatest node."""
+
+    def setUp(self):
+        """Set up a TreeSet with finger search and the numbers below 100"""
+        self.tree_set = TreeSet(int)
+        self.tree_set.enable_finger_search()
+        for value in range(100):
+            self.tree_set.add(value)
+
+    def test_append(self):
+        """Test ascending insertions and lookups past the greatest value"""
+        self.assertFalse(self.tree_set.add(99))
+        self.assertTrue(self.tree_set.add(100))
+        self.assertIn(100, self.tree_set)
+        self.assertNotIn(101, self.tree_set)
+        self.assertEqual(self.tree_set.last(), 100)
+        self.assertTrue(self.tree_set.verify())
+
+    def test_ascending(self):
+        """Test long ascending runs are rebalanced up the right spine"""
+        for value in range(100, 5000):
+            self.assertTrue(self.tree_set.add(value))
+        self.assertTrue(self.tree_set.verify())
+        self.assertEqual(self.tree_set.rank(2500), 2500)
+        self.assertLessEqual(self.tree_set.height(), 24)
+        self.assertTrue(self.tree_set.add(-1))
+        self.assertTrue(self.tree_set.add(5000))
+        self.assertTrue(self.tree_set.verify())
+
+    def test_local_searches(self):
+        """Test searches near and far from the finger"""
+        for value in (50, 52, 49, 51, 10, 90, 0, 99):
+            self.assertIn(value, self.tree_set)
+        for value in (-1, 100, 1000):
+            self.assertNotIn(value, self.tree_set)
+        self.assertTrue(self.tree_set.remove(99))
+        self.assertTrue(self.tree_set.remove(98))
+        self.assertEqual(self.tree_set.last(), 97)
+        self.assertTrue(self.tree_set.add(98))
+        self.assertEqual(self.tree_set.poll_last(), 98)
+        self.assertTrue(self.tree_set.verify())
+
+    def test_bulk_modifications(self):
+        """Test the finger is forgotten after range and batch removals"""
+        self.tree_set.remove_range(90, 99)
+        self.assertTrue(self.tree_set.add(95))
+        self.assertEqual(self.tree_set.last(), 95)
+        self.tree_set.remove_if(lambda value: value > 50)
+        self.assertTrue(self.tree_set.add(60))
+        self.assertFalse(self.tree_set.add(50))
+        self.tree_set.clear()
+        self.assertNotIn(1, self.tree_set)
+        self.assertTrue(self.tree_set.add(1))
+        self.assertEqual(list(self.tree_set), [1])
+
+    def test_other_trees(self):
+        """Test multisets and maps search from the finger too"""
+        multiset = TreeMultiset(int)
+        multiset.enable_finger_search()
+        for value in (1, 2, 2, 3, 1, 5):
+            multiset.add(value)
+        self.assertEqual(list(multiset), [1, 1, 2, 2, 3, 5])
+        tree_map = TreeMap(int)
+        tree_map.enable_finger_search()
+        for key in range(50):
+            tree_map[key] = key * key
+        self.assertEqual(tree_map[30], 900)
+        self.assertEqual(tree_map.pop(49), 2401)
+        self.assertEqual(tree_map.last_entry(), (48, 2304))
+
+    def test_disable(self):
+        """Test disabling the finger search restores the class"""
+        self.tree_set.disable_finger_search()
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertIn(10, self.tree_set)
+        self.assertRaises(UnsupportedOperationException,
+                          TreeSet(int, backend="blocked").enable_finger_search)
+
+    def test_random(self):
+        """Test nearly sorted and random operations against a set"""
+        random.seed(49)
+        tree = RedBlackTree(int)
+        tree.enable_finger_search()
+        tree_set = TreeSet(int)
+        tree_set.enable_finger_search()
+        tree_set.enable_hash_index()
+        expected = set()
+        for step in range(3000):
+            value = step + random.randint(-30, 5) if random.random() < 0.7 \
+                else random.randint(0, 3000)
+            operation = random.random()
+            if operation < 0.5:
+                self.assertEqual(tree.add(value), value not in expected)
+                tree_set.add(value)
+                expected.add(value)
+            elif operation < 0.8:
+                self.assertEqual(value in tree, value in expected)
+                self.assertEqual(value in tree_set, value in expected)
+            else:
+                self.assertEqual(tree.remove(value), value in expected)
+                tree_set.remove(value)
+                expected.discard(value)
+        self.assertEqual(list(tree), sorted(expected))
+        self.assertEqual(list(tree_set), sorted(expected))
+        self.assertTrue(tree.verify())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Module which provides a test class for the TreeSet fingerprints."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import FrozenTreeSet, TreeSet
+from tests.tests_classes import Person
+
+
+class TestTreeSetFingerprint(unittest.TestCase):
+    """Test the incremental fingerprint and the FrozenTreeSet."""
+
+    def test_order_independent(self):
+        """Test equal sets have equal fingerprints whatever their history"""
+        values = list(range(500))
+        shuffled = values[:]
+        random.Random(5).shuffle(shuffled)
+        tree_set = TreeSet(int, values)
+        self.assertEqual(tree_set.fingerprint(),
+                         TreeSet(int, shuffled).fingerprint())
+        self.assertEqual(tree_set.fingerprint(),
+                         TreeSet(int, shuffled, "blocked").fingerprint())
+
+        other = TreeSet(int, shuffled + [1000, 2000])
+        other.remove(2000)
+        other.poll_last()
+        self.assertEqual(tree_set.fingerprint(), other.fingerprint())
+        self.assertFalse(tree_set.add(3))
+        self.assertFalse(tree_set.remove(600))
+        self.assertEqual(tree_set.fingerprint(), other.fingerprint())
+
+    def test_changes(self):
+        """Test the fingerprint changes with the content"""
+        for backend in TreeSet.BACKENDS:
+            tree_set = TreeSet(int, [1, 2, 3], backend)
+            fingerprint = tree_set.fingerprint()
+            tree_set.remove(3)
+            tree_set.add(4)
+            self.assertNotEqual(tree_set.fingerprint(), fingerprint)
+            self.assertNotEqual(tree_set, TreeSet(int, [1, 2, 3]))
+            tree_set.clear()
+            self.assertEqual(tree_set.fingerprint(), 0)
+
+    def test_unhashable(self):
+        """Test the fingerprint is disabled for unhashable types"""
+        people = [Person("Ana", 20), Person("Bob", 30)]
+        tree_set = TreeSet(Person, people)
+        self.assertIsNone(tree_set.fingerprint())
+        self.assertEqual(tree_set, TreeSet(Person, people[::-1]))
+        self.assertRaises(TypeError, hash, tree_set.freeze())
+
+    def test_frozen(self):
+        """Test the FrozenTreeSet is immutable and hashable"""
+        frozen = TreeSet(int, [3, 1, 2]).freeze()
+        self.assertIsInstance(frozen, FrozenTreeSet)
+        self.assertEqual(list(frozen), [1, 2, 3])
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertEqual(frozen, TreeSet(int, [1, 2, 3]))
+        self.assertEqual(hash(frozen), hash(FrozenTreeSet(int, [2, 3, 1])))
+        self.assertEqual({frozen: "value"}[FrozenTreeSet(int, [1, 2, 3])],
+                         "value")
+        self.assertEqual(len({frozen, FrozenTreeSet(int, [3, 2, 1])}), 1)
+
+        for method, arguments in (("add", (4,)), ("remove", (1,)),
+                                  ("add_all", ([4],)), ("clear", ()),
+                                  ("poll_first", ()), ("poll_last", ())):
+            self.assertRaises(UnsupportedOperationException,
+                              getattr(frozen, method), *arguments)
+        self.assertEqual(list(frozen), [1, 2, 3])
+
+        copy = frozen.clone()
+        self.assertTrue(copy.add(4))
+        self.assertEqual(list(frozen), [1, 2, 3])
+        self.assertRaises(TypeError, hash, copy)
+
+    def test_frozen_features(self):
+        """Test no feature makes a FrozenTreeSet mutable"""
+        features = (("enable_stats", ()), ("enable_profiling", ()),
+                    ("enable_verification", ()), ("enable_finger_search", ()),
+                    ("enable_bloom_filter", ()), ("enable_hash_index", ()),
+                    ("add_augmentation", ("sum", lambda a, b: a + b, 0)))
+        mutators = (("add", (4,)), ("add_all", ([4],)), ("remove", (1,)),
+                    ("clear", ()), ("poll_first", ()), ("poll_last", ()),
+                    ("remove_range", (1, 2)), ("drain_until", (2,)),
+                    ("remove_all", ([1],)), ("retain_all", ([1],)),
+                    ("remove_if", (lambda value: True,)))
+        combined = TreeSet(int, [1, 2, 3]).freeze()
+        for feature, arguments in features:
+            for frozen in (TreeSet(int, [1, 2, 3]).freeze(), combined):
+                expected = hash(frozen)
+                getattr(frozen, feature)(*arguments)
+                for method, method_arguments in mutators:
+                    self.assertRaises(UnsupportedOperationException,
+                                      getattr(frozen, method),
+                                      *method_arguments)
+                self.assertEqual(list(frozen), [1, 2, 3])
+                self.assertEqual(hash(frozen), expected)
+        self.assertRaises(UnsupportedOperationException,
+                          combined.enable_write_buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Module which provides a test class for the TreeSet hash index."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import TreeSet
+
+
+class TestTreeSetHashIndex(unittest.TestCase):
+    """Test the index from the elements to their nodes."""
+
+    def setUp(self):
+        """Set up an indexed TreeSet with the even numbers lower than 100"""
+        self.tree_set = TreeSet(int, list(range(0, 100, 2)))
+        self.tree_set.enable_hash_index()
+
+    def test_contains_and_remove(self):
+        """Test membership tests and deletions through the index"""
+        self.assertIn(10, self.tree_set)
+        self.assertTrue(self.tree_set.contains(98))
+        self.assertNotIn(11, self.tree_set)
+        self.assertTrue(self.tree_set.remove(10))
+        self.assertFalse(self.tree_set.remove(10))
+        self.assertNotIn(10, self.tree_set)
+        self.assertRaises(NullPointerException, self.tree_set.remove, None)
+        self.assertRaises(TypeError, self.tree_set.contains, "10")
+        self.assertTrue(self.tree_set.verify())
+
+    def test_neighbours(self):
+        """Test navigation from indexed and missing values"""
+        self.assertEqual(self.tree_set.higher(10), 12)
+        self.assertEqual(self.tree_set.higher(11), 12)
+        self.assertIsNone(self.tree_set.higher(98))
+        self.assertEqual(self.tree_set.lower(10), 8)
+        self.assertIsNone(self.tree_set.lower(0))
+        self.assertEqual(self.tree_set.ceiling(10), 10)
+        self.assertEqual(self.tree_set.ceiling(11), 12)
+        self.assertEqual(self.tree_set.floor(11), 10)
+
+    def test_modifications(self):
+        """Test the index follows range, batch and buffered modifications"""
+        self.tree_set.remove_range(20, 40)
+        self.tree_set.remove_if(lambda value: value % 3 == 0)
+        self.tree_set.drain_until(10)
+        self.tree_set.enable_write_buffer()
+        self.tree_set.add_all([21, 23])
+        for value in range(101, 200, 2):
+            self.tree_set.add(value)
+        expected = [value for value in range(12, 100, 2)
+                    if not 20 <= value <= 40 and value % 3] + [21, 23] \
+            + list(range(101, 200, 2))
+        self.assertEqual(self.tree_set.size(), len(expected))
+        for value in expected:
+            self.assertIn(value, self.tree_set)
+        self.assertEqual(self.tree_set.higher(23), 44)
+        self.tree_set.clear()
+        self.assertNotIn(44, self.tree_set)
+
+    def test_disable(self):
+        """Test disabling the index restores the class"""
+        self.tree_set.disable_hash_index()
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertIn(10, self.tree_set)
+
+    def test_frozen(self):
+        """Test the index does not make a frozen set mutable"""
+        frozen = TreeSet(int, [1, 2, 3]).freeze()
+        expected = hash(frozen)
+        frozen.enable_hash_index()
+        self.assertRaises(UnsupportedOperationException, frozen.remove, 1)
+        self.assertRaises(UnsupportedOperationException, frozen.clear)
+        self.assertIn(1, frozen)
+        self.assertEqual(list(frozen), [1, 2, 3])
+        self.assertEqual(hash(frozen), expected)
+
+    def test_unsupported(self):
+        """Test unhashable types and the blocked backend have no index"""
+        self.assertRaises(UnsupportedOperationException,
+                          TreeSet(list).enable_hash_index)
+        self.assertRaises(UnsupportedOperationException,
+                          TreeSet(int, backend="blocked").enable_hash_index)
+
+    def test_random(self):
+        """Test random operations against a set"""
+        random.seed(48)
+        tree_set = TreeSet(int)
+        tree_set.enable_hash_index()
+        expected = set()
+        for _ in range(3000):
+            value = random.randint(0, 500)
+            operation = random.random()
+            if operation < 0.4:
+                tree_set.add(value)
+                expected.add(value)
+            elif operation < 0.6:
+                self.assertEqual(value in tree_set, value in expected)
+            elif operation < 0.7:
+                self.assertEqual(
+                    tree_set.higher(value),
+                    min((item for item in expected if item > value),
+                        default=None))
+            elif operation < 0.8:
+                self.assertEqual(
+                    tree_set.lower(value),
+                    max((item for item in expected if item < value),
+                        default=None))
+            else:
+                self.assertEqual(tree_set.remove(value), value in expected)
+                expected.discard(value)
+        self.assertEqual(list(tree_set), sorted(expected))
+        self.assertTrue(tree_set.verify())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Module which provides a test class for the TreeSet profiling hooks."""
+
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.instrumentation.profiling import LatencyHistogram
+from model.tree_set import RedBlackTree, TreeSet
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test the logarithmic latency histogram."""
+
+    def test_buckets(self):
+        """Test every latency is stored in a bucket containing it"""
+        for latency in list(range(200)) + [10 ** power for power in range(19)]:
+            index = LatencyHistogram.bucket(latency)
+            self.assertLessEqual(latency, LatencyHistogram.bucket_limit(index))
+            if index:
+                self.assertGreater(latency,
+                                   LatencyHistogram.bucket_limit(index - 1))
+
+    def test_percentiles(self):
+        """Test the percentiles are precise up to the bucket width"""
+        histogram = LatencyHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        for latency in range(1, 1001):
+            histogram.record(latency * 1000)
+
+        self.assertEqual(histogram.count(), 1000)
+        for percentile in (50, 90, 99):
+            value = histogram.percentile(percentile)
+            self.assertGreaterEqual(value, percentile * 10000)
+            self.assertLessEqual(value, percentile * 10000 * (1 + 1 / 16))
+        self.assertEqual(histogram.percentile(100), 1000000)
+        self.assertRaises(ValueError, histogram.percentile, 101)
+
+        summary = histogram.summary()
+        self.assertEqual(summary["min"], 1000)
+        self.assertEqual(summary["mean"], 500500)
+        self.assertIn("p99.9", summary)
+        histogram.reset()
+        self.assertEqual(histogram.summary()["count"], 0)
+
+
+class TestTreeSetProfiling(unittest.TestCase):
+    """Test the profiling hooks of the TreeSet."""
+
+    def setUp(self):
+        """Set up a TreeSet with enabled profiling"""
+        self.reports = []
+        self.tree_set = TreeSet(int)
+        self.tree_set.enable_profiling(
+            lambda name, summary: self.reports.append((name, summary)))
+
+    def test_disabled(self):
+        """Test profiling is disabled by default"""
+        tree_set = TreeSet(int)
+        self.assertIs(type(tree_set), TreeSet)
+        self.assertRaises(IllegalStateException, tree_set.profile)
+        self.assertRaises(IllegalStateException, tree_set.report_profile)
+        self.assertRaises(ValueError, tree_set.enable_profiling, None, 0)
+
+    def test_histograms(self):
+        """Test a histogram is recorded per called method"""
+        for value in range(100):
+            self.tree_set.add(value)
+        self.assertTrue(5 in self.tree_set)
+        self.assertEqual(self.tree_set.floor(50), 50)
+
+        profile = self.tree_set.profile()
+        self.assertEqual(profile["add"]["count"], 100)
+        self.assertEqual(profile["__contains__"]["count"], 1)
+        self.assertEqual(profile["floor"]["count"], 1)
+        self.assertNotIn("remove", profile)
+        self.assertLessEqual(profile["add"]["p50"], profile["add"]["p99"])
+
+        self.tree_set.profile(reset=True)
+        self.assertEqual(self.tree_set.profile(), {})
+
+    def test_callback(self):
+        """Test the summaries are sent to the callback"""
+        self.tree_set.add(1)
+        self.tree_set.report_profile(reset=True)
+        self.assertEqual([name for name, _ in self.reports], ["add"])
+        self.assertEqual(self.reports[0][1]["count"], 1)
+        self.assertEqual(self.tree_set.profile(), {})
+
+        self.reports.clear()
+        self.tree_set.enable_profiling(
+            lambda name, summary: self.reports.append((name, summary)), 10)
+        for value in range(25):
+            self.tree_set.add(value)
+        self.assertEqual(len(self.reports), 2)
+        self.assertTrue(all(summary["count"] == 10
+                            for _, summary in self.reports))
+
+    def test_disable(self):
+        """Test disabling the profiling restores the original class"""
+        self.tree_set.add(1)
+        self.tree_set.disable_profiling()
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertRaises(IllegalStateException, self.tree_set.profile)
+        self.assertEqual(list(self.tree_set), [1])
+
+    def test_backends(self):
+        """Test profiling a blocked TreeSet and a RedBlackTree"""
+        tree_set = TreeSet(int, [1, 2, 3], backend="blocked")
+        tree_set.enable_profiling()
+        self.assertEqual(tree_set.poll_first(), 1)
+        self.assertEqual(set(tree_set.profile()),
+                         {"poll_first", "first", "remove", "is_empty"})
+        self.assertEqual(tree_set.backend, "blocked")
+
+        tree = RedBlackTree(int)
+        tree.enable_profiling()
+        tree.add(1)
+        self.assertEqual(list(tree.profile()), ["add"])
+
+    def test_with_stats(self):
+        """Test profiling and statistics can be enabled together"""
+        self.tree_set.enable_stats()
+        self.tree_set.add(1)
+        self.assertEqual(self.tree_set.stats()["allocations"], 1)
+        self.assertEqual(self.tree_set.profile()["add"]["count"], 1)
+        self.tree_set.disable_profiling()
+        self.tree_set.disable_stats()
+        self.assertIs(type(self.tree_set), TreeSet)
+
+
+if __name__ == '__main__':
+    unittest.main()
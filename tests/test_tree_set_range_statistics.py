@@ -0,0 +1,109 @@
+"""Module which provides a test class for the TreeSet range statistics."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import BlockedTreeSet, TreeSet
+
+
+class TestTreeSetRangeStatistics(unittest.TestCase):
+    """Test sum_range, mean_range, min_range and max_range on both backends."""
+
+    def setUp(self):
+        """Set up TreeSets with the numbers lower than 100"""
+        self.tree_sets = [TreeSet(int, list(range(100))),
+                          BlockedTreeSet(int, list(range(100)), load=4)]
+
+    def test_sum_range(self):
+        """Test range sums with inclusive and exclusive bounds"""
+        for tree_set in self.tree_sets:
+            self.assertEqual(tree_set.sum_range(10, 20), 165)
+            self.assertEqual(tree_set.sum_range(10, 20, False), 135)
+            self.assertEqual(tree_set.sum_range(10, 20, (False, True)), 155)
+            self.assertEqual(tree_set.sum_range(-50, 500), 4950)
+            self.assertEqual(tree_set.sum_range(20, 10), 0)
+            self.assertEqual(tree_set.sum_range(200, 300), 0)
+
+    def test_mean_range(self):
+        """Test range means"""
+        for tree_set in self.tree_sets:
+            self.assertEqual(tree_set.mean_range(10, 20), 15)
+            self.assertEqual(tree_set.mean_range(0, 3, (True, False)), 1)
+            self.assertIsNone(tree_set.mean_range(5, 6, False))
+            self.assertIsNone(tree_set.mean_range(6, 5))
+
+    def test_min_max_range(self):
+        """Test range minimums and maximums"""
+        for tree_set in self.tree_sets:
+            tree_set.remove_range(40, 60)
+            self.assertEqual(tree_set.min_range(35, 70), 35)
+            self.assertEqual(tree_set.min_range(35, 70, False), 36)
+            self.assertEqual(tree_set.min_range(45, 70), 61)
+            self.assertEqual(tree_set.max_range(30, 50), 39)
+            self.assertEqual(tree_set.max_range(30, 39, False), 38)
+            self.assertIsNone(tree_set.min_range(45, 55))
+            self.assertIsNone(tree_set.max_range(45, 55))
+            self.assertIsNone(tree_set.min_range(39, 61, False))
+            self.assertIsNone(tree_set.max_range(200, 300))
+
+    def test_modifications(self):
+        """Test the sums are maintained by every modification"""
+        tree_set = self.tree_sets[0]
+        self.assertEqual(tree_set.sum_range(0, 99), 4950)
+        self.assertEqual(tree_set.augmentations(), [TreeSet.RANGE_SUM])
+        self.assertTrue(tree_set.add(1000))
+        self.assertTrue(tree_set.remove(50))
+        self.assertEqual(tree_set.remove_range(0, 9), 10)
+        self.assertTrue(tree_set.remove_if(lambda value: value % 2))
+        self.assertEqual(tree_set.sum_range(0, 1000),
+                         sum(range(10, 100, 2)) - 50 + 1000)
+        self.assertTrue(tree_set.verify())
+
+    def test_floats(self):
+        """Test range statistics of floats"""
+        tree_set = TreeSet(float, [0.5, 1.5, 2.25, 4.0])
+        self.assertEqual(tree_set.sum_range(1.0, 3.0), 3.75)
+        self.assertEqual(tree_set.mean_range(0.0, 5.0), 2.0625)
+        self.assertEqual(tree_set.max_range(0.0, 3.0), 2.25)
+
+    def test_invalid_ranges(self):
+        """Test the range statistics of invalid ranges and sets"""
+        for tree_set in self.tree_sets:
+            self.assertRaises(TypeError, tree_set.sum_range, 1, "a")
+            self.assertRaises(NullPointerException, tree_set.mean_range,
+                              None, 1)
+        tree_set = TreeSet(str, ["a", "b"])
+        self.assertRaises(UnsupportedOperationException, tree_set.sum_range,
+                          "a", "b")
+        self.assertRaises(UnsupportedOperationException, tree_set.min_range,
+                          "a", "b")
+
+    def test_random_ranges(self):
+        """Test random range statistics against brute-force ones"""
+        rng = random.Random(43)
+        for _ in range(50):
+            values = set(rng.sample(range(1000), rng.randrange(200)))
+            for tree_set in (TreeSet(int, list(values)),
+                             BlockedTreeSet(int, list(values), load=4)):
+                expected = set(values)
+                for _ in range(30):
+                    low, high = sorted(rng.sample(range(-5, 1005), 2))
+                    in_range = [value for value in sorted(expected)
+                                if low <= value <= high]
+                    self.assertEqual(tree_set.sum_range(low, high),
+                                     sum(in_range))
+                    self.assertEqual(tree_set.min_range(low, high),
+                                     in_range[0] if in_range else None)
+                    self.assertEqual(tree_set.max_range(low, high),
+                                     in_range[-1] if in_range else None)
+                    value = rng.randrange(1000)
+                    if value in expected:
+                        tree_set.remove(value)
+                        expected.discard(value)
+                    else:
+                        tree_set.add(value)
+                        expected.add(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
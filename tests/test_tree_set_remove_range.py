@@ -0,0 +1,79 @@
+"""Module which provides a test class for the TreeSet range removals."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import BlockedTreeSet, TreeSet
+
+
+class TestTreeSetRemoveRange(unittest.TestCase):
+    """Test remove_range and drain_until on both backends."""
+
+    def setUp(self):
+        """Set up TreeSets with the numbers lower than 100"""
+        self.tree_sets = [TreeSet(int, list(range(100))),
+                          BlockedTreeSet(int, list(range(100)), load=4)]
+
+    def test_remove_range(self):
+        """Test removing ranges with inclusive and exclusive bounds"""
+        for tree_set in self.tree_sets:
+            self.assertEqual(tree_set.remove_range(10, 19), 10)
+            self.assertEqual(tree_set.remove_range(30, 40, False), 9)
+            self.assertEqual(tree_set.remove_range(50, 60, (True, False)), 10)
+            self.assertEqual(tree_set.remove_range(10, 19), 0)
+            self.assertEqual(tree_set.remove_range(70, 60), 0)
+            self.assertEqual(tree_set.size(), 71)
+            self.assertEqual(tree_set.ceiling(10), 20)
+            self.assertEqual(tree_set.higher(30), 40)
+            self.assertEqual(tree_set.ceiling(50), 60)
+            self.assertTrue(tree_set.verify())
+            self.assertEqual(tree_set.remove_range(-5, 500), 71)
+            self.assertTrue(tree_set.is_empty())
+            self.assertEqual(tree_set.remove_range(-5, 500), 0)
+            self.assertRaises(TypeError, tree_set.remove_range, 1, "a")
+            self.assertRaises(NullPointerException, tree_set.remove_range,
+                              None, 1)
+
+    def test_drain_until(self):
+        """Test draining the lowest elements"""
+        for tree_set in self.tree_sets:
+            self.assertEqual(tree_set.drain_until(4), [0, 1, 2, 3, 4])
+            self.assertEqual(tree_set.drain_until(7, False), [5, 6])
+            self.assertEqual(tree_set.drain_until(6), [])
+            self.assertEqual(tree_set.first(), 7)
+            self.assertEqual(tree_set.drain_until(1000), list(range(7, 100)))
+            self.assertTrue(tree_set.is_empty())
+            self.assertTrue(tree_set.add(3))
+            self.assertEqual(list(tree_set), [3])
+            self.assertRaises(NullPointerException, tree_set.drain_until, None)
+
+    def test_random_ranges(self):
+        """Test random range removals keep the sets valid"""
+        rng = random.Random(8)
+        for _ in range(100):
+            values = rng.sample(range(1000), rng.randrange(300))
+            for tree_set in (TreeSet(int, values),
+                             BlockedTreeSet(int, values, load=4)):
+                tree_set.enable_verification()
+                low, high = sorted(rng.sample(range(-10, 1010), 2))
+                expected = [value for value in sorted(values)
+                            if not low <= value <= high]
+                self.assertEqual(tree_set.remove_range(low, high),
+                                 len(values) - len(expected))
+                self.assertEqual(list(tree_set), expected)
+                self.assertEqual(tree_set.fingerprint(),
+                                 TreeSet(int, expected).fingerprint())
+                self.assertEqual(tree_set.rank(high), sum(
+                    value < high for value in expected))
+
+    def test_frozen(self):
+        """Test a FrozenTreeSet cannot remove ranges"""
+        frozen = self.tree_sets[0].freeze()
+        self.assertRaises(UnsupportedOperationException, frozen.remove_range,
+                          1, 5)
+        self.assertRaises(UnsupportedOperationException, frozen.drain_until,
+                          5)
+
+
+if __name__ == '__main__':
+    unittest.main()
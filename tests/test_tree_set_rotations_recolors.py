@@ -179,6 +179,16 @@ class TestsTreeSetRotationsAndRecolors(unittest.TestCase):
         self.assertEqual(self.tree._RedBlackTree__root.right.color,
                          RedBlackTree._BLACK)
 
+    def test_case_7_mirrored_remove_int(self):
+        """Test Case 7 mirrored: the sibling is a left child whose furthest nephew is red."""
+        self.tree.add_all([10, 5, 15, 3])
+        self.tree.remove(15)
+        self.assertEqual(self.tree._RedBlackTree__root.value, 5)
+        tree_colors = self.tree._RedBlackTree__array_color()
+        real_colors = [RedBlackTree._BLACK, RedBlackTree._BLACK,
+                       RedBlackTree._BLACK]
+        self.assertEqual(tree_colors, real_colors)
+
 
 if __name__ == '__main__':
     unittest.main()
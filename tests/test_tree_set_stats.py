@@ -0,0 +1,115 @@
+"""Module which provides a test class for the TreeSet statistics."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import RedBlackTree, TreeSet
+from model.utils.data_utils import TreeNode
+
+
+class TestTreeSetStats(unittest.TestCase):
+    """Test the counters of the internal operations of the TreeSet."""
+
+    def setUp(self):
+        """Set up a TreeSet with enabled statistics"""
+        self.tree_set = TreeSet(int, [1, 2, 3])
+        self.tree_set.enable_stats()
+
+    def test_disabled(self):
+        """Test statistics are disabled by default"""
+        tree_set = TreeSet(int, [1, 2, 3])
+        self.assertIs(type(tree_set), TreeSet)
+        self.assertRaises(IllegalStateException, tree_set.stats)
+        self.assertRaises(IllegalStateException, tree_set.reset_stats)
+        tree_set.disable_stats()
+        self.assertRaises(UnsupportedOperationException,
+                          TreeSet(int, backend="blocked").enable_stats)
+
+    def test_insertions(self):
+        """Test the counters of the insertions"""
+        self.tree_set.add(4)
+        self.tree_set.add(5)
+        stats = self.tree_set.stats()
+        self.assertEqual(stats["allocations"], 2)
+        self.assertEqual(stats["left_rotations"], 1)
+        self.assertEqual(stats["right_rotations"], 0)
+        self.assertEqual(stats["node_visits"], 5)
+        self.assertGreaterEqual(stats["comparisons"], 10)
+        self.assertGreater(stats["recolors"], 0)
+        self.assertFalse(self.tree_set.add(5))
+        self.assertEqual(self.tree_set.stats()["allocations"], 2)
+
+    def test_navigation(self):
+        """Test the counters of the navigation methods"""
+        self.assertEqual(self.tree_set.higher(1), 2)
+        self.assertEqual(self.tree_set.stats(reset=True),
+                         {"comparisons": 2, "node_visits": 2,
+                          "left_rotations": 0, "right_rotations": 0,
+                          "recolors": 0, "allocations": 0})
+        self.assertEqual(self.tree_set.floor(2), 2)
+        self.assertEqual(self.tree_set.stats()["comparisons"], 1)
+        self.assertTrue(self.tree_set.contains(3))
+        self.assertEqual(self.tree_set.stats()["node_visits"], 3)
+
+    def test_reset(self):
+        """Test resetting the counters"""
+        self.tree_set.add(10)
+        self.tree_set.reset_stats()
+        self.assertEqual(set(self.tree_set.stats().values()), {0})
+
+    def test_disable(self):
+        """Test disabling the statistics restores the tree"""
+        self.tree_set.add(10)
+        self.tree_set.disable_stats()
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertRaises(IllegalStateException, self.tree_set.stats)
+        self.tree_set.add(11)
+        self.assertEqual(list(self.tree_set), [1, 2, 3, 10, 11])
+        self.assertIs(type(self.tree_set._RedBlackTree__contains(11)),
+                      TreeNode)
+
+        self.tree_set.enable_stats()
+        self.tree_set.enable_stats()
+        self.tree_set.remove(1)
+        self.assertEqual(self.tree_set.stats()["allocations"], 0)
+        self.assertEqual(list(self.tree_set), [2, 3, 10, 11])
+
+    def test_independent_counters(self):
+        """Test every tree has its own counters"""
+        other = TreeSet(int)
+        other.enable_stats()
+        other.add(1)
+        self.assertEqual(self.tree_set.stats()["allocations"], 0)
+        self.assertEqual(other.stats()["allocations"], 1)
+
+    def test_red_black_tree(self):
+        """Test the statistics of a RedBlackTree"""
+        tree = RedBlackTree(int)
+        tree.enable_stats()
+        for value in range(7):
+            tree.add(value)
+        self.assertEqual(tree.stats()["allocations"], 7)
+        self.assertEqual(tree.stats()["left_rotations"], 3)
+        self.assertFalse(hasattr(tree, "higher"))
+
+    def test_random_operations(self):
+        """Test the instrumented tree behaves as the original one"""
+        rng = random.Random(7)
+        plain = TreeSet(int, [1, 2, 3])
+        for _ in range(2000):
+            value = rng.randrange(300)
+            if rng.random() < 0.6:
+                self.assertEqual(self.tree_set.add(value), plain.add(value))
+            else:
+                self.assertEqual(self.tree_set.remove(value),
+                                 plain.remove(value))
+            self.assertEqual(self.tree_set.ceiling(value), plain.ceiling(value))
+            self.assertEqual(self.tree_set.lower(value), plain.lower(value))
+        self.assertEqual(list(self.tree_set), list(plain))
+        stats = self.tree_set.stats()
+        self.assertGreater(stats["left_rotations"], 0)
+        self.assertGreater(stats["right_rotations"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
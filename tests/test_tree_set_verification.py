@@ -0,0 +1,129 @@
+"""Module which provides a test class for the TreeSet shape diagnostics."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.tree_set import BlockedTreeSet, RedBlackTree, TreeSet
+
+
+class TestTreeSetVerification(unittest.TestCase):
+    """Test the height, shape statistics and invariant verifier."""
+
+    def setUp(self):
+        """Set up a TreeSet with seven elements"""
+        self.tree_set = TreeSet(int, [1, 2, 3, 4, 5, 6, 7])
+
+    def test_empty(self):
+        """Test the diagnostics of an empty TreeSet"""
+        tree_set = TreeSet(int)
+        self.assertEqual(tree_set.height(), 0)
+        self.assertEqual(tree_set.black_height(), 0)
+        self.assertEqual(tree_set.shape_stats()["depth_histogram"], [])
+        self.assertTrue(tree_set.verify())
+        self.assertTrue(tree_set.verify(paths=3))
+
+    def test_shape(self):
+        """Test the height and shape statistics"""
+        self.assertEqual(self.tree_set.height(), 4)
+        self.assertEqual(self.tree_set.black_height(), 2)
+        stats = self.tree_set.shape_stats()
+        self.assertEqual(stats["size"], 7)
+        self.assertEqual(stats["min_height"], 3)
+        self.assertEqual(stats["depth_histogram"], [1, 2, 2, 2])
+        self.assertAlmostEqual(stats["average_path_length"], 12 / 7)
+
+    def test_valid(self):
+        """Test random valid trees are verified"""
+        rng = random.Random(3)
+        tree_set = TreeSet(int)
+        for _ in range(3000):
+            value = rng.randrange(400)
+            if rng.random() < 0.6:
+                tree_set.add(value)
+            else:
+                tree_set.remove(value)
+        self.assertTrue(tree_set.verify())
+        self.assertTrue(tree_set.verify(paths=10))
+        self.assertLessEqual(tree_set.height(),
+                             2 * tree_set.shape_stats()["min_height"])
+        self.assertRaises(ValueError, tree_set.verify, 0)
+
+    def test_violations(self):
+        """Test every kind of broken invariant is detected"""
+        root = self.tree_set._RedBlackTree__root
+
+        root.color = TreeSet._RED
+        self.assertRaisesRegex(IllegalStateException, "red root",
+                               self.tree_set.verify)
+        root.color = TreeSet._BLACK
+
+        root.left.value, root.right.value = root.right.value, root.left.value
+        self.assertRaisesRegex(IllegalStateException, "order",
+                               self.tree_set.verify)
+        root.left.value, root.right.value = root.right.value, root.left.value
+
+        root.right.parent = root.left
+        self.assertRaisesRegex(IllegalStateException, "parent",
+                               self.tree_set.verify)
+        root.right.parent = root
+
+        root.left.color = TreeSet._RED
+        self.assertRaisesRegex(IllegalStateException, "black heights",
+                               self.tree_set.verify)
+        root.left.color = TreeSet._BLACK
+
+        red = self.tree_set._RedBlackTree__contains(4)
+        red.right.color = TreeSet._RED
+        self.assertRaisesRegex(IllegalStateException, "red child",
+                               self.tree_set.verify)
+        red.right.color = TreeSet._BLACK
+
+        self.tree_set._RedBlackTree__size = 8
+        self.assertRaisesRegex(IllegalStateException, "size",
+                               self.tree_set.verify)
+        self.tree_set._RedBlackTree__size = 7
+        self.assertTrue(self.tree_set.verify())
+
+    def test_debug_mode(self):
+        """Test the debug mode verifies the modifications"""
+        self.tree_set.enable_verification()
+        self.tree_set.add(8)
+        self.tree_set._RedBlackTree__size = 100
+        self.assertRaises(IllegalStateException, self.tree_set.add, 9)
+        self.assertRaises(IllegalStateException, self.tree_set.poll_first)
+        self.assertFalse(self.tree_set.remove(100))
+
+        self.tree_set.enable_verification(rate=0)
+        self.assertTrue(self.tree_set.add(10))
+        self.assertRaises(ValueError, self.tree_set.enable_verification, 2)
+
+        self.tree_set.disable_verification()
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertTrue(self.tree_set.add(11))
+
+        tree = RedBlackTree(int)
+        tree.enable_verification(paths=2)
+        for value in range(50):
+            tree.add(value)
+        self.assertTrue(tree.verify())
+
+    def test_blocked(self):
+        """Test the diagnostics of the blocked backend"""
+        tree_set = BlockedTreeSet(int, load=4)
+        tree_set.enable_verification()
+        for value in range(100):
+            tree_set.add(value)
+        for value in range(0, 100, 3):
+            tree_set.remove(value)
+        self.assertTrue(tree_set.verify(paths=3))
+        self.assertEqual(sum(tree_set.shape_stats()["block_sizes"]), 66)
+        self.assertRaises(UnsupportedOperationException, tree_set.height)
+        self.assertRaises(UnsupportedOperationException,
+                          tree_set.black_height)
+
+        tree_set._BlockedTreeSet__blocks[0].reverse()
+        self.assertRaises(IllegalStateException, tree_set.verify)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Module which provides a test class for the TreeSet write buffer."""
+
+import random
+import unittest
+from model.exceptions.tree_set_exceptions import *
+from model.interval_tree_set import IntervalTreeSet
+from model.tree_set import TreeSet
+
+
+class TestTreeSetWriteBuffer(unittest.TestCase):
+    """Test the buffered insertions and their merge into the TreeSet."""
+
+    def setUp(self):
+        """Set up a buffered TreeSet with the even numbers lower than 100"""
+        self.tree_set = TreeSet(int, list(range(0, 100, 2)))
+        self.tree_set.enable_write_buffer(10)
+
+    def test_buffered_contains(self):
+        """Test buffered values are found before being merged"""
+        for value in (1, 3, 4):
+            self.assertTrue(self.tree_set.add(value))
+        self.assertEqual(self.tree_set.buffered(), 3)
+        self.assertTrue(self.tree_set.contains(3))
+        self.assertIn(4, self.tree_set)
+        self.assertNotIn(5, self.tree_set)
+        self.assertEqual(self.tree_set.buffered(), 3)
+        self.assertRaises(NullPointerException, self.tree_set.add, None)
+        self.assertRaises(TypeError, self.tree_set.add, "1")
+
+    def test_flush_on_read(self):
+        """Test reads merge the buffer first"""
+        for value in (1, 3, 4, 1):
+            self.tree_set.add(value)
+        self.assertEqual(self.tree_set.higher(2), 3)
+        self.assertEqual(self.tree_set.buffered(), 0)
+        self.assertEqual(self.tree_set.size(), 52)
+        self.tree_set.add(-1)
+        self.assertEqual(self.tree_set.first(), -1)
+        self.tree_set.add(1001)
+        self.assertEqual(list(self.tree_set)[-2:], [98, 1001])
+        self.assertTrue(self.tree_set.verify())
+
+    def test_threshold(self):
+        """Test the buffer is merged when it is full"""
+        for value in range(101, 121):
+            self.tree_set.add(value)
+        self.assertEqual(self.tree_set.buffered(), 0)
+        self.tree_set.add(200)
+        self.assertEqual(self.tree_set.buffered(), 1)
+        self.tree_set.enable_write_buffer(1)
+        self.assertEqual(self.tree_set.buffered(), 0)
+        self.assertRaises(ValueError, self.tree_set.enable_write_buffer, 0)
+
+    def test_flush(self):
+        """Test flush returns the number of new values"""
+        for value in (0, 1, 2, 3):
+            self.tree_set.add(value)
+        self.assertEqual(self.tree_set.flush(), 2)
+        self.assertEqual(self.tree_set.flush(), 0)
+        self.assertEqual(TreeSet(int).flush(), 0)
+
+    def test_clear(self):
+        """Test clear discards the buffered values"""
+        self.tree_set.add(1)
+        self.tree_set.clear()
+        self.assertEqual(self.tree_set.buffered(), 0)
+        self.assertNotIn(1, self.tree_set)
+        self.assertTrue(self.tree_set.is_empty())
+
+    def test_unhashable_values(self):
+        """Test unhashable values are buffered in a list"""
+        tree_set = TreeSet(list, [[2]])
+        tree_set.enable_write_buffer()
+        for value in ([3], [1], [2], [1]):
+            tree_set.add(value)
+        self.assertEqual(tree_set.buffered(), 4)
+        self.assertIn([1], tree_set)
+        self.assertEqual(tree_set.buffered(), 0)
+        self.assertEqual(list(tree_set), [[1], [2], [3]])
+
+    def test_disable(self):
+        """Test disabling the buffer merges it and restores the class"""
+        self.tree_set.add(1)
+        self.tree_set.disable_write_buffer()
+        self.assertIs(type(self.tree_set), TreeSet)
+        self.assertIn(1, self.tree_set)
+        self.assertTrue(self.tree_set.add(3))
+        self.assertFalse(self.tree_set.add(3))
+
+    def test_features(self):
+        """Test the buffer is merged before the other features read"""
+        self.tree_set.enable_stats()
+        self.tree_set.enable_verification()
+        self.tree_set.add(1)
+        self.assertEqual(self.tree_set.floor(1), 1)
+        self.assertEqual(self.tree_set.sum_range(0, 4), 7)
+        self.tree_set.add(3)
+        self.assertEqual(self.tree_set.aggregate(TreeSet.RANGE_SUM, 0, 4), 10)
+
+    def test_unsupported(self):
+        """Test frozen sets and interval sets have no write buffer"""
+        self.assertRaises(UnsupportedOperationException,
+                          self.tree_set.freeze().enable_write_buffer)
+        self.assertRaises(UnsupportedOperationException,
+                          IntervalTreeSet().enable_write_buffer)
+
+    def test_random(self):
+        """Test random operations against a set on both backends"""
+        random.seed(46)
+        for backend in TreeSet.BACKENDS:
+            tree_set = TreeSet(int, backend=backend)
+            tree_set.enable_write_buffer(random.randint(1, 50))
+            expected = set()
+            for _ in range(2000):
+                value = random.randint(0, 300)
+                operation = random.random()
+                if operation < 0.6:
+                    tree_set.add(value)
+                    expected.add(value)
+                elif operation < 0.8:
+                    self.assertEqual(value in tree_set, value in expected)
+                else:
+                    self.assertEqual(tree_set.remove(value),
+                                     value in expected)
+                    expected.discard(value)
+            self.assertEqual(list(tree_set), sorted(expected))
+            self.assertTrue(tree_set.verify())
+
+
+if __name__ == '__main__':
+    unittest.main()